@@ -0,0 +1,62 @@
+// Replays a merged step-event schedule generated by
+//   buddy-convert data/motion --format schedule --dof linX --dof rotX
+// Copy the generated <take>_events.h next to this sketch as schedule.h.
+//
+// Every event: wait `wait` ticks (measured from the previous event's deadline,
+// so timing never drifts), set the DIR pins, then pulse the STEP pins whose
+// bits are set. schedule.h names the bit of every axis (SCHEDULE_BIT_linX,
+// ...), so one-axis exports drive the right pins.
+// This sketch polls micros(), so the tick is a whole number of microseconds
+// (the default 4 us matches the micros() resolution on a 16 MHz board).
+
+#include "schedule.h"
+
+#if defined(SCHEDULE_BIT_linX) + defined(SCHEDULE_BIT_rotX) != SCHEDULE_AXES
+#error "schedule.h has an axis without pins in this sketch: export linX and/or rotX"
+#endif
+
+uint8_t stepPins[SCHEDULE_AXES];   // by schedule bit
+uint8_t dirPins[SCHEDULE_AXES];
+
+void setup() {
+  // same pins as dual_motor
+#ifdef SCHEDULE_BIT_linX
+  stepPins[SCHEDULE_BIT_linX] = 6;
+  dirPins[SCHEDULE_BIT_linX] = 5;
+#endif
+#ifdef SCHEDULE_BIT_rotX
+  stepPins[SCHEDULE_BIT_rotX] = 3;
+  dirPins[SCHEDULE_BIT_rotX] = 2;
+#endif
+  for (int a = 0; a < SCHEDULE_AXES; a++) {
+    pinMode(stepPins[a], OUTPUT);
+    pinMode(dirPins[a], OUTPUT);
+  }
+}
+
+void loop() {
+  unsigned long deadline = micros();
+
+  for (uint32_t i = 0; i < scheduleLength; i++) {
+    uint16_t wait = pgm_read_word(&stepEvents[i].wait);
+    uint8_t step = pgm_read_byte(&stepEvents[i].step);
+    uint8_t dir = pgm_read_byte(&stepEvents[i].dir);
+
+    deadline += (unsigned long)wait * SCHEDULE_TICK_US;   // 32-bit: waits go up to 65535 ticks
+    while ((long)(micros() - deadline) < 0);
+
+    if (step == 0) continue;   // filler event for a long wait
+    for (int a = 0; a < SCHEDULE_AXES; a++) {
+      digitalWrite(dirPins[a], (dir >> a) & 1 ? HIGH : LOW);
+    }
+    for (int a = 0; a < SCHEDULE_AXES; a++) {
+      if ((step >> a) & 1) digitalWrite(stepPins[a], HIGH);
+    }
+    delayMicroseconds(2);  // Small pulse width
+    for (int a = 0; a < SCHEDULE_AXES; a++) {
+      if ((step >> a) & 1) digitalWrite(stepPins[a], LOW);
+    }
+  }
+
+  while (true); // Stop after completing motion
+}
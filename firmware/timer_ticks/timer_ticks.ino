@@ -0,0 +1,117 @@
+// Plays a timer-tick profile generated by
+//   buddy-convert data/motion --format ticks --tick-us 4 --dof linX --dof rotX
+// Copy the generated <take>_ticks.h next to this sketch as ticks.h.
+//
+// Timer1 free-runs at one count per tick and each axis owns a compare channel
+// (A for the first table of ticks.h, B for the second). ticks.h names the
+// table of every axis (TICK_AXIS_linX, ...), so pins follow the name. The compare
+// ISR steps its axis and moves its compare register on by the next delay, so
+// the steps land on exact tick deadlines whatever loop() is doing. Delays are
+// uint16, the width of the timer: the wrap-around of OCR1x += delay is exact.
+// Keep the shortest delay above the ISR time (~10 us): with --tick-us 0.5 a
+// delay of a few ticks fires late, and a compare once missed waits a full
+// timer period.
+
+#include "ticks.h"
+
+#if TICK_AXES > 2
+#error "Timer1 has two compare channels: export at most two axes"
+#endif
+#if TICK_DELAY_BITS != 16
+#error "Timer1 is 16 bits: export the delays with 16-bit width"
+#endif
+#ifndef TICK_PRESCALER
+#error "--tick-us must be a Timer1 tick at 16 MHz (0.0625, 0.5, 4, 16 or 64)"
+#endif
+#if defined(TICK_AXIS_linX) + defined(TICK_AXIS_rotX) != TICK_AXES
+#error "ticks.h has an axis without pins in this sketch: export linX and/or rotX"
+#endif
+
+uint8_t stepPins[2];   // by table (= compare channel)
+uint8_t dirPins[2];
+
+struct Axis { uint16_t record; uint16_t left; };
+volatile Axis axes[2];
+volatile uint8_t running = 0;
+
+// Loads the next record of `a` with steps left; false when the table is done.
+// Waits (steps == 0) count as one step that pulses nothing.
+bool nextRecord(uint8_t a, int16_t &steps, uint16_t &delay) {
+  if (axes[a].record >= tickLengths[a]) return false;
+  steps = (int16_t)pgm_read_word(&tickSteps[a][axes[a].record]);
+  delay = pgm_read_word(&tickDelays[a][axes[a].record]);
+  axes[a].record++;
+  axes[a].left = steps == 0 ? 1 : abs(steps);
+  if (steps != 0) digitalWrite(dirPins[a], steps > 0 ? HIGH : LOW);
+  return true;
+}
+
+int16_t currentSteps[2];
+uint16_t currentDelay[2];
+
+inline void advance(uint8_t a, volatile uint16_t &ocr, uint8_t enableBit) {
+  if (currentSteps[a] != 0) {
+    digitalWrite(stepPins[a], HIGH);
+    delayMicroseconds(2);  // Small pulse width
+    digitalWrite(stepPins[a], LOW);
+  }
+  if (--axes[a].left == 0 && !nextRecord(a, currentSteps[a], currentDelay[a])) {
+    TIMSK1 &= ~_BV(enableBit);
+    running &= ~(1 << a);
+    return;
+  }
+  ocr += currentDelay[a];
+}
+
+ISR(TIMER1_COMPA_vect) { advance(0, OCR1A, OCIE1A); }
+#if TICK_AXES > 1
+ISR(TIMER1_COMPB_vect) { advance(1, OCR1B, OCIE1B); }
+#endif
+
+void setup() {
+  // same pins as dual_motor
+#ifdef TICK_AXIS_linX
+  stepPins[TICK_AXIS_linX] = 6;
+  dirPins[TICK_AXIS_linX] = 5;
+#endif
+#ifdef TICK_AXIS_rotX
+  stepPins[TICK_AXIS_rotX] = 3;
+  dirPins[TICK_AXIS_rotX] = 2;
+#endif
+  for (int a = 0; a < TICK_AXES; a++) {
+    pinMode(stepPins[a], OUTPUT);
+    pinMode(dirPins[a], OUTPUT);
+  }
+
+  noInterrupts();
+  TCCR1A = 0;               // normal mode: TCNT1 counts 0..65535 and wraps
+  TCCR1B = 0;
+  TCNT1 = 0;
+  for (uint8_t a = 0; a < TICK_AXES; a++) {
+    axes[a].record = 0;
+    if (!nextRecord(a, currentSteps[a], currentDelay[a])) continue;
+    running |= 1 << a;
+    if (a == 0) { OCR1A = currentDelay[0]; TIMSK1 |= _BV(OCIE1A); }
+    else        { OCR1B = currentDelay[1]; TIMSK1 |= _BV(OCIE1B); }
+  }
+  TIFR1 = _BV(OCF1A) | _BV(OCF1B);
+#if TICK_PRESCALER == 1
+  TCCR1B = _BV(CS10);
+#elif TICK_PRESCALER == 8
+  TCCR1B = _BV(CS11);
+#elif TICK_PRESCALER == 64
+  TCCR1B = _BV(CS11) | _BV(CS10);
+#elif TICK_PRESCALER == 256
+  TCCR1B = _BV(CS12);
+#else
+  TCCR1B = _BV(CS12) | _BV(CS10);
+#endif
+  interrupts();
+}
+
+void loop() {
+  if (running == 0) {
+    TCCR1B = 0;   // Stop after completing motion
+    while (true);
+  }
+}
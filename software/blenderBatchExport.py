@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:48:26 2026
+
+@author: benjaminokoronkwo
+
+Headless batch export of many .blend files to motion CSVs.
+
+Launches a bounded pool of `blender --background` processes, each running
+blenderdataexport.py on one .blend, and writes <blend name>.csv into
+data/motion. Files whose mtime has not changed since their last successful
+export (recorded in data/motion/.blend_exports.json) are skipped.
+
+Usage (plain Python or from inside Blender):
+    python blenderBatchExport.py blender/*.blend --object Camera -j 3
+    blender --background --python blenderBatchExport.py -- blender/*.blend --frames 1 250
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPORT_SCRIPT = os.path.join(SCRIPT_DIR, "blenderdataexport.py")
+DEFAULT_OUTPUT_FOLDER = os.path.join(SCRIPT_DIR, "..", "data", "motion")
+MANIFEST_NAME = ".blend_exports.json"
+
+
+def default_blender():
+    """The running Blender binary when launched through Blender, else `blender` on PATH."""
+    try:
+        import bpy
+        return bpy.app.binary_path
+    except ImportError:
+        return os.environ.get("BLENDER", "blender")
+
+
+def load_manifest(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(path, manifest):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def export_blend(blender, blend_path, csv_path, object_name, frames, mode):
+    """Runs one background Blender export; returns (returncode, seconds, log tail)."""
+    cmd = [blender, "--background", blend_path,
+           "--python-exit-code", "1",
+           "--python", EXPORT_SCRIPT, "--",
+           "--object", object_name, "--output", csv_path, "--mode", mode]
+    if frames:
+        cmd += ["--frames", str(frames[0]), str(frames[1])]
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    tail = "\n".join(proc.stdout.strip().splitlines()[-5:])
+    return proc.returncode, time.perf_counter() - start, tail
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="blenderBatchExport.py",
+        description="Export camera motion from many .blend files with background Blender.")
+    parser.add_argument("blend_files", nargs="+")
+    parser.add_argument("--object", default="Camera", help="object to export (default: Camera)")
+    parser.add_argument("--frames", type=int, nargs=2, metavar=("START", "END"),
+                        help="inclusive frame range (default: each scene's range)")
+    parser.add_argument("--output-folder", default=DEFAULT_OUTPUT_FOLDER,
+                        help="where CSVs are written (default: data/motion)")
+    parser.add_argument("-j", "--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="parallel Blender processes (default: half the CPUs)")
+    parser.add_argument("--blender", default=default_blender(), help="Blender executable")
+    parser.add_argument("--mode", default="auto", choices=("auto", "fcurves", "frame_set"))
+    parser.add_argument("--force", action="store_true", help="export even if unchanged")
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    args = build_parser().parse_args(argv)
+
+    output_folder = os.path.abspath(args.output_folder)
+    os.makedirs(output_folder, exist_ok=True)
+    manifest_path = os.path.join(output_folder, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+
+    jobs = []
+    failed = 0
+    for blend in args.blend_files:
+        blend = os.path.abspath(blend)
+        if not os.path.isfile(blend):
+            print(f"missing  {blend}", file=sys.stderr)
+            failed += 1
+            continue
+        csv_path = os.path.join(output_folder,
+                                os.path.splitext(os.path.basename(blend))[0] + ".csv")
+        mtime = os.path.getmtime(blend)
+        entry = manifest.get(blend, {})
+        up_to_date = (entry.get("mtime") == mtime and entry.get("object") == args.object
+                      and entry.get("frames") == args.frames and os.path.exists(csv_path))
+        if up_to_date and not args.force:
+            print(f"skipped  {os.path.basename(blend)} (unchanged)")
+            continue
+        jobs.append((blend, csv_path, mtime))
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(export_blend, args.blender, blend, csv_path,
+                               args.object, args.frames, args.mode): (blend, csv_path, mtime)
+                   for blend, csv_path, mtime in jobs}
+        for future in as_completed(futures):
+            blend, csv_path, mtime = futures[future]
+            try:
+                code, elapsed, tail = future.result()
+            except OSError as exc:  # e.g. Blender executable not found
+                code, elapsed, tail = -1, 0.0, str(exc)
+            if code == 0:
+                manifest[blend] = {"mtime": mtime, "object": args.object,
+                                   "frames": args.frames, "csv": csv_path}
+                print(f"exported {os.path.basename(blend)} → {os.path.basename(csv_path)} "
+                      f"({elapsed:.1f} s)")
+            else:
+                failed += 1
+                print(f"FAILED   {os.path.basename(blend)} (exit {code})\n{tail}", file=sys.stderr)
+
+    save_manifest(manifest_path, manifest)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""
+BUDDY motion converter: Blender motion CSVs → Arduino step/delay profiles.
+
+Every tool is a module of this package with its own command line, run as
+`python -m buddy.<module>` (e.g. buddy.buddyConvert, buddy.profileDiff)
+from software/new_structure or anywhere after `pip install -e`.
+"""
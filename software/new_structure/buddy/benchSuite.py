@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 08:47:30 2026
+
+@author: benjaminokoronkwo
+
+Conversion benchmark suite.
+
+Runs every stage of the converter over the recorded takes (data/motion,
+data/testing/captured) and over synthetic takes of 10^4 .. 10^7 frames, and
+records per stage and input:
+
+    seconds        best of `repeats` runs
+    frames_per_s   input frames / seconds
+    peak_mb        peak Python + NumPy allocation (tracemalloc, separate run)
+
+Stages: CSV ingest, sine easing, S-curve planning, step quantization,
+delta / delay computation, txt / .bdyp export, the linMotion / rotMotion
+wrappers, whole conversions (blenderToArduino.convert_take), and the
+software/old_structure dataconverter scripts they replaced: each script's
+own main() with its input and output paths pointed at the take and a
+scratch folder (and the diagnostics plot switched off).
+
+Results are saved as JSON (with commit, Python and NumPy versions);
+--compare prints the per-stage ratio against an earlier run.
+
+Usage:
+    python -m buddy.benchSuite -o /tmp/bench.json
+    python -m buddy.benchSuite --quick --compare /tmp/bench.json
+"""
+
+import argparse
+import functools
+import glob
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from . import blenderToArduino
+from . import motionEngine
+from .buddyConvert import REPO_ROOT, checkout_path
+from .csvIngest import read_columns
+from .linMotion import linMotion
+from .profileFormat import write_profile_binary
+from .rotMotion import rotMotion
+from .scurvePlanner import plan_scurve
+
+CORPUS_GLOBS = ("motion/*.csv", "testing/captured/*.csv")     # under the checkout's data/
+SYNTHETIC_SIZES = (10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+QUICK_SIZES = (10 ** 4, 10 ** 5)
+PLANNER_MAX_FRAMES = 10 ** 6    # several passes over every segment: larger takes take minutes
+OLD_SCRIPT_MAX_FRAMES = 10 ** 6    # Python loops over every row
+# rotation_smoothing only reads the first 126 rows; dataconverter_nosmoothing
+# writes into the working directory and is not run
+OLD_SCRIPTS = ("dataconverter_tilt_x-axis", "dataconverter_linear_smoothing",
+               "dataconverter_rotation_smoothing")
+CSV_COLUMNS = ("Time (s)", "X (m)", "RotX (deg)")
+
+
+# === 1. INPUTS ===
+def synthetic_take(n, fps=24.0):
+    """n frames of a slide + tilt move with several keyframed reversals."""
+    times = np.arange(n) / fps
+    lin = 0.3 * np.sin(times / 7) + 0.02 * np.sin(times * 1.3)
+    rot = 90 + 40 * np.sin(times / 5) + 5 * np.sin(times * 0.9)
+    return times, lin, rot
+
+
+def write_take_csv(path, times, lin, rot, chunk=10 ** 6):
+    """Writes a take in the Blender export layout."""
+    with open(path, "w") as f:
+        f.write(",".join(CSV_COLUMNS) + "\n")
+        for start in range(0, len(times), chunk):
+            block = np.column_stack((times[start:start + chunk], lin[start:start + chunk],
+                                     rot[start:start + chunk]))
+            np.savetxt(f, block, fmt="%.6f", delimiter=",")
+
+
+def corpus_paths():
+    data = checkout_path("data")
+    paths = []
+    for pattern in CORPUS_GLOBS:
+        paths.extend(sorted(glob.glob(os.path.join(data, pattern))))
+    return paths
+
+
+# === 2. MEASUREMENT ===
+def measure(fn, repeats=3, memory=True):
+    """Best wall time of `repeats` calls, and the peak allocation of one more call (MB)."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+    return best, peak_mb
+
+
+def take_stages(times, lin, rot, scratch):
+    """(stage, callable) pairs for one in-memory take."""
+    lin_steps = motionEngine.m_to_steps(motionEngine.sine_ease(lin, motionEngine.LIN_EASE_THRESHOLD_M))
+    rot_steps = motionEngine.deg_to_steps(motionEngine.sine_ease(rot, motionEngine.ROT_EASE_THRESHOLD_DEG))
+    results = {"linX": motionEngine.steps_to_segments(lin_steps, times),
+               "rotX": motionEngine.steps_to_segments(rot_steps, times)}
+    stages = [
+        ("ease", lambda: (motionEngine.sine_ease(lin, motionEngine.LIN_EASE_THRESHOLD_M),
+                          motionEngine.sine_ease(rot, motionEngine.ROT_EASE_THRESHOLD_DEG))),
+        ("quantize", lambda: (motionEngine.m_to_steps(lin), motionEngine.deg_to_steps(rot))),
+        ("segments", lambda: (motionEngine.steps_to_segments(lin_steps, times),
+                              motionEngine.steps_to_segments(rot_steps, times))),
+        ("linMotion", lambda: linMotion(lin, times)),
+        ("rotMotion", lambda: rotMotion(rot, times)),
+        ("export_txt", lambda: blenderToArduino.write_profile(os.path.join(scratch, "p.txt"), results)),
+        ("export_bdyp", lambda: write_profile_binary(os.path.join(scratch, "p.bdyp"), results)),
+    ]
+    if len(times) <= PLANNER_MAX_FRAMES:
+        positions = np.column_stack((lin, motionEngine.unwrap_degrees(rot)))
+        limits = [np.array([blenderToArduino.scurve_limits[d][i] for d in ("linX", "rotX")])
+                  for i in range(3)]
+        stages.append(("plan_scurve", lambda: plan_scurve(times, positions, *limits)))
+    return stages
+
+
+@functools.lru_cache(maxsize=None)
+def load_old_script(name):
+    """Imports a software/old_structure script (main() is not run)."""
+    path = os.path.join(checkout_path("software", "old_structure"), name + ".py")
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def old_script_stage(name, csv_path, scratch):
+    """Runs the old script's main() on `csv_path`, writing into `scratch`."""
+    module = load_old_script(name)
+
+    def run():
+        module.filepath = csv_path
+        module.output_folder = scratch
+        module.output_path = os.path.join(scratch, "old_structure.txt")
+        module.plot_diagnostics = lambda *args: None
+        module.main()
+    return run
+
+
+def file_stages(csv_path, scratch, frames):
+    """(stage, callable) pairs that start from a CSV on disk."""
+    stages = [
+        ("ingest", lambda: read_columns(csv_path, list(CSV_COLUMNS))),
+        ("convert_take", lambda: blenderToArduino.convert_take(csv_path, scratch)),
+    ]
+    if frames <= OLD_SCRIPT_MAX_FRAMES:
+        stages.extend(("old:" + name[len("dataconverter_"):], old_script_stage(name, csv_path, scratch))
+                      for name in OLD_SCRIPTS)
+    return stages
+
+
+def run_suite(sizes=SYNTHETIC_SIZES, repeats=3, memory=True, log=print):
+    """Runs every stage on the corpus and the synthetic takes; returns the result rows."""
+    rows = []
+    quiet = open(os.devnull, "w")
+
+    def record(stage, label, frames, fn):
+        stdout, sys.stdout = sys.stdout, quiet    # the old scripts print progress
+        try:
+            seconds, peak_mb = measure(fn, repeats, memory)
+        finally:
+            sys.stdout = stdout
+        row = {"stage": stage, "input": label, "frames": frames, "seconds": seconds,
+               "frames_per_s": frames / seconds if seconds > 0 else None, "peak_mb": peak_mb}
+        rows.append(row)
+        log(f"{stage:>22}  {label:<32} {frames:>9}  {seconds * 1000:10.2f} ms"
+            + (f"  {peak_mb:8.1f} MB" if peak_mb is not None else ""))
+
+    with tempfile.TemporaryDirectory(prefix="buddy-bench-") as scratch:
+        inputs = []
+        for path in corpus_paths():
+            inputs.append((os.path.relpath(path, REPO_ROOT), path))
+        for n in sizes:
+            path = os.path.join(scratch, f"synthetic_{n}.csv")
+            write_take_csv(path, *synthetic_take(n))
+            inputs.append((f"synthetic_{n}", path))
+
+        for label, path in inputs:
+            times, lin, rot = blenderToArduino.load_take(path)
+            for stage, fn in file_stages(path, scratch, len(times)):
+                record(stage, label, len(times), fn)
+            for stage, fn in take_stages(times, lin, rot, scratch):
+                record(stage, label, len(times), fn)
+            if label.startswith("synthetic_"):
+                os.remove(path)
+    quiet.close()
+    return rows
+
+
+# === 3. RESULTS ===
+def _git_commit():
+    try:
+        return subprocess.run(["git", "-C", REPO_ROOT, "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(path, rows):
+    report = {
+        "commit": _git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": rows,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1)
+    return report
+
+
+def compare(old_path, rows, threshold=1.2):
+    """Prints new / old time per (stage, input); returns the rows slower than `threshold`."""
+    with open(old_path, "r") as f:
+        old = json.load(f)
+    before = {(r["stage"], r["input"]): r for r in old["results"]}
+    slower = []
+    print(f"\nvs {old_path} (commit {old.get('commit')}):")
+    for row in rows:
+        prev = before.get((row["stage"], row["input"]))
+        if prev is None or not prev["seconds"]:
+            continue
+        ratio = row["seconds"] / prev["seconds"]
+        flag = "  SLOWER" if ratio > threshold else ""
+        print(f"{row['stage']:>22}  {row['input']:<32} {ratio:6.2f}x{flag}")
+        if ratio > threshold:
+            slower.append((row, ratio))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every conversion stage.")
+    parser.add_argument("-o", "--output", default="bench_results.json",
+                        help="JSON file to write (default: %(default)s)")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"synthetic takes up to {QUICK_SIZES[-1]} frames only")
+    parser.add_argument("--sizes", type=lambda s: [int(float(x)) for x in s.split(",")],
+                        help="comma-separated synthetic take sizes, e.g. 1e4,1e6")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc runs")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SYNTHETIC_SIZES)
+    try:
+        rows = run_suite(sizes, args.repeats, not args.no_memory)
+    except ValueError as exc:
+        parser.error(f"{exc}; the benchmark corpus is the checkout's recorded takes")
+    save_results(args.output, rows)
+    print(f"\n{len(rows)} measurements → {args.output}")
+    if args.compare:
+        return 1 if compare(args.compare, rows) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Jul 17 13:55:29 2025
+
+@author: benjaminokoronkwo, ChatGPT
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+from . import stageTrace
+from .conversionCache import ConversionCache
+
+# numpy and the conversion modules are imported where they are used: the
+# configuration below is all buddy-convert needs to start, and `--help` or a
+# cache hit should not pay for loading them.
+
+# === 1. FILE NAMING CONFIGURATION ===
+# (must contain a column labeled "X (m)")
+filepath = "/Users/benjaminokoronkwo/BUDDY/data/testing/captured/increments5_20.csv"
+
+# === OUTPUT FILE: Auto-generated .txt in /processed ===
+output_folder = "/Users/benjaminokoronkwo/BUDDY/data/testing/processed"
+
+# === 2. USER CONFIGURATION ===
+#HARDWARE
+pulley_teeth = 36
+belt_pitch_mm = 2
+steps_per_rev = 1600
+
+# Uniform output grid shared by all axes (None = keep Blender frame times)
+resample_period_s = None     # e.g. 0.020 → 20 ms segments
+resample_method = "linear"   # "linear", "cubic" or "monotone"
+
+# Speed governor replayed offline before conversion (same envelopes and LIMITS
+# as speedGovernerUI.py). The mapping below relates camera values to rig units.
+govern = False
+arm_radius_in = 2.0
+tilt_zero_deg = 90.0      # camera RotX (deg) when the tilt arm is level
+slide_zero_m = 0.0        # camera X (m) with the slider at 0 in
+slide_direction = -1.0    # +1 in of slider travel moves the camera this way along X
+
+# Trajectory between the samples: "sine" lays one half-cosine between the first
+# and last sample of each axis; "scurve" keeps every sample as a waypoint and
+# retimes the take so no axis exceeds its limits (see scurvePlanner).
+planner = "sine"
+scurve_substeps = 4          # output segments per Blender frame
+# (velocity, acceleration, jerk) per DOF, in m or deg per s, s^2, s^3.
+# 6 in/s is the slide envelope; 13.5 in/s at the 2 in tilt arm ≈ 387 deg/s.
+scurve_limits = {"linX": (0.1524, 2.0, 50.0), "rotX": (387.0, 3000.0, 1.0e5)}
+
+# Blender's to_euler() wraps RotX at ±180°; unwrapping turns those jumps back
+# into the short way round before anything else sees the angles.
+unwrap_angles = True
+
+# Step-rate / acceleration guard run on every converted take (see stepGuard):
+# "retime" stretches offending segments, "fail" raises with their frame
+# indices, None skips the check. Limits are (steps/s, steps/s^2) per DOF.
+step_guard = "retime"
+step_limits = {"linX": (10000.0, 100000.0), "rotX": (10000.0, 100000.0)}
+
+# Bump whenever the generated output changes for the same inputs;
+# it is part of every conversion-cache key.
+CONVERTER_VERSION = "8"
+
+# DOFs written to the profile, in file order
+dofs = ("rotX",)
+ALL_DOFS = ("linX", "rotX")
+
+# Output format: "txt" (C arrays for the sketch), "bin" (.bdyp, see profileFormat),
+# "progmem" (run-length encoded flash tables + decoder, see progmemFormat),
+# "schedule" (merged multi-axis step events, see stepSchedule) or "ticks"
+# (per-axis delays in timer ticks for an ISR, see tickProfile)
+# (profileFormat.BINARY_EXTENSION, progmemFormat.PROGMEM_EXTENSION,
+# stepSchedule.SCHEDULE_EXTENSION, tickProfile.TICKS_EXTENSION, spelled out to
+# keep numpy out of the import)
+OUTPUT_FORMATS = {"txt": ".txt", "bin": ".bdyp", "progmem": ".h", "schedule": "_events.h",
+                  "ticks": "_ticks.h"}
+
+# Timer tick (μs) the "schedule" and "ticks" formats are expressed in
+schedule_tick_us = 4.0
+
+# CSV column read for each DOF
+TIME_COLUMN = "Time (s)"
+DOF_COLUMNS = {"linX": "X (m)", "rotX": "RotX (deg)"}
+
+
+def output_path_for(csv_path, out_folder, output_format="txt"):
+    """Maps a take CSV to its profile path (strips .csv and an optional '_data' suffix)."""
+    base_filename = os.path.splitext(os.path.basename(csv_path))[0]
+    if base_filename.endswith('_data'):
+        base_filename = base_filename[:-5]
+    return os.path.join(out_folder, base_filename + OUTPUT_FORMATS[output_format])
+
+
+# === 3. SORT DATA INTO ARRAYS===
+def load_take(csv_path):
+    """Reads the Time / X / RotX columns of a Blender export into float64 arrays."""
+    from .csvIngest import read_columns
+
+    columns = read_columns(csv_path, [TIME_COLUMN, DOF_COLUMNS["linX"], DOF_COLUMNS["rotX"]])
+    times_s = columns[TIME_COLUMN]
+    if len(times_s) < 2:
+        raise ValueError(f"{csv_path}: CSV does not contain enough rows of data.")
+    return times_s, columns[DOF_COLUMNS["linX"]], columns[DOF_COLUMNS["rotX"]]
+
+
+def resample_take(times_s, lin_x, rot_x, period_s, method="linear"):
+    """Puts every axis of a take on one uniform timeline (single vectorized pass)."""
+    import numpy as np
+    from .resample import resample_uniform
+
+    t_uniform, channels = resample_uniform(times_s, np.column_stack((lin_x, rot_x)),
+                                           period_s, method)
+    return t_uniform, channels[:, 0], channels[:, 1]
+
+
+def govern_positions(times_s, lin_x, rot_x, arm_radius_in=arm_radius_in):
+    """Runs the offline speed governor on X (m) / RotX (deg) and maps back."""
+    import numpy as np
+    from .governorSim import govern_take
+
+    slide_in = slide_direction * (np.asarray(lin_x) - slide_zero_m) / 0.0254
+    tilt_deg = np.asarray(rot_x) - tilt_zero_deg
+    governed = govern_take(times_s, tilt_deg=tilt_deg, slide_in=slide_in,
+                           arm_radius_in=arm_radius_in)
+    lin_x = slide_zero_m + slide_direction * governed["slide"] * 0.0254
+    rot_x = governed["tilt"] + tilt_zero_deg
+    return lin_x, rot_x
+
+
+def plan_take(times_s, lin_x, rot_x, limits=scurve_limits, substeps=scurve_substeps):
+    """
+    Plans X (m) / RotX (deg) jointly with the S-curve planner.
+
+    Returns:
+        tuple: (times_s, lin_x, rot_x) on the planned timeline, and the
+        planner's info dict.
+    """
+    import numpy as np
+    from .scurvePlanner import plan_scurve
+
+    v_max, a_max, j_max = np.array([limits["linX"], limits["rotX"]]).T
+    t_out, planned, info = plan_scurve(times_s, np.column_stack((lin_x, rot_x)),
+                                       v_max, a_max, j_max, substeps)
+    return (t_out, planned[:, 0], planned[:, 1]), info
+
+
+# === 4. RUN FUNCTIONS FOR EACH DOF ===
+def build_results(times_s, lin_x, rot_x, dofs=dofs, pulley_teeth=pulley_teeth,
+                  belt_pitch_mm=belt_pitch_mm, steps_per_rev=steps_per_rev, ease=True):
+    """
+    Returns {dof_name: (delta_steps, delay_times_us)} for the requested DOFs.
+
+    With ease=False the positions are quantized as given (governed, or planned by
+    plan_take) instead of being replaced by the sine ease.
+    """
+    from . import motionEngine
+    from .linMotion import linMotion
+    from .rotMotion import rotMotion
+
+    results_by_dof = {}
+    for dof in dofs:
+        if dof == "linX" and not ease:
+            steps = motionEngine.m_to_steps(lin_x, pulley_teeth, belt_pitch_mm, steps_per_rev)
+            results_by_dof[dof] = motionEngine.steps_to_segments(steps, times_s)
+        elif dof == "rotX" and not ease:
+            steps = motionEngine.deg_to_steps(rot_x, steps_per_rev)
+            results_by_dof[dof] = motionEngine.steps_to_segments(steps, times_s)
+        elif dof == "linX":
+            results_by_dof[dof] = linMotion(lin_x, times_s, pulley_teeth, belt_pitch_mm, steps_per_rev)
+        elif dof == "rotX":
+            results_by_dof[dof] = rotMotion(rot_x, times_s, steps_per_rev)
+        else:
+            raise ValueError(f"Unknown DOF '{dof}' (expected one of {', '.join(ALL_DOFS)})")
+    return results_by_dof
+
+
+# === 5. EXPORT HELPER FUNCTION ===
+def export_dof_arrays(f, name_prefix, delta_steps, delay_times_us):
+    f.write(f"// --- {name_prefix} axis ---\n")
+    f.write(f"int deltaSteps{name_prefix}[dataLength] = {{\n  " + ", ".join(map(str, delta_steps)) + "\n};\n")
+    f.write(f"unsigned int delayTimes{name_prefix}[dataLength] = {{\n  " + ", ".join(map(str, delay_times_us)) + "\n};\n\n")
+
+
+# === 6. WRITE TO TXT ===
+def write_profile(out_path, results_by_dof):
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "w") as f:
+        data_length = len(next(iter(results_by_dof.values()))[0])
+        f.write(f"const int dataLength = {data_length};\n\n")
+        for dof_name, (deltas, delays) in results_by_dof.items():
+            export_dof_arrays(f, dof_name, deltas, delays)
+
+
+# === 7. STREAMING CONVERSION (CONSTANT MEMORY) ===
+def iter_axis_segments(csv_path, dof, chunk_rows, pulley_teeth=pulley_teeth,
+                       belt_pitch_mm=belt_pitch_mm, steps_per_rev=steps_per_rev,
+                       unwrap_angles=unwrap_angles):
+    """
+    Yields (delta_steps, delay_times_us) chunks for one DOF of a take.
+
+    Reads `chunk_rows` rows at a time; concatenating the chunks gives exactly
+    the arrays linMotion / rotMotion would return for the whole take.
+    """
+    from . import motionEngine
+    from .csvIngest import count_rows, iter_chunks, read_endpoints
+
+    column = DOF_COLUMNS[dof]
+    n_total = count_rows(csv_path)
+    if n_total < 2:
+        raise ValueError(f"{csv_path}: CSV does not contain enough rows of data.")
+    first, last = read_endpoints(csv_path, [column])
+    unwrap = unwrap_angles and dof == "rotX"
+    if unwrap:
+        # the ease needs the unwrapped end angle: one extra pass over the column
+        unwrapper = motionEngine.StreamingUnwrapper()
+        for chunk in iter_chunks(csv_path, [column], chunk_rows):
+            last[column] = unwrapper.push(chunk[column])[-1]
+        unwrapper = motionEngine.StreamingUnwrapper()
+    segmenter = motionEngine.StreamingSegmenter()
+    offset = 0
+
+    for chunk in iter_chunks(csv_path, [TIME_COLUMN, column], chunk_rows):
+        if unwrap:
+            chunk[column] = unwrapper.push(chunk[column])
+        if dof == "linX":
+            eased = motionEngine.sine_ease_chunk(chunk[column], first[column], last[column],
+                                                 n_total, offset, motionEngine.LIN_EASE_THRESHOLD_M)
+            steps = motionEngine.m_to_steps(eased, pulley_teeth, belt_pitch_mm, steps_per_rev)
+        else:
+            eased = motionEngine.sine_ease_chunk(chunk[column], first[column], last[column],
+                                                 n_total, offset, motionEngine.ROT_EASE_THRESHOLD_DEG)
+            steps = motionEngine.deg_to_steps(eased, steps_per_rev)
+        offset += len(steps)
+        yield segmenter.push(steps, chunk[TIME_COLUMN])
+
+
+def write_profile_streaming(csv_path, out_path, dofs, chunk_rows, pulley_teeth=pulley_teeth,
+                            belt_pitch_mm=belt_pitch_mm, steps_per_rev=steps_per_rev,
+                            unwrap_angles=unwrap_angles):
+    """
+    Same output as write_profile, produced chunk by chunk.
+
+    Each axis is one pass over the CSV; its deltas and delays are spooled to
+    temporary files so memory stays bounded by `chunk_rows`.
+    """
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    spools = []
+    try:
+        for dof in dofs:
+            delta_f = tempfile.TemporaryFile("w+")
+            delay_f = tempfile.TemporaryFile("w+")
+            spools.append((dof, delta_f, delay_f))
+            data_length = 0
+            for deltas, delays in iter_axis_segments(csv_path, dof, chunk_rows, pulley_teeth,
+                                                     belt_pitch_mm, steps_per_rev, unwrap_angles):
+                if len(deltas) == 0:
+                    continue
+                sep = ", " if data_length else ""
+                delta_f.write(sep + ", ".join(map(str, deltas.tolist())))
+                delay_f.write(sep + ", ".join(map(str, delays.tolist())))
+                data_length += len(deltas)
+
+        with open(out_path, "w") as f:
+            f.write(f"const int dataLength = {data_length};\n\n")
+            for dof, delta_f, delay_f in spools:
+                f.write(f"// --- {dof} axis ---\n")
+                f.write(f"int deltaSteps{dof}[dataLength] = {{\n  ")
+                delta_f.seek(0)
+                shutil.copyfileobj(delta_f, f)
+                f.write("\n};\n")
+                f.write(f"unsigned int delayTimes{dof}[dataLength] = {{\n  ")
+                delay_f.seek(0)
+                shutil.copyfileobj(delay_f, f)
+                f.write("\n};\n\n")
+    finally:
+        for _, delta_f, delay_f in spools:
+            delta_f.close()
+            delay_f.close()
+
+
+def convert_take(csv_path, out_folder, dofs=dofs, pulley_teeth=pulley_teeth,
+                 belt_pitch_mm=belt_pitch_mm, steps_per_rev=steps_per_rev, cache=None,
+                 chunk_rows=None, output_format="txt", resample_period_s=resample_period_s,
+                 resample_method=resample_method, govern=govern, arm_radius_in=arm_radius_in,
+                 schedule_tick_us=schedule_tick_us, planner=planner,
+                 scurve_substeps=scurve_substeps, scurve_limits=scurve_limits,
+                 unwrap_angles=unwrap_angles, step_guard=step_guard, step_limits=step_limits):
+    """
+    Converts one Blender CSV into an Arduino profile header (output_format
+    "txt"), a binary .bdyp profile ("bin"), a run-length encoded PROGMEM
+    header ("progmem"), a merged step-event schedule ("schedule") or per-axis
+    timer-tick records ("ticks"), the last two in ticks of `schedule_tick_us`.
+
+    If a ConversionCache is given and already holds the output for this CSV
+    and these parameters, it is copied into place without converting.
+    With `chunk_rows` set, the take is streamed in chunks of that many rows
+    (constant memory, the same output as the whole take without the guard).
+    With `resample_period_s` set, all
+    axes are first resampled onto one uniform timeline; with `govern` the
+    positions are passed through the offline speed governor first and the
+    governed trajectory is quantized as is (the sine ease would replace it
+    with a half-cosine between its end points and undo the governing). With
+    planner "scurve" every sample is kept as a waypoint of a jerk-limited
+    trajectory (scurve_limits per DOF, scurve_substeps segments per frame)
+    instead of the endpoint-only sine ease. RotX is unwrapped first
+    (unwrap_angles), and the converted segments are checked against
+    step_limits: step_guard "retime" stretches the offending segments,
+    "fail" raises ValueError with their frame indices. The guard needs the
+    whole take, so streaming requires step_guard=None.
+
+    Returns:
+        str: Path of the written profile.
+    """
+    if chunk_rows and (output_format != "txt" or resample_period_s or govern or planner != "sine"):
+        raise ValueError("chunked streaming only supports the plain txt conversion")
+    if chunk_rows and step_guard:
+        # the guard retimes across the whole take; streaming keeps memory bounded instead
+        raise ValueError("chunked streaming cannot run the step guard; pass step_guard=None")
+    out_path = output_path_for(csv_path, out_folder, output_format)
+    if cache is not None:
+        key = cache.key_for(csv_path, {
+            "dofs": list(dofs),
+            "pulley_teeth": pulley_teeth,
+            "belt_pitch_mm": belt_pitch_mm,
+            "steps_per_rev": steps_per_rev,
+            "format": output_format,
+            "resample": [resample_period_s, resample_method] if resample_period_s else None,
+            "govern": [arm_radius_in, tilt_zero_deg, slide_zero_m, slide_direction] if govern else None,
+            "tick_us": schedule_tick_us if output_format in ("schedule", "ticks") else None,
+            "scurve": [scurve_substeps, {dof: list(scurve_limits[dof]) for dof in ALL_DOFS}]
+                      if planner == "scurve" else None,
+            "unwrap": unwrap_angles,
+            "guard": [step_guard, {dof: list(step_limits[dof]) for dof in ALL_DOFS}]
+                     if step_guard else None,
+        })
+        if cache.fetch(key, out_path):
+            stageTrace.count("cache_hits")
+            return out_path
+
+    if chunk_rows:
+        with stageTrace.stage("stream", path=csv_path, chunk_rows=chunk_rows):
+            write_profile_streaming(csv_path, out_path, dofs, chunk_rows, pulley_teeth,
+                                    belt_pitch_mm, steps_per_rev, unwrap_angles)
+    else:
+        with stageTrace.stage("load", path=csv_path):
+            times_s, lin_x, rot_x = load_take(csv_path)
+        if unwrap_angles:
+            with stageTrace.stage("unwrap"):
+                from .motionEngine import unwrap_degrees
+                rot_x = unwrap_degrees(rot_x)
+        if govern:
+            with stageTrace.stage("govern"):
+                lin_x, rot_x = govern_positions(times_s, lin_x, rot_x, arm_radius_in)
+        if planner == "scurve":
+            with stageTrace.stage("plan"):
+                (times_s, lin_x, rot_x), _ = plan_take(times_s, lin_x, rot_x,
+                                                       scurve_limits, scurve_substeps)
+        elif planner != "sine":
+            raise ValueError(f"Unknown planner '{planner}' (expected sine or scurve)")
+        if resample_period_s:
+            with stageTrace.stage("resample"):
+                times_s, lin_x, rot_x = resample_take(times_s, lin_x, rot_x,
+                                                      resample_period_s, resample_method)
+        with stageTrace.stage("build_results"):
+            results_by_dof = build_results(times_s, lin_x, rot_x, dofs, pulley_teeth,
+                                           belt_pitch_mm, steps_per_rev,
+                                           ease=planner == "sine" and not govern)
+        if step_guard:
+            with stageTrace.stage("guard"):
+                from .stepGuard import guard_results
+                results_by_dof, times_s, _ = guard_results(results_by_dof, times_s,
+                                                           step_limits, step_guard)
+        with stageTrace.stage("export", format=output_format, path=out_path):
+            if output_format == "bin":
+                from .profileFormat import write_profile_binary
+                write_profile_binary(out_path, results_by_dof)
+            elif output_format == "progmem":
+                from .progmemFormat import write_profile_progmem
+                write_profile_progmem(out_path, results_by_dof, (times_s[1:] - times_s[:-1]) * 1e6)
+            elif output_format == "schedule":
+                from .stepSchedule import write_schedule
+                write_schedule(out_path, results_by_dof, (times_s[:-1] - times_s[0]) * 1e6,
+                               schedule_tick_us)
+            elif output_format == "ticks":
+                from .tickProfile import write_tick_profile
+                write_tick_profile(out_path, results_by_dof, (times_s[1:] - times_s[:-1]) * 1e6,
+                                   schedule_tick_us)
+            else:
+                write_profile(out_path, results_by_dof)
+    if cache is not None:
+        cache.store(key, out_path)
+    return out_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the configured take.")
+    parser.add_argument("csv", nargs="?", default=filepath,
+                        help="take to convert (default: the configured filepath)")
+    parser.add_argument("-o", "--output-folder", default=output_folder)
+    parser.add_argument("--no-cache", action="store_true", help="always reconvert")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write a Chrome trace of the conversion stages (or set BUDDY_TRACE)")
+    args = parser.parse_args(argv)
+    if args.trace:
+        stageTrace.enable(args.trace)
+
+    cache = None if args.no_cache else ConversionCache(version=CONVERTER_VERSION)
+    output_path = convert_take(args.csv, args.output_folder, cache=cache)
+    print(f"Export complete → {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
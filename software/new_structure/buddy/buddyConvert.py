@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:05:17 2026
+
+@author: benjaminokoronkwo
+
+buddy-convert: batch Blender CSV → Arduino profile converter.
+
+Converts every take matched by the given globs / directories in parallel
+(one process per take via ProcessPoolExecutor; a single take is converted
+in this process) and writes each profile into
+the output folder (data/processed by default).
+
+With --watch it stays running and reconverts each take, in this process,
+as soon as Blender has finished re-exporting it (see watchMode).
+
+Usage:
+    python -m buddy.buddyConvert data/motion
+    python -m buddy.buddyConvert "data/motion/tilt_*.csv" -j 4 --dof rotX
+    python -m buddy.buddyConvert data/motion --watch
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+from . import blenderToArduino
+from .conversionCache import DEFAULT_CACHE_DIR, ConversionCache
+from . import stageTrace
+from . import watchMode
+
+# the package lives in software/new_structure/buddy of the BUDDY checkout
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+def checkout_path(*parts):
+    """
+    REPO_ROOT/parts, for the defaults (data/processed, data/motion) that only
+    exist when the package runs from a BUDDY checkout.
+
+    Raises:
+        ValueError: the package is installed somewhere else.
+    """
+    if not os.path.isfile(os.path.join(REPO_ROOT, "software", "new_structure", "pyproject.toml")):
+        raise ValueError(f"no {'/'.join(parts)} folder: buddy is installed at "
+                         f"{os.path.dirname(os.path.abspath(__file__))}, outside a BUDDY checkout")
+    return os.path.join(REPO_ROOT, *parts)
+
+
+def expand_inputs(patterns):
+    """
+    Resolves directories and glob patterns into a sorted list of CSV paths.
+
+    Returns:
+        tuple:
+            - csv_paths (list[str]): Unique matched files, in sorted order.
+            - unmatched (list[str]): Patterns that matched nothing.
+    """
+    csv_paths = []
+    unmatched = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, "*.csv"))
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        if not matches:
+            unmatched.append(pattern)
+        csv_paths.extend(os.path.abspath(p) for p in matches if os.path.isfile(p))
+    return sorted(set(csv_paths)), unmatched
+
+
+def _convert_one(csv_path, out_folder, dofs, pulley_teeth, belt_pitch_mm, steps_per_rev, cache,
+                 chunk_rows, output_format, resample_period_s, resample_method, govern,
+                 arm_radius_in, schedule_tick_us, planner, scurve_substeps, unwrap_angles,
+                 step_guard):
+    """Worker: converts a single take and never raises (errors are returned)."""
+    stageTrace.drain()    # a forked worker starts with a copy of the parent's events
+    hits = cache.hits if cache is not None else 0
+    start = time.perf_counter()
+    try:
+        with stageTrace.stage("take", path=csv_path):
+            out_path = blenderToArduino.convert_take(csv_path, out_folder, dofs,
+                                                     pulley_teeth, belt_pitch_mm, steps_per_rev,
+                                                     cache=cache, chunk_rows=chunk_rows,
+                                                     output_format=output_format,
+                                                     resample_period_s=resample_period_s,
+                                                     resample_method=resample_method,
+                                                     govern=govern, arm_radius_in=arm_radius_in,
+                                                     schedule_tick_us=schedule_tick_us,
+                                                     planner=planner, scurve_substeps=scurve_substeps,
+                                                     unwrap_angles=unwrap_angles, step_guard=step_guard)
+        error = None
+    except Exception as exc:  # report and keep converting the other takes
+        out_path = None
+        error = f"{type(exc).__name__}: {exc}"
+    cached = cache is not None and cache.hits > hits
+    trace = stageTrace.drain() if stageTrace.enabled else None
+    return csv_path, out_path, time.perf_counter() - start, error, cached, trace
+
+
+def print_summary(results, wall_s):
+    """Per-file timing table, slowest take first."""
+    width = max((len(os.path.basename(r[0])) for r in results), default=4)
+    print(f"\n{'take':<{width}}  {'ms':>9}  status")
+    for csv_path, out_path, elapsed, error, cached, _ in sorted(results, key=lambda r: -r[2]):
+        if error:
+            status = f"FAILED ({error})"
+        else:
+            status = f"→ {os.path.basename(out_path)}" + (" (cached)" if cached else "")
+            if out_path.endswith(blenderToArduino.OUTPUT_FORMATS["schedule"]):
+                from . import stepSchedule
+                stats = stepSchedule.read_stats(out_path)
+                status += (f"  [{stats['events']:.0f} events, min gap "
+                           f"{stats['min_gap_us']:g} us]")
+            elif out_path.endswith(blenderToArduino.OUTPUT_FORMATS["ticks"]):
+                from . import tickProfile
+                stats = tickProfile.read_stats(out_path)
+                status += (f"  [{stats['records']:.0f} records of {stats['tick_us']:g} us ticks, "
+                           f"max error {stats['max_error_us']:.2f} us]")
+            elif out_path.endswith(blenderToArduino.OUTPUT_FORMATS["progmem"]):
+                from . import progmemFormat
+                stats = progmemFormat.read_stats(out_path)
+                status += (f"  [{stats['ratio']:.1f}x, SRAM {stats['plain_sram']} → "
+                           f"{stats['sram']} B, flash {stats['flash']} B]")
+        print(f"{os.path.basename(csv_path):<{width}}  {elapsed * 1000:9.1f}  {status}")
+    failed = sum(1 for r in results if r[3])
+    hits = sum(1 for r in results if r[4])
+    print(f"\n{len(results) - failed}/{len(results)} takes converted in {wall_s:.2f} s"
+          f" ({hits} from cache)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="buddy-convert",
+        description="Convert Blender motion CSVs into Arduino step/delay profiles.")
+    parser.add_argument("inputs", nargs="+",
+                        help="CSV files, glob patterns or directories of CSVs")
+    parser.add_argument("-o", "--output-folder",
+                        help="where the profiles are written (default: data/processed "
+                             "of the checkout)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--dof", dest="dofs", action="append", choices=blenderToArduino.ALL_DOFS,
+                        help="axis to export; repeat for several (default: all)")
+    parser.add_argument("--pulley-teeth", type=int, default=blenderToArduino.pulley_teeth)
+    parser.add_argument("--belt-pitch-mm", type=float, default=blenderToArduino.belt_pitch_mm)
+    parser.add_argument("--steps-per-rev", type=int, default=blenderToArduino.steps_per_rev)
+    parser.add_argument("--format", dest="output_format", default="txt",
+                        choices=sorted(blenderToArduino.OUTPUT_FORMATS),
+                        help="txt = C arrays for the sketch, bin = memory-mappable .bdyp, "
+                             "progmem = run-length encoded flash tables (.h), "
+                             "schedule = merged step events for all axes (_events.h), "
+                             "ticks = per-axis delays in timer ticks for an ISR (_ticks.h)")
+    parser.add_argument("--tick-us", type=float, default=blenderToArduino.schedule_tick_us,
+                        help="timer tick of --format schedule / ticks (default: %(default)s us)")
+    parser.add_argument("--planner", default=blenderToArduino.planner, choices=("sine", "scurve"),
+                        help="sine = ease between the first and last sample, scurve = "
+                             "jerk-limited trajectory through every sample (default: %(default)s)")
+    parser.add_argument("--substeps", type=int, default=blenderToArduino.scurve_substeps,
+                        help="output segments per frame with --planner scurve (default: %(default)s)")
+    parser.add_argument("--resample-ms", type=float, default=None,
+                        help="resample all axes onto a uniform grid with this period (ms)")
+    parser.add_argument("--interp", default="linear", choices=("linear", "cubic", "monotone"),
+                        help="interpolation used by --resample-ms (default: %(default)s)")
+    parser.add_argument("--govern", action="store_true",
+                        help="apply the offline speed governor before conversion")
+    parser.add_argument("--arm-radius-in", type=float, default=blenderToArduino.arm_radius_in,
+                        help="tilt arm length used by --govern (default: %(default)s)")
+    parser.add_argument("--no-unwrap", action="store_true",
+                        help="keep RotX as exported instead of unwrapping the ±180° jumps")
+    parser.add_argument("--guard", choices=("retime", "fail", "off"), default=None,
+                        help="segments over the step-rate / acceleration limits: retime them, "
+                             "fail with their frames, or skip the check (default: retime, "
+                             "off with --chunk-rows, which cannot retime or fail)")
+    parser.add_argument("--chunk-rows", type=int, default=None,
+                        help="stream each take in chunks of this many rows (bounded memory)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="reconvert every take instead of reusing cached profiles")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="conversion cache location (default: %(default)s)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write a Chrome trace of every stage to PATH (or set BUDDY_TRACE)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="with --trace, also record tracemalloc sizes per stage")
+    parser.add_argument("--cache-size-mb", type=float, default=64,
+                        help="cache size budget before LRU eviction (default: %(default)s)")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and reconvert takes as they are re-exported")
+    parser.add_argument("--settle-ms", type=float, default=watchMode.SETTLE_S * 1000,
+                        help="--watch: how long a CSV must stay unchanged (default: %(default)s)")
+    parser.add_argument("--poll-ms", type=float, default=watchMode.POLL_S * 1000,
+                        help="--watch: check interval (default: %(default)s)")
+    return parser
+
+
+def _log_watched(csv_path, result, elapsed, turnaround):
+    _, out_path, _, error, cached, _ = result
+    if error:
+        status = f"FAILED ({error})"
+    else:
+        status = f"→ {os.path.basename(out_path)}" + (" (cached)" if cached else "")
+    print(f"{time.strftime('%H:%M:%S')}  {os.path.basename(csv_path)}  {elapsed * 1000:.1f} ms "
+          f"(saved {turnaround * 1000:.0f} ms ago)  {status}", flush=True)
+
+
+def watch(args, options):
+    """Runs --watch until Ctrl-C; `options` are _convert_one's arguments after csv_path."""
+    traces = []    # _convert_one drains this process' events, so keep them aside
+
+    def convert(path):
+        result = _convert_one(path, *options)
+        if result[5]:
+            traces.append(result[5])
+        return result
+
+    watcher = watchMode.TakeWatcher(watchMode.watch_targets(args.inputs), convert,
+                                    settle_s=args.settle_ms / 1000, poll_s=args.poll_ms / 1000,
+                                    log=_log_watched)
+    print(f"watching {', '.join(args.inputs)} ({watcher.backend}); Ctrl-C to stop", flush=True)
+    watcher.run()
+    print(f"\n{len(watcher.converted)} takes converted")
+    for trace in traces:
+        stageTrace.merge(*trace)
+    if stageTrace.enabled:
+        print(f"trace → {stageTrace.write()}")
+    return 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.output_folder is None:
+        try:
+            args.output_folder = checkout_path("data", "processed")
+        except ValueError as exc:
+            parser.error(f"{exc}; pass -o/--output-folder")
+    if args.output_format == "schedule" and (args.tick_us < 1 or not args.tick_us.is_integer()):
+        parser.error("--format schedule: the replay sketch polls micros(), so --tick-us must be "
+                     "a whole number of microseconds")
+    if args.chunk_rows and args.guard in ("retime", "fail"):
+        parser.error(f"--guard {args.guard} needs the whole take; it cannot be combined with "
+                     "--chunk-rows")
+    dofs = tuple(args.dofs or blenderToArduino.ALL_DOFS)
+    guard = args.guard or ("off" if args.chunk_rows else blenderToArduino.step_guard)
+
+    cache = None
+    if not args.no_cache:
+        cache = ConversionCache(args.cache_dir, int(args.cache_size_mb * 1024 * 1024),
+                                version=blenderToArduino.CONVERTER_VERSION)
+
+    if args.trace:
+        stageTrace.enable(args.trace, memory=args.trace_memory)
+
+    options = (args.output_folder, dofs, args.pulley_teeth, args.belt_pitch_mm,
+               args.steps_per_rev, cache, args.chunk_rows, args.output_format,
+               args.resample_ms / 1000 if args.resample_ms else None, args.interp,
+               args.govern, args.arm_radius_in, args.tick_us, args.planner, args.substeps,
+               not args.no_unwrap, None if guard == "off" else guard)
+    if args.watch:
+        return watch(args, options)
+
+    csv_paths, unmatched = expand_inputs(args.inputs)
+    for pattern in unmatched:
+        print(f"warning: no CSV files match '{pattern}'", file=sys.stderr)
+    if not csv_paths:
+        print("error: nothing to convert", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    workers = max(1, min(args.workers, len(csv_paths)))
+    if workers == 1:
+        # no pool to start (under spawn, a worker re-imports numpy and every module)
+        results = [_convert_one(path, *options) for path in csv_paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_convert_one, path, *options) for path in csv_paths]
+            results = [future.result() for future in as_completed(futures)]
+    for result in results:
+        if result[5]:
+            stageTrace.merge(*result[5])
+
+    print_summary(results, time.perf_counter() - start)
+    if stageTrace.enabled:
+        print(f"trace → {stageTrace.write()}")
+    return 1 if unmatched or any(r[3] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
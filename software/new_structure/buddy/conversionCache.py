@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:02:48 2026
+
+@author: benjaminokoronkwo
+
+On-disk cache of converted Arduino profiles.
+
+Entries are keyed by a SHA-256 of the input CSV bytes, the conversion
+parameters (axes, pulley_teeth, belt_pitch_mm, steps_per_rev, ...) and the
+converter version, so a hit is only possible when the output would be
+byte-identical. Hits are copied into place; the cache is kept under a size
+budget by evicting the least recently used entries (entry mtime is bumped on
+every hit).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "BUDDY_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "buddy", "conversions"))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ConversionCache:
+    """
+    Size-bounded LRU cache of profile files.
+
+    Args:
+        cache_dir (str): Directory holding the cached entries.
+        max_bytes (int): Total size budget; oldest entries are evicted past it.
+        version (str): Converter version mixed into every key.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, version="0"):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.version = str(version)
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, csv_path, params):
+        """Hash of the CSV contents + parameters + converter version."""
+        h = hashlib.sha256()
+        with open(csv_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        h.update(json.dumps(params, sort_keys=True, default=str).encode())
+        h.update(self.version.encode())
+        return h.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.profile")
+
+    def fetch(self, key, out_path):
+        """
+        Copies a cached entry to `out_path`.
+
+        Returns:
+            bool: True on a hit, False if the key is not cached.
+        """
+        entry = self._entry_path(key)
+        try:
+            os.utime(entry)  # mark as most recently used
+            os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+            shutil.copyfile(entry, out_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key, src_path):
+        """Adds a freshly converted profile to the cache, then enforces the size budget."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, self._entry_path(key))  # atomic for concurrent workers
+        self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for e in it:
+                    if e.name.endswith(".profile"):
+                        st = e.stat()
+                        entries.append((st.st_mtime, st.st_size, e.path))
+        except FileNotFoundError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # already evicted by another worker
+            total -= size
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
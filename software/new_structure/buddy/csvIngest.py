@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:20:31 2026
+
+@author: benjaminokoronkwo
+
+Chunked, column-selective reader for Blender motion CSVs.
+
+Only the requested columns ("Time (s)", "X (m)", "RotX (deg)", ...) are
+converted, straight into float64 arrays. read_columns() fills arrays
+preallocated from a fast row count; iter_chunks() yields fixed-size chunks so
+long captures can be processed with constant memory.
+"""
+
+import itertools
+import os
+
+import numpy as np
+
+from . import stageTrace
+
+DEFAULT_CHUNK_ROWS = 65536
+
+
+def _column_indices(header_line, columns, csv_path):
+    header = [name.strip() for name in header_line.rstrip("\r\n").split(",")]
+    try:
+        return [header.index(name) for name in columns]
+    except ValueError as exc:
+        raise KeyError(f"{csv_path}: missing column ({exc}); has {header}") from None
+
+
+def count_rows(csv_path):
+    """Number of data rows (header excluded), counted on raw bytes."""
+    rows = 0
+    last = b"\n"
+    with open(csv_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            rows += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        rows += 1  # final line without a trailing newline
+    return max(rows - 1, 0)
+
+
+def _parse_lines(lines, indices):
+    """Parses an iterable of CSV lines into a (rows, len(indices)) float64 array."""
+    return np.loadtxt(lines, delimiter=",", usecols=indices, dtype=np.float64, ndmin=2)
+
+
+def iter_chunks(csv_path, columns, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Yields the requested columns in chunks of at most `chunk_rows` rows.
+
+    Args:
+        csv_path (str): Blender export CSV.
+        columns (list[str]): Column names to parse; all others are skipped.
+        chunk_rows (int): Rows per chunk.
+
+    Yields:
+        dict[str, np.ndarray]: float64 array per requested column.
+    """
+    with open(csv_path, "r") as f:
+        indices = _column_indices(f.readline(), columns, csv_path)
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            lines = [line for line in lines if line.strip()]
+            if not lines:
+                return
+            block = _parse_lines(lines, indices)
+            stageTrace.count("rows_read", len(block))
+            yield {name: block[:, i] for i, name in enumerate(columns)}
+
+
+def read_columns(csv_path, columns, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Reads whole columns into preallocated float64 arrays.
+
+    Returns:
+        dict[str, np.ndarray]: One array per requested column.
+    """
+    n = count_rows(csv_path)
+    out = {name: np.empty(n, dtype=np.float64) for name in columns}
+    filled = 0
+    for chunk in iter_chunks(csv_path, columns, chunk_rows):
+        rows = len(chunk[columns[0]])
+        for name in columns:
+            out[name][filled:filled + rows] = chunk[name]
+        filled += rows
+    if filled != n:  # blank lines were skipped
+        out = {name: arr[:filled] for name, arr in out.items()}
+    return out
+
+
+def read_endpoints(csv_path, columns):
+    """
+    First and last data row of the requested columns, without reading the body.
+
+    Returns:
+        tuple[dict[str, float], dict[str, float]]: (first, last) values.
+    """
+    with open(csv_path, "rb") as f:
+        header = f.readline().decode()
+        indices = _column_indices(header, columns, csv_path)
+        first_line = f.readline().decode()
+
+        size = f.seek(0, os.SEEK_END)
+        tail = b""
+        pos = size
+        while pos > 0 and tail.strip().count(b"\n") < 1:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+        last_line = tail.strip().split(b"\n")[-1].decode()
+
+    first_row = first_line.split(",")
+    last_row = last_line.split(",")
+    first = {name: float(first_row[i]) for name, i in zip(columns, indices)}
+    last = {name: float(last_row[i]) for name, i in zip(columns, indices)}
+    return first, last
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:52:03 2026
+
+@author: benjaminokoronkwo
+
+Offline speed-governor simulator (no Blender needed).
+
+Replays the rate-limit-and-clamp logic of the on_frame handler in
+speedGovernor.py / speedGovernerUI.py over a whole timeline of keyframed
+targets for tilt, slide and pan, using the same envelopes and LIMITS.
+
+Each frame the handler moves the bone toward its target by at most
+max_speed(current) * dt and then clamps to the travel limits. Clamping the
+targets first gives the same result (the bone always stays inside the
+limits), and while the bone sits on its target and the target moves slower
+than the envelope allows, the output is simply the target. Those tracking
+stretches are filled with array slices; only frames where the governor is
+actually holding the bone back are stepped one at a time.
+"""
+
+import numpy as np
+
+from .speedEnvelope import DEFAULT_CONFIG, load_envelopes, tilt_envelope
+
+# === LIMITS (same values as speedGovernerUI.py; envelopes live in envelopes.json) ===
+LIMITS = {
+    "tilt_min_deg":  -25.0,
+    "tilt_max_deg":   25.0,
+    "slide_min_in":    0.0,
+    "slide_max_in":   26.0,
+    "pan_min_deg":  -90.0,
+    "pan_max_deg":   90.0,
+}
+
+ARM_TILT_RADIUS_IN = 2.0
+
+
+# === GOVERNOR CORE ===
+def govern_axis(targets, dt, speed, speed_array, lo, hi, initial=None):
+    """
+    Rate-limits and clamps one axis over the whole timeline.
+
+    Args:
+        targets (array-like): Target position per frame.
+        dt (float or array-like): Frame period in seconds (array: per frame,
+            dt[i] = time from frame i-1 to frame i).
+        speed (callable): Scalar envelope, position → max speed (units/s).
+        speed_array (callable): Vectorized form of `speed`.
+        lo, hi (float): Travel limits.
+        initial (float | None): Bone position before the first frame; None
+            means the bone starts on its first target.
+
+    Returns:
+        np.ndarray: Governed position per frame (float64).
+    """
+    x = np.clip(np.asarray(targets, dtype=np.float64), lo, hi)
+    n = len(x)
+    if n == 0:
+        return x
+    dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), (n,))
+    y = np.empty(n)
+
+    # frames i where "bone on target at i-1" implies "bone on target at i"
+    tracking_ok = np.abs(np.diff(x)) <= speed_array(x[:-1]) * dt[1:]
+    breaks = np.flatnonzero(~tracking_ok) + 1   # frames where tracking is lost
+
+    def step(cur, target, frame_dt):
+        max_step = speed(cur) * frame_dt
+        delta = target - cur
+        if   delta >  max_step: new = cur + max_step
+        elif delta < -max_step: new = cur - max_step
+        else:                   new = target
+        return lo if new < lo else hi if new > hi else new
+
+    xs = x.tolist()
+    dts = dt.tolist()
+    cur = xs[0] if initial is None else float(initial)
+    on_target = False
+    i = 0
+    while i < n:
+        if on_target:
+            # bone sits on x[i-1]: it keeps tracking until the next break
+            k = np.searchsorted(breaks, i)
+            j = int(breaks[k]) if k < len(breaks) else n
+            if j > i:
+                y[i:j] = x[i:j]
+                cur = xs[j - 1]
+                i = j
+                continue
+        cur = step(cur, xs[i], dts[i])
+        y[i] = cur
+        on_target = cur == xs[i]
+        i += 1
+    return y
+
+
+def govern_take(times, tilt_deg=None, slide_in=None, pan_deg=None,
+                arm_radius_in=ARM_TILT_RADIUS_IN, limits=LIMITS, initial=None,
+                config=DEFAULT_CONFIG):
+    """
+    Governs every provided axis of a take.
+
+    Args:
+        times (array-like): Frame times in seconds.
+        tilt_deg, slide_in, pan_deg (array-like | None): Target trajectories.
+        arm_radius_in (float): Tilt pivot → camera distance (in).
+        limits (dict): Travel limits, same keys as LIMITS.
+        initial (dict | None): Starting bone positions by axis name.
+        config (str): Envelope config file (see speedEnvelope).
+
+    Returns:
+        dict[str, np.ndarray]: Governed trajectories for the given axes.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if len(times) > 1:
+        dt = np.diff(times, prepend=2 * times[0] - times[1])  # first frame: one frame period
+    else:
+        dt = np.zeros(len(times))
+    initial = initial or {}
+    envelopes = load_envelopes(config)
+    axes = []
+    if tilt_deg is not None:
+        env = tilt_envelope(arm_radius_in, limits["tilt_min_deg"], limits["tilt_max_deg"], config)
+        axes.append(("tilt", tilt_deg, env, "tilt_min_deg", "tilt_max_deg"))
+    if slide_in is not None:
+        axes.append(("slide", slide_in, envelopes["slide"], "slide_min_in", "slide_max_in"))
+    if pan_deg is not None:
+        axes.append(("pan", pan_deg, envelopes["pan"], "pan_min_deg", "pan_max_deg"))
+
+    governed = {}
+    for name, targets, env, lo_key, hi_key in axes:
+        governed[name] = govern_axis(targets, dt, env.scalar, env.array,
+                                     limits[lo_key], limits[hi_key], initial.get(name))
+    return governed
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Jul 17 10:55:08 2025
+
+@author: benjaminokoronkwo, ChatGPT
+"""
+
+from .motionEngine import lin_motion_arrays
+
+def linMotion(lin_data, times, pulley_teeth = 36, belt_pitch_mm = 2, steps_per_rev = 1600):
+    
+    """
+    Generates Arduino-ready step and delay arrays for linear motion based on 
+    Blender-exported data.
+    
+    Process:
+    Applies sine easing to input motion, converts to motor steps, and 
+    calculates per-step delays to achieve smooth motion. The work is done in
+    bulk by motionEngine.lin_motion_arrays; this wrapper keeps the list API.
+
+    Args:
+        lin_data (list[float]): Raw position data in meters.
+        times (list[float]): Corresponding timestamps in seconds.
+        pulley_teeth (int): Number of teeth on the GT2 pulley. Default is 36.
+        belt_pitch_mm (float): Pitch of the GT2 belt in millimeters. Default is 2 mm.
+        steps_per_rev (int): Motor steps per full revolution. Default is 1600
+                            (1/8 microstepping on 200-step motor).
+
+    Returns:
+        tuple:
+            - delta_steps (list[int]): Step changes per timestep (can be negative).
+            - delay_times_us (list[int]): Delay per step in microseconds for smooth timing.
+    """
+    
+    delta_steps, delay_times_us = lin_motion_arrays(
+        lin_data, times, pulley_teeth, belt_pitch_mm, steps_per_rev)
+        
+    return delta_steps.tolist(), delay_times_us.tolist()
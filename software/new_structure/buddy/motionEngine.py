@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:12:40 2026
+
+@author: benjaminokoronkwo
+
+Array-based conversion core shared by linMotion and rotMotion.
+
+Every stage (easing, quantization, delta steps, per-step delays) runs as a
+single NumPy pass over the whole take, so conversion time no longer grows with
+Python-level loops over frames. Inputs may be lists or arrays; outputs are
+int32 delta steps and uint32 delays (μs).
+"""
+
+import numpy as np
+
+from . import stageTrace
+
+# Below these end-to-end travels the take is treated as "no motion" and the
+# raw samples are used instead of the eased curve.
+LIN_EASE_THRESHOLD_M = 1e-4
+ROT_EASE_THRESHOLD_DEG = 0.01
+
+
+# === 1. SINE EASING ===
+def sine_ease(data, threshold):
+    """
+    Lays a half-cosine (sine ease-in-out) between the first and last sample.
+
+    Args:
+        data (array-like): Raw positions (metres or degrees).
+        threshold (float): Minimum end-to-end travel for easing to apply.
+
+    Returns:
+        np.ndarray: float64 eased positions, same length as `data`.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    start, end = data[0], data[-1]
+    if abs(end - start) < threshold:
+        return data  # essentially no travel
+    ease = 0.5 - 0.5 * np.cos(np.linspace(0, np.pi, len(data)))
+    return start + (end - start) * ease
+
+
+# === 2. QUANTIZE TO STEPS ===
+def m_to_steps(x_m, pulley_teeth=36, belt_pitch_mm=2, steps_per_rev=1600):
+    """Metres → motor steps, rounded to the nearest step (half to even)."""
+    circumference = pulley_teeth * belt_pitch_mm / 1000
+    x_m = np.asarray(x_m, dtype=np.float64)
+    return np.rint((x_m / circumference) * steps_per_rev).astype(np.int32)
+
+
+def deg_to_steps(deg, steps_per_rev=1600):
+    """Degrees → motor steps, truncated toward zero."""
+    deg = np.asarray(deg, dtype=np.float64)
+    return ((deg / 360.0) * steps_per_rev).astype(np.int32)
+
+
+# === 3. DELTA STEPS + PER-STEP DELAYS (μs) ===
+def steps_to_segments(steps, times):
+    """
+    Converts absolute step positions into per-segment deltas and delays.
+
+    Args:
+        steps (array-like): Absolute motor position per sample (steps).
+        times (array-like): Timestamps per sample (seconds).
+
+    Returns:
+        tuple:
+            - delta_steps (np.ndarray[int32]): Step change per segment.
+            - delay_times_us (np.ndarray[uint32]): Delay per individual step in
+              microseconds; 0 for segments with no motion or no elapsed time.
+    """
+    steps = np.asarray(steps, dtype=np.int32)
+    times = np.asarray(times, dtype=np.float64)
+
+    delta_steps = np.diff(steps)
+    dt_s = np.diff(times)
+
+    delay_times_us = np.zeros(len(delta_steps), dtype=np.uint32)
+    moving = (delta_steps != 0) & (dt_s > 0)
+    velocity_sps = np.abs(delta_steps[moving]) / dt_s[moving]   # steps per second
+    delay_times_us[moving] = (1_000_000 / velocity_sps).astype(np.uint32)
+
+    if stageTrace.enabled:
+        stageTrace.count("segments", len(delta_steps))
+        stageTrace.count("zero_segments", len(delta_steps) - int(np.count_nonzero(delta_steps)))
+        # the sketches hold delays in unsigned int: these wrap on the board
+        stageTrace.count("delays_over_uint16", int(np.count_nonzero(delay_times_us > 0xFFFF)))
+    return delta_steps, delay_times_us
+
+
+# === 4. FULL AXIS PIPELINES ===
+def lin_motion_arrays(lin_data, times, pulley_teeth=36, belt_pitch_mm=2, steps_per_rev=1600):
+    """
+    Array version of linMotion: eased metres → (int32 deltas, uint32 delays).
+    """
+    with stageTrace.stage("ease", axis="linX"):
+        eased_m = sine_ease(lin_data, LIN_EASE_THRESHOLD_M)
+    with stageTrace.stage("quantize", axis="linX"):
+        steps = m_to_steps(eased_m, pulley_teeth, belt_pitch_mm, steps_per_rev)
+    with stageTrace.stage("segments", axis="linX"):
+        return steps_to_segments(steps, times)
+
+
+def rot_motion_arrays(rot_data, times, steps_per_rev=1600):
+    """
+    Array version of rotMotion: eased degrees → (int32 deltas, uint32 delays).
+    """
+    with stageTrace.stage("ease", axis="rotX"):
+        eased_deg = sine_ease(rot_data, ROT_EASE_THRESHOLD_DEG)
+    with stageTrace.stage("quantize", axis="rotX"):
+        steps = deg_to_steps(eased_deg, steps_per_rev)
+    with stageTrace.stage("segments", axis="rotX"):
+        return steps_to_segments(steps, times)
+
+
+# === 5. STREAMING (CHUNKED) CONVERSION ===
+def sine_ease_chunk(chunk, start, end, n_total, offset, threshold):
+    """
+    Same easing as sine_ease, evaluated for one chunk of a longer take.
+
+    The ease only depends on the sample index and the take's endpoints, so a
+    chunk can be eased without the rest of the data.
+
+    Args:
+        chunk (array-like): Raw positions of this chunk.
+        start, end (float): First and last raw position of the whole take.
+        n_total (int): Number of samples in the whole take.
+        offset (int): Index of the chunk's first sample within the take.
+        threshold (float): Minimum end-to-end travel for easing to apply.
+    """
+    chunk = np.asarray(chunk, dtype=np.float64)
+    if abs(end - start) < threshold:
+        return chunk
+    idx = np.arange(offset, offset + len(chunk))
+    phase = idx * (np.pi / (n_total - 1))     # matches np.linspace(0, pi, n_total)
+    phase[idx == n_total - 1] = np.pi
+    ease = 0.5 - 0.5 * np.cos(phase)
+    return start + (end - start) * ease
+
+
+class StreamingSegmenter:
+    """
+    Incremental steps_to_segments: feed consecutive chunks of absolute steps
+    and times; the last sample of each chunk is carried into the next so the
+    concatenated output equals a single steps_to_segments call.
+    """
+
+    def __init__(self):
+        self._last_step = None
+        self._last_time = None
+
+    def push(self, steps, times):
+        steps = np.asarray(steps, dtype=np.int32)
+        times = np.asarray(times, dtype=np.float64)
+        if len(steps) == 0:
+            return np.empty(0, np.int32), np.empty(0, np.uint32)
+        if self._last_step is not None:
+            steps = np.concatenate(([self._last_step], steps))
+            times = np.concatenate(([self._last_time], times))
+        self._last_step = steps[-1]
+        self._last_time = times[-1]
+        return steps_to_segments(steps, times)
+
+
+# === 6. EULER-ANGLE UNWRAPPING ===
+def _unwrap_turns(deg, period):
+    """Whole periods to add to each sample (exact multiples, so no rounding noise)."""
+    return np.rint((np.unwrap(deg, period=period, axis=0) - deg) / period) * period
+
+
+def unwrap_degrees(deg, period=360.0):
+    """
+    Removes the ±180° jumps of Blender's to_euler() from an angle track.
+
+    Every sample-to-sample jump larger than half a period is replaced by its
+    equivalent short way round, so a tilt that crosses 180° keeps turning
+    instead of spinning the motor back a full revolution.
+    """
+    deg = np.asarray(deg, dtype=np.float64)
+    return deg + _unwrap_turns(deg, period)
+
+
+class StreamingUnwrapper:
+    """
+    Incremental unwrap_degrees: the previous chunk's last sample and turn
+    count are carried over, so the concatenated output equals one call on
+    the whole take.
+    """
+
+    def __init__(self, period=360.0):
+        self.period = period
+        self._last_raw = None
+        self._offset = 0.0
+
+    def push(self, deg):
+        deg = np.asarray(deg, dtype=np.float64)
+        if len(deg) == 0:
+            return deg
+        if self._last_raw is None:
+            turns = _unwrap_turns(deg, self.period)
+        else:
+            turns = _unwrap_turns(np.concatenate(([self._last_raw], deg)), self.period)[1:]
+            turns += self._offset
+        self._last_raw = deg[-1]
+        self._offset = turns[-1]
+        return deg + turns
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:20:44 2026
+
+@author: benjaminokoronkwo
+
+Mechanical-parameter sweep.
+
+Converts every take with every combination of pulley teeth, belt pitch,
+motor steps per revolution, microstepping and (with --govern) tilt arm
+length, and reports per combination, over all takes:
+
+    peak_rate_sps      fastest segment (steps/s) and the take it is in
+    min_delay_us       shortest per-step delay
+    lin_error_mm       largest slide position lost to step quantization
+    rot_error_deg      largest tilt angle lost to step quantization
+    flash_bytes        largest PROGMEM (run-length encoded) profile
+    wrapped_delays     segments whose delay overflows the sketches' unsigned int
+    over_rate_limit    segments faster than blenderToArduino.step_limits
+
+The takes are read once. Their time / X / RotX columns (RotX unwrapped)
+are packed into one shared-memory block that every worker maps, so the
+combinations, spread over the cores, never touch the CSVs.
+
+Usage:
+    python -m buddy.parameterSweep data/motion --pulley-teeth 20,36,40 --microsteps 4,8,16
+    python -m buddy.parameterSweep --belt-pitch-mm 2,3 --arm-radius-in 1.5:3:0.5 --govern -o sweep.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import blenderToArduino
+from . import motionEngine
+from .buddyConvert import checkout_path, expand_inputs
+from .progmemFormat import encode_rle
+from .stepGuard import segment_rates
+
+PARAMETERS = ("pulley_teeth", "belt_pitch_mm", "motor_steps", "microsteps", "arm_radius_in")
+DELAY_MASK = 0xFFFF       # unsigned int on AVR
+
+# worker state: views into the parent's shared block
+_shm = None
+_takes = None
+
+
+# === 1. SHARED TAKES ===
+def pack_takes(csv_paths):
+    """
+    Reads the takes into one shared-memory block.
+
+    Returns:
+        tuple: (SharedMemory, layout), layout = [(name, offset, length)], each
+        take stored as 3 consecutive float64 rows (time, X, unwrapped RotX).
+    """
+    takes = []
+    for path in csv_paths:
+        times_s, lin_x, rot_x = blenderToArduino.load_take(path)
+        takes.append((os.path.basename(path), np.vstack((times_s, lin_x,
+                                                         motionEngine.unwrap_degrees(rot_x)))))
+    total = sum(block.size for _, block in takes)
+    shm = shared_memory.SharedMemory(create=True, size=max(total, 1) * 8)
+    flat = np.ndarray(total, dtype=np.float64, buffer=shm.buf)
+    layout = []
+    offset = 0
+    for name, block in takes:
+        flat[offset:offset + block.size] = block.ravel()
+        layout.append((name, offset, block.shape[1]))
+        offset += block.size
+    del flat
+    return shm, layout
+
+
+def _attach(shm_name, layout):
+    """Worker initializer: maps the shared block (no copy)."""
+    global _shm, _takes
+    _shm = shared_memory.SharedMemory(name=shm_name)
+    flat = np.ndarray(sum(3 * n for _, _, n in layout), dtype=np.float64, buffer=_shm.buf)
+    _takes = [(name, flat[offset:offset + 3 * n].reshape(3, n)) for name, offset, n in layout]
+
+
+# === 2. ONE COMBINATION ===
+def evaluate(combo, govern=False, step_limits=blenderToArduino.step_limits):
+    """Converts every shared take with one parameter combination; returns its metrics."""
+    steps_per_rev = combo["motor_steps"] * combo["microsteps"]
+    mm_per_step = combo["pulley_teeth"] * combo["belt_pitch_mm"] / steps_per_rev
+    deg_per_step = 360.0 / steps_per_rev
+    row = dict(combo, steps_per_rev=steps_per_rev, peak_rate_sps=0.0, peak_take=None,
+               min_delay_us=None, lin_error_mm=0.0, rot_error_deg=0.0, flash_bytes=0,
+               wrapped_delays=0, over_rate_limit=0)
+    for name, (times_s, lin_x, rot_x) in _takes:
+        if govern:
+            # governed positions are quantized as is, as in convert_take
+            lin_m, rot_deg = blenderToArduino.govern_positions(times_s, lin_x, rot_x,
+                                                               combo["arm_radius_in"])
+        else:
+            lin_m = motionEngine.sine_ease(lin_x, motionEngine.LIN_EASE_THRESHOLD_M)
+            rot_deg = motionEngine.sine_ease(rot_x, motionEngine.ROT_EASE_THRESHOLD_DEG)
+        lin_steps = motionEngine.m_to_steps(lin_m, combo["pulley_teeth"], combo["belt_pitch_mm"],
+                                            steps_per_rev)
+        rot_steps = motionEngine.deg_to_steps(rot_deg, steps_per_rev)
+        row["lin_error_mm"] = max(row["lin_error_mm"],
+                                  float(np.abs(lin_m * 1000 - lin_steps * mm_per_step).max()))
+        row["rot_error_deg"] = max(row["rot_error_deg"],
+                                   float(np.abs(rot_deg - rot_steps * deg_per_step).max()))
+
+        dt_s = np.diff(times_s)
+        flash = 0
+        for dof, steps in (("linX", lin_steps), ("rotX", rot_steps)):
+            deltas, delays = motionEngine.steps_to_segments(steps, times_s)
+            rates = segment_rates(deltas, dt_s)
+            peak = float(rates.max()) if len(rates) else 0.0
+            if peak > row["peak_rate_sps"]:
+                row["peak_rate_sps"], row["peak_take"] = peak, name
+            moving = delays[deltas != 0]
+            if len(moving):
+                shortest = int(moving.min())
+                row["min_delay_us"] = shortest if row["min_delay_us"] is None \
+                    else min(row["min_delay_us"], shortest)
+            row["wrapped_delays"] += int(np.count_nonzero(delays > DELAY_MASK))
+            row["over_rate_limit"] += int(np.count_nonzero(rates > step_limits[dof][0]))
+            try:
+                flash += encode_rle(deltas, delays, dt_s * 1e6).nbytes
+            except ValueError:       # a delta beyond int16: no PROGMEM table possible
+                flash = None
+                break
+        if flash is None or row["flash_bytes"] is None:
+            row["flash_bytes"] = None
+        else:
+            row["flash_bytes"] = max(row["flash_bytes"], flash)
+    return row
+
+
+def _evaluate_task(combo, govern):
+    return evaluate(combo, govern)
+
+
+# === 3. SWEEP ===
+def combinations(**ranges):
+    """Every combination of the given parameter values, as dicts."""
+    names = [name for name in PARAMETERS if name in ranges]
+    return [dict(zip(names, values)) for values in itertools.product(*(ranges[n] for n in names))]
+
+
+def run_sweep(csv_paths, combos, govern=False, workers=None):
+    """Evaluates `combos` over the takes, in parallel; rows in combination order."""
+    shm, layout = pack_takes(csv_paths)
+    try:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(combos)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(shm.name, layout)) as pool:
+            chunk = max(1, len(combos) // (4 * workers))
+            return list(pool.map(_evaluate_task, combos, itertools.repeat(govern),
+                                 chunksize=chunk))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parse_values(text, kind=float):
+    """"20,36" or "16:40:4" (inclusive) or a mix, e.g. "1,2,4:16:4"."""
+    values = []
+    for part in text.split(","):
+        if ":" in part:
+            start, stop, step = (float(x) for x in part.split(":"))
+            if step <= 0:
+                raise argparse.ArgumentTypeError(f"range step must be positive: {part}")
+            values.extend(start + step * np.arange(int(np.floor((stop - start) / step + 1e-9)) + 1))
+        else:
+            values.append(float(part))
+    return [kind(v) if kind is int else round(float(v), 9) for v in values]
+
+
+def print_table(rows, sort_key):
+    keyed = sorted(rows, key=lambda r: (r[sort_key] is None, r[sort_key]))
+    print(f"{'teeth':>5} {'pitch':>5} {'steps':>6} {'arm':>5}  {'peak steps/s':>12} "
+          f"{'min delay':>9} {'lin err mm':>10} {'rot err deg':>11} {'flash B':>8} "
+          f"{'wrapped':>7} {'>limit':>6}")
+    for r in keyed:
+        print(f"{r['pulley_teeth']:>5} {r['belt_pitch_mm']:>5g} {r['steps_per_rev']:>6} "
+              f"{r.get('arm_radius_in', blenderToArduino.arm_radius_in):>5g}  "
+              f"{r['peak_rate_sps']:>12.0f} {r['min_delay_us'] if r['min_delay_us'] is not None else '-':>9} "
+              f"{r['lin_error_mm']:>10.4f} {r['rot_error_deg']:>11.4f} "
+              f"{r['flash_bytes'] if r['flash_bytes'] is not None else '-':>8} "
+              f"{r['wrapped_delays']:>7} {r['over_rate_limit']:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep drive parameters over the recorded takes.")
+    parser.add_argument("inputs", nargs="*",
+                        help="CSV files, globs or directories (default: data/motion of the checkout)")
+    parser.add_argument("--pulley-teeth", type=lambda s: parse_values(s, int),
+                        default=[blenderToArduino.pulley_teeth])
+    parser.add_argument("--belt-pitch-mm", type=parse_values,
+                        default=[blenderToArduino.belt_pitch_mm])
+    parser.add_argument("--motor-steps", type=lambda s: parse_values(s, int), default=[200],
+                        help="full steps per motor revolution (default: 200)")
+    parser.add_argument("--microsteps", type=lambda s: parse_values(s, int),
+                        default=[blenderToArduino.steps_per_rev // 200])
+    parser.add_argument("--arm-radius-in", type=parse_values, default=None,
+                        help=f"tilt arm lengths, with --govern only "
+                             f"(default: {blenderToArduino.arm_radius_in})")
+    parser.add_argument("--govern", action="store_true",
+                        help="run the offline speed governor (per arm length) before converting")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sort", default="peak_rate_sps",
+                        choices=("peak_rate_sps", "min_delay_us", "lin_error_mm", "rot_error_deg",
+                                 "flash_bytes", "over_rate_limit"))
+    parser.add_argument("-o", "--output", help="also write the rows as JSON")
+    args = parser.parse_args(argv)
+    if args.arm_radius_in is not None and not args.govern:
+        parser.error("--arm-radius-in only changes the governed conversion; add --govern")
+    if not args.inputs:
+        try:
+            args.inputs = [checkout_path("data", "motion")]
+        except ValueError as exc:
+            parser.error(f"{exc}; name the takes to sweep over")
+
+    csv_paths, unmatched = expand_inputs(args.inputs)
+    for pattern in unmatched:
+        print(f"warning: no CSV files match '{pattern}'", file=sys.stderr)
+    if not csv_paths:
+        print("error: no takes to sweep over", file=sys.stderr)
+        return 2
+    ranges = dict(pulley_teeth=args.pulley_teeth, belt_pitch_mm=args.belt_pitch_mm,
+                  motor_steps=args.motor_steps, microsteps=args.microsteps)
+    if args.govern:
+        ranges["arm_radius_in"] = args.arm_radius_in or [blenderToArduino.arm_radius_in]
+    combos = combinations(**ranges)
+
+    start = time.perf_counter()
+    rows = run_sweep(csv_paths, combos, args.govern, args.workers)
+    elapsed = time.perf_counter() - start
+    print_table(rows, args.sort)
+    print(f"\n{len(combos)} combinations x {len(csv_paths)} takes in {elapsed:.2f} s")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"takes": csv_paths, "govern": args.govern, "results": rows}, f, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:02:47 2026
+
+@author: benjaminokoronkwo
+
+Timing emulator for the playback sketches.
+
+Predicts when every step of a generated profile is actually pulsed, under a
+model of the two ways the sketches play a profile:
+
+    "blocking"   motion_smoothing.ino / tilt1.ino: for every step, HIGH,
+                 delayMicroseconds(delay / 2), LOW, delayMicroseconds(delay / 2).
+                 The step takes 2 * (delay / 2) μs plus the cost of the two
+                 digitalWrites and the loop (step_overhead_us); every segment
+                 adds the direction write (segment_us).
+    "polling"    dual_motor.ino: loop() reads micros() once per pass and
+                 pulses an axis on the first pass whose reading is at least
+                 last reading + delay. A pass costs loop_us, a pass that
+                 pulses step_us more; micros() counts in resolution_us
+                 increments; moving on to the next segment costs one pass,
+                 so a zero-delta segment takes one pass (no time at all on
+                 the Blender scale).
+
+Both sketches hold delays in `unsigned int`, so delays above 65535 μs wrap,
+as they do on the board. Per axis the emulator reports the predicted step
+timestamps, the duration, the drift of every segment end against the
+Blender timeline and the sync error between axes.
+
+Everything is vectorized over steps. A polling pass is timed from the
+previous pulse, so the step times depend on each other only through where
+the pulse fell within the micros() tick, i.e. a phase with
+resolution / gcd(...) states (4 for whole-μs costs at 16 MHz). Each step is
+a map on those phases, and all steps are resolved together by composing the
+maps in log2(steps) rounds.
+
+Usage:
+    python -m buddy.playbackEmulator data/processed/tilt_x-axis_test7.txt --take data/motion/tilt_x-axis_test7.csv
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+STRATEGIES = ("polling", "blocking")
+CPU_HZ = 16_000_000
+
+# Estimates for a 16 MHz Uno (digitalWrite ≈ 3.5 μs, micros() ≈ 3.5 μs);
+# measure the rig and override them.
+LOOP_US = 10.0            # polling: one pass of loop() that pulses nothing
+STEP_US = 9.0             # polling: extra cost of a pass that pulses (2 digitalWrite + 2 μs)
+RESOLUTION_US = 4.0       # micros() increment
+STEP_OVERHEAD_US = 8.0    # blocking: 2 digitalWrite + loop per step, on top of the delays
+SEGMENT_US = 5.0          # blocking: direction write + abs() per segment
+
+DELAY_MASK = 0xFFFF       # unsigned int on AVR
+
+
+def _cycles(us, cpu_hz):
+    return int(round(us * cpu_hz / 1e6))
+
+
+def _segment_ends(step_times, counts):
+    """Time the last step of every segment fired (carried over zero segments, 0 before any)."""
+    ends = np.zeros(len(counts))
+    last = np.cumsum(counts) - 1
+    moving = counts > 0
+    ends[moving] = step_times[last[moving]]
+    index = np.where(moving, np.arange(len(counts)), -1)
+    index = np.maximum.accumulate(index)
+    return np.where(index >= 0, ends[np.maximum(index, 0)], 0.0)
+
+
+# === 1. BLOCKING PLAYBACK ===
+def blocking_step_times(delta_steps, delay_times_us, step_overhead_us=STEP_OVERHEAD_US,
+                        segment_us=SEGMENT_US):
+    """
+    Step times (μs, rising edges) of the delayMicroseconds(delay / 2) x 2 sketches.
+
+    Returns:
+        tuple: (step_us, segment_end_us), segment ends including the last step's delay.
+    """
+    counts = np.abs(np.asarray(delta_steps, dtype=np.int64))
+    delays = np.asarray(delay_times_us, dtype=np.int64) & DELAY_MASK
+    period = 2 * (delays // 2) + step_overhead_us
+    seg_time = segment_us + counts * period
+    seg_start = np.concatenate(([0.0], np.cumsum(seg_time)[:-1]))
+
+    segment = np.repeat(np.arange(len(counts)), counts)
+    k = np.arange(len(segment)) - np.repeat(np.cumsum(counts) - counts, counts)
+    step_us = seg_start[segment] + segment_us + k * period[segment]
+    return step_us, seg_start + seg_time
+
+
+# === 2. POLLING PLAYBACK ===
+def _compose_prefix(maps):
+    """maps[j] ∘ ... ∘ maps[0] for every j (Hillis-Steele scan over state maps)."""
+    comp = maps.copy()
+    offset = 1
+    while offset < len(comp):
+        comp[offset:] = np.take_along_axis(comp[offset:], comp[:-offset], axis=1)
+        offset *= 2
+    return comp
+
+
+def polling_step_times(delta_steps, delay_times_us, loop_us=LOOP_US, step_us=STEP_US,
+                       resolution_us=RESOLUTION_US, cpu_hz=CPU_HZ):
+    """
+    Step times (μs) of one axis of the micros()-polling sketch.
+
+    Other axes' pulses are not modelled; fold their average share into loop_us.
+
+    Returns:
+        tuple: (step_us, segment_end_us), a segment ending on its last pulse.
+    """
+    counts = np.abs(np.asarray(delta_steps, dtype=np.int64))
+    delays = np.asarray(delay_times_us, dtype=np.int64) & DELAY_MASK
+    n = int(counts.sum())
+    if n == 0:
+        return np.empty(0), np.zeros(len(counts))
+    L, s, r = _cycles(loop_us, cpu_hz), _cycles(step_us, cpu_hz), _cycles(resolution_us, cpu_hz)
+    if L <= 0 or r <= 0:
+        raise ValueError("loop cost and micros() resolution must be positive")
+
+    # a pulse needs reading >= last reading + delay, readings being multiples of r
+    segment = np.repeat(np.arange(len(counts)), counts)
+    quantized = r * np.ceil(delays[segment] * (cpu_hz / 1e6) / r).astype(np.int64)
+    # passes needed before a pulse: 1 inside a segment; 2 + skipped zero segments
+    # at a segment's first step (one pass loads each segment)
+    moving = np.flatnonzero(counts)
+    skipped = np.diff(moving, prepend=-1) - 1
+    min_passes = np.ones(n, dtype=np.int64)
+    min_passes[np.cumsum(counts[moving]) - counts[moving]] = 2 + skipped
+    min_passes[0] = skipped[0]        # setup() primes segment 0; passes start at t = 0
+
+    first = L * max(min_passes[0], -(-quantized[0] // L))
+    # phase = pulse time mod r; it only takes multiples of the gcd below
+    unit = math.gcd(math.gcd(r, L), s) if s else math.gcd(r, L)
+    phases = np.arange(r // unit) * unit
+    # after a pulse at f, passes start at f + s + m L; the next pulse is on the
+    # first m >= min_passes with f + s + m L >= (f - phase) + quantized delay
+    passes = np.maximum(min_passes[1:, None],
+                        -(-(quantized[1:, None] - phases - s) // L))
+    advance = s + passes * L                                  # (n - 1, states) cycles
+    maps = ((phases + advance) % r // unit).astype(np.int16)
+
+    start = (first % r) // unit
+    state = np.concatenate(([start], _compose_prefix(maps)[:-1, start])) if n > 1 else [start]
+    gaps = advance[np.arange(n - 1), state[:n - 1]] if n > 1 else np.empty(0, np.int64)
+    pulses = first + np.concatenate(([0], np.cumsum(gaps)))
+    step_times = pulses * (1e6 / cpu_hz)
+    return step_times, _segment_ends(step_times, counts)
+
+
+# === 3. REPORT ===
+def emulate(results_by_dof, strategy="polling", times_s=None, loop_us=LOOP_US, step_us=STEP_US,
+            resolution_us=RESOLUTION_US, step_overhead_us=STEP_OVERHEAD_US,
+            segment_us=SEGMENT_US, cpu_hz=CPU_HZ):
+    """
+    Predicts how a sketch plays a profile.
+
+    Args:
+        results_by_dof (dict): {dof_name: (delta_steps, delay_times_us)}.
+        strategy (str): "polling" (dual_motor) or "blocking" (motion_smoothing, tilt1).
+        times_s (array-like | None): Blender sample times of the take (one
+            more than segments). None uses the timeline the profile asks
+            for: every segment lasts |delta| * delay of its slowest axis.
+        loop_us, step_us, resolution_us, step_overhead_us, segment_us, cpu_hz:
+            The playback model, see the module docstring.
+
+    Returns:
+        dict: step_us {dof: step timestamps}, duration_s, drift_us {dof:
+        segment end - Blender time per segment}, max_drift_us and
+        final_drift_us {dof}, sync_error_us (largest spread of the axes'
+        drifts at a segment end; axes that never move are left out),
+        wrapped_delays {dof: delays > 65535}.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}' (expected one of {', '.join(STRATEGIES)})")
+    if times_s is not None:
+        times_s = np.asarray(times_s, dtype=np.float64)
+        ideal_end = (times_s[1:] - times_s[0]) * 1e6
+    else:
+        ideal_end = np.cumsum(np.max([np.abs(np.asarray(d, np.float64)) * np.asarray(t, np.float64)
+                                      for d, t in results_by_dof.values()], axis=0))
+
+    step_times, drift, wrapped = {}, {}, {}
+    for name, (deltas, delays) in results_by_dof.items():
+        if strategy == "blocking":
+            steps, ends = blocking_step_times(deltas, delays, step_overhead_us, segment_us)
+        else:
+            steps, ends = polling_step_times(deltas, delays, loop_us, step_us, resolution_us, cpu_hz)
+        step_times[name] = steps
+        drift[name] = ends - ideal_end if len(steps) else np.zeros(len(ideal_end))
+        wrapped[name] = int(np.count_nonzero(np.asarray(delays, dtype=np.int64) > DELAY_MASK))
+
+    # an axis that never moves has no timing to drift
+    drifts = np.array([d for name, d in drift.items() if len(step_times[name])])
+    return {
+        "strategy": strategy,
+        "step_us": step_times,
+        "duration_s": max((float(t[-1]) for t in step_times.values() if len(t)), default=0.0) / 1e6,
+        "drift_us": drift,
+        "max_drift_us": {name: float(np.abs(d).max()) if len(d) else 0.0 for name, d in drift.items()},
+        "final_drift_us": {name: float(d[-1]) if len(d) else 0.0 for name, d in drift.items()},
+        "sync_error_us": float((drifts.max(axis=0) - drifts.min(axis=0)).max()) if drifts.size else 0.0,
+        "wrapped_delays": wrapped,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Predict how the sketches time a profile.")
+    parser.add_argument("profile", help="profile in any form read by profileFormat")
+    parser.add_argument("--take", help="Blender CSV of the take, for drift against its timeline")
+    parser.add_argument("--loop-us", type=float, default=LOOP_US)
+    parser.add_argument("--step-us", type=float, default=STEP_US)
+    parser.add_argument("--resolution-us", type=float, default=RESOLUTION_US)
+    args = parser.parse_args()
+
+    from .profileFormat import read_profile
+    profile = read_profile(args.profile)
+    times_s = None
+    if args.take:
+        from .csvIngest import read_columns
+        times_s = read_columns(args.take, ["Time (s)"])["Time (s)"]
+    for strategy in STRATEGIES:
+        start = time.perf_counter()
+        report = emulate(profile, strategy, times_s, args.loop_us, args.step_us, args.resolution_us)
+        elapsed = time.perf_counter() - start
+        print(f"{strategy:>8}: {report['duration_s']:.3f} s, sync error "
+              f"{report['sync_error_us'] / 1000:.2f} ms ({elapsed * 1000:.1f} ms to emulate)")
+        for name in profile:
+            print(f"          {name}: final drift {report['final_drift_us'][name] / 1000:+.2f} ms, "
+                  f"max {report['max_drift_us'][name] / 1000:.2f} ms, "
+                  f"{report['wrapped_delays'][name]} wrapped delays")
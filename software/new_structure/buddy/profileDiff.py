@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:05:36 2026
+
+@author: benjaminokoronkwo
+
+Profile diff and golden-set regression gate.
+
+Loads two profiles in any form (.txt, .bdyp, PROGMEM .h via
+profileFormat.read_profile, or a _ticks.h tick profile) and compares them
+axis by axis as they would be played: every segment takes |delta| * delay μs
+(a dwell, delta 0, takes its delay), and every step happens at the end of
+its delay. Per axis it reports
+
+    position_steps     largest difference in motor position at any instant
+    final_steps        difference in end position
+    timing_us          largest difference in the time of the k-th step
+    rate_sps           largest step-rate change of the k-th step
+    step_count_diff    steps one profile takes more than the other
+    first_segment      first segment whose (delta, delay) differ, or None
+
+all from whole-array NumPy operations on the expanded step times.
+
+Given two directories, every profile of the golden one is compared with
+the file of the same name in the other, against tolerances (default: exact)
+and a time budget, and the exit status says whether the corpus passed.
+data/golden is the default conversion of data/motion; regenerate it (the
+first command with -o ../../data/golden) only with a change meant to alter
+the output, along with CONVERTER_VERSION. From software/new_structure:
+
+    python -m buddy.buddyConvert ../../data/motion -o /tmp/candidate --no-cache
+    python -m buddy.profileDiff ../../data/golden /tmp/candidate --budget-s 10
+
+data/processed holds exports of the old dataconverter scripts, not a golden
+set; their Lin / Rot axes are read as linX / rotX so single files compare.
+
+Usage:
+    python -m buddy.profileDiff ../../data/golden/tilt_test7.txt /tmp/candidate/tilt_test7.bdyp
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from .profileFormat import read_profile
+from .stepSchedule import axis_step_times
+
+PROFILE_PATTERNS = ("*.txt", "*.bdyp", "*.h")
+TOLERANCES = {"position_steps": 0, "timing_us": 0.0, "rate_sps": 0.0}
+LEGACY_AXES = {"Lin": "linX", "Rot": "rotX"}     # dataconverter_tilt_x-axis.py names
+
+
+# === LOADING ===
+def load_profile(path):
+    """
+    {dof_name: (int64 deltas, float64 delays in μs)} of a profile in any form
+    (legacy axis names mapped through LEGACY_AXES).
+    """
+    from . import tickProfile
+    if tickProfile.is_tick_profile(path):
+        tick_us = tickProfile.read_stats(path)["tick_us"]
+        tables = tickProfile.read_tick_profile(path)
+        return {name: (steps, ticks * tick_us) for name, (steps, ticks) in tables.items()}
+    results_by_dof = read_profile(path)
+    if not results_by_dof:
+        raise ValueError(f"{path}: no profile arrays found")
+    return {LEGACY_AXES.get(name, name): (np.asarray(deltas, np.int64),
+                                          np.asarray(delays, np.float64))
+            for name, (deltas, delays) in results_by_dof.items()}
+
+
+# === ONE AXIS ===
+def playback_steps(delta_steps, delay_times_us):
+    """
+    Time, position after, and rate of every step of one axis.
+
+    Returns:
+        tuple: (step_us float64, position int64, rate_sps float64), one entry per step.
+    """
+    deltas = np.asarray(delta_steps, dtype=np.int64)
+    delays = np.asarray(delay_times_us, dtype=np.float64)
+    duration = np.where(deltas != 0, np.abs(deltas) * delays, delays)
+    start = np.cumsum(duration) - duration
+    step_us, forward = axis_step_times(deltas, delays, start)
+    position = np.cumsum(np.where(forward, 1, -1))
+    segment_delay = np.repeat(delays, np.abs(deltas))
+    with np.errstate(divide="ignore"):
+        rate = np.where(segment_delay > 0, 1e6 / segment_delay, np.inf)
+    return step_us, position, rate
+
+
+def _position_at(step_us, position, t):
+    """Position of a playback at times `t` (steps at exactly t included)."""
+    return np.concatenate(([0], position))[np.searchsorted(step_us, t, side="right")]
+
+
+def diff_axis(a, b):
+    """
+    Compares one axis of two profiles.
+
+    Args:
+        a, b (tuple): (delta_steps, delay_times_us) each.
+
+    Returns:
+        dict: segments, steps, position_steps, final_steps, timing_us,
+        rate_sps, step_count_diff, first_segment, first_time_us.
+    """
+    (da, wa), (db, wb) = ((np.asarray(d, np.int64), np.asarray(w, np.float64)) for d, w in (a, b))
+    n = min(len(da), len(db))
+    differs = np.flatnonzero((da[:n] != db[:n]) | (wa[:n] != wb[:n]))
+    first = int(differs[0]) if len(differs) else (n if len(da) != len(db) else None)
+    report = {"segments": (len(da), len(db)), "steps": (int(np.abs(da).sum()), int(np.abs(db).sum())),
+              "position_steps": 0, "final_steps": int(da.sum() - db.sum()), "timing_us": 0.0,
+              "rate_sps": 0.0, "step_count_diff": int(np.abs(da).sum() - np.abs(db).sum()),
+              "first_segment": first, "first_time_us": None}
+    if first is None:
+        return report      # identical arrays: nothing else can differ
+
+    prefix = np.where(da[:first] != 0, np.abs(da[:first]) * wa[:first], wa[:first])
+    report["first_time_us"] = float(prefix.sum())
+    # the segments before `first` are shared: both playbacks are the same up to
+    # there and continue from the same time and position, so only the rest is expanded
+    ta, pa, ra = playback_steps(da[first:], wa[first:])
+    tb, pb, rb = playback_steps(db[first:], wb[first:])
+    # both positions are step functions: the largest gap is at a step of one of
+    # them (after every step at that instant: zero delays put several at once)
+    for t in (ta, tb):
+        if len(t):
+            gap = np.abs(_position_at(ta, pa, t) - _position_at(tb, pb, t)).max()
+            report["position_steps"] = max(report["position_steps"], int(gap))
+    k = min(len(ta), len(tb))
+    if k:
+        report["timing_us"] = float(np.abs(ta[:k] - tb[:k]).max())
+        same = ra[:k] == rb[:k]         # also inf == inf
+        with np.errstate(invalid="ignore"):
+            report["rate_sps"] = float(np.where(same, 0.0, np.abs(ra[:k] - rb[:k])).max())
+    return report
+
+
+# === PROFILES ===
+def diff_profiles(path_a, path_b):
+    """{axis: diff_axis report}; an axis present in only one profile maps to None."""
+    a, b = load_profile(path_a), load_profile(path_b)
+    return {name: diff_axis(a[name], b[name]) if name in a and name in b else None
+            for name in list(a) + [n for n in b if n not in a]}
+
+
+def failures(reports, tolerances=TOLERANCES):
+    """Human-readable reasons `reports` (from diff_profiles) exceed the tolerances."""
+    reasons = []
+    for name, r in reports.items():
+        axis = name or "(unnamed)"
+        if r is None:
+            reasons.append(f"{axis}: axis missing from one profile")
+            continue
+        if r["step_count_diff"]:
+            reasons.append(f"{axis}: {r['step_count_diff']:+d} steps")
+        if r["position_steps"] > tolerances["position_steps"]:
+            reasons.append(f"{axis}: position off by up to {r['position_steps']} steps")
+        if r["timing_us"] > tolerances["timing_us"]:
+            reasons.append(f"{axis}: steps moved by up to {r['timing_us']:.1f} us")
+        if r["rate_sps"] > tolerances["rate_sps"]:
+            reasons.append(f"{axis}: step rate changed by up to {r['rate_sps']:.0f} steps/s")
+    return reasons
+
+
+def print_report(reports):
+    for name, r in reports.items():
+        if r is None:
+            print(f"{name or '(unnamed)'}: only in one profile")
+            continue
+        if r["first_segment"] is None:
+            print(f"{name or '(unnamed)'}: identical ({r['segments'][0]} segments)")
+            continue
+        print(f"{name or '(unnamed)'}: segments {r['segments'][0]} vs {r['segments'][1]}, "
+              f"steps {r['steps'][0]} vs {r['steps'][1]}, first divergent segment "
+              f"{r['first_segment']} (at {r['first_time_us'] / 1000:.1f} ms)")
+        print(f"  position up to {r['position_steps']} steps apart (end {r['final_steps']:+d}), "
+              f"timing up to {r['timing_us']:.1f} us, step rate up to {r['rate_sps']:.0f} steps/s")
+
+
+# === GOLDEN-SET GATE ===
+def gate(golden_dir, candidate_dir, tolerances=TOLERANCES, budget_s=None, log=print):
+    """
+    Compares every profile of `golden_dir` with its namesake in `candidate_dir`.
+
+    Returns:
+        dict: checked, failed ({name: reasons}), missing (golden files without
+        a candidate), extra (candidates without a golden file), elapsed_s,
+        over_budget (the budget ran out before every file was checked).
+    """
+    def profiles(folder):
+        return {os.path.basename(p) for pattern in PROFILE_PATTERNS
+                for p in glob.glob(os.path.join(folder, pattern))}
+
+    golden, candidates = profiles(golden_dir), profiles(candidate_dir)
+    result = {"checked": 0, "failed": {}, "missing": sorted(golden - candidates),
+              "extra": sorted(candidates - golden), "elapsed_s": 0.0, "over_budget": False}
+    start = time.perf_counter()
+    for name in sorted(golden & candidates):
+        if budget_s is not None and time.perf_counter() - start > budget_s:
+            result["over_budget"] = True
+            break
+        try:
+            reasons = failures(diff_profiles(os.path.join(golden_dir, name),
+                                             os.path.join(candidate_dir, name)), tolerances)
+        except (OSError, ValueError) as exc:
+            reasons = [f"{type(exc).__name__}: {exc}"]
+        result["checked"] += 1
+        if reasons:
+            result["failed"][name] = reasons
+            log(f"FAIL {name}: " + "; ".join(reasons))
+    result["elapsed_s"] = time.perf_counter() - start
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare two profiles, or gate a folder of profiles against a golden one.")
+    parser.add_argument("golden", help="profile, or folder of golden profiles")
+    parser.add_argument("candidate", help="profile, or folder of profiles to check")
+    parser.add_argument("--max-position-steps", type=int, default=TOLERANCES["position_steps"])
+    parser.add_argument("--max-timing-us", type=float, default=TOLERANCES["timing_us"])
+    parser.add_argument("--max-rate-sps", type=float, default=TOLERANCES["rate_sps"])
+    parser.add_argument("--budget-s", type=float, default=None,
+                        help="fail if checking the folder takes longer than this")
+    parser.add_argument("--json", metavar="PATH", help="also write the result as JSON")
+    args = parser.parse_args(argv)
+    tolerances = {"position_steps": args.max_position_steps, "timing_us": args.max_timing_us,
+                  "rate_sps": args.max_rate_sps}
+
+    if not (os.path.isdir(args.golden) and os.path.isdir(args.candidate)):
+        reports = diff_profiles(args.golden, args.candidate)
+        print_report(reports)
+        reasons = failures(reports, tolerances)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({"reports": reports, "failures": reasons}, f, indent=1)
+        return 1 if reasons else 0
+
+    result = gate(args.golden, args.candidate, tolerances, args.budget_s)
+    for name in result["missing"]:
+        print(f"MISSING {name}")
+    print(f"\n{result['checked'] - len(result['failed'])}/{result['checked']} profiles match "
+          f"in {result['elapsed_s']:.2f} s ({len(result['missing'])} missing, "
+          f"{len(result['extra'])} not in the golden set)")
+    if result["over_budget"]:
+        print(f"error: over the {args.budget_s:g} s budget before every profile was checked",
+              file=sys.stderr)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=1)
+    return 1 if result["failed"] or result["missing"] or result["over_budget"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
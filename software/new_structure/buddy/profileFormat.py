@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:41:09 2026
+
+@author: benjaminokoronkwo
+
+Binary motion-profile format (.bdyp) and readers for both profile forms.
+
+Layout (all little-endian, every array 8-byte aligned):
+
+    header      32 B   magic "BDYP", version u16, n_axes u16, data_length u32,
+                       flags u32, reserved
+    axis table  32 B   per axis: name (16 B ASCII), delta type code u8,
+                       delay type code u8, reserved, delta offset u32,
+                       delay offset u32
+    data               per axis: int16 deltas, then uint16 or uint32 delays
+
+Type codes are the item size in bytes (deltas: 2 = int16; delays: 2 = uint16,
+4 = uint32). Readers return numpy.memmap views, so a profile can be opened
+without parsing or copying it.
+
+Usage:
+    python -m buddy.profileFormat data/processed/tilt_x-axis_test7.txt /tmp/tilt7.bdyp
+    python -m buddy.profileFormat /tmp/tilt7.bdyp /tmp/tilt7.txt
+"""
+
+import os
+import re
+import sys
+
+import numpy as np
+
+MAGIC = b"BDYP"
+FORMAT_VERSION = 1
+BINARY_EXTENSION = ".bdyp"
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S4"),
+    ("version", "<u2"),
+    ("n_axes", "<u2"),
+    ("data_length", "<u4"),
+    ("flags", "<u4"),
+    ("reserved", "V16"),
+])
+AXIS_DTYPE = np.dtype([
+    ("name", "S16"),
+    ("delta_type", "u1"),
+    ("delay_type", "u1"),
+    ("reserved", "V6"),
+    ("delta_offset", "<u4"),
+    ("delay_offset", "<u4"),
+])
+DELTA_DTYPES = {2: np.dtype("<i2")}
+DELAY_DTYPES = {2: np.dtype("<u2"), 4: np.dtype("<u4")}
+
+
+def _align(offset, alignment=8):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+# === BINARY WRITER ===
+def write_profile_binary(path, results_by_dof):
+    """
+    Writes {dof_name: (delta_steps, delay_times_us)} as a .bdyp profile.
+
+    Delays are stored as uint16 when they all fit, otherwise uint32.
+
+    Raises:
+        ValueError: if axes differ in length, a name is too long, or a delta
+            does not fit in int16.
+    """
+    axes = []
+    data_length = None
+    for name, (deltas, delays) in results_by_dof.items():
+        deltas = np.asarray(deltas)
+        delays = np.asarray(delays)
+        if data_length is None:
+            data_length = len(deltas)
+        if len(deltas) != data_length or len(delays) != data_length:
+            raise ValueError(f"axis '{name}': all axes must have dataLength = {data_length}")
+        if len(name.encode("ascii")) > 16:
+            raise ValueError(f"axis name '{name}' longer than 16 bytes")
+        if len(deltas) and (deltas.min() < -32768 or deltas.max() > 32767):
+            raise ValueError(f"axis '{name}': delta steps out of int16 range "
+                             f"({deltas.min()} .. {deltas.max()})")
+        if len(delays) and (delays.min() < 0 or delays.max() > 0xFFFFFFFF):
+            raise ValueError(f"axis '{name}': delays out of uint32 range")
+        delay_type = 2 if not len(delays) or delays.max() <= 0xFFFF else 4
+        axes.append((name, deltas.astype(DELTA_DTYPES[2]), delays.astype(DELAY_DTYPES[delay_type])))
+    data_length = data_length or 0
+
+    header = np.zeros(1, HEADER_DTYPE)
+    header["magic"] = MAGIC
+    header["version"] = FORMAT_VERSION
+    header["n_axes"] = len(axes)
+    header["data_length"] = data_length
+
+    table = np.zeros(len(axes), AXIS_DTYPE)
+    offset = HEADER_DTYPE.itemsize + AXIS_DTYPE.itemsize * len(axes)
+    for i, (name, deltas, delays) in enumerate(axes):
+        offset = _align(offset)
+        table[i]["name"] = name.encode("ascii")
+        table[i]["delta_type"] = deltas.itemsize
+        table[i]["delay_type"] = delays.itemsize
+        table[i]["delta_offset"] = offset
+        offset = _align(offset + deltas.nbytes)
+        table[i]["delay_offset"] = offset
+        offset += delays.nbytes
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(header.tobytes())
+        f.write(table.tobytes())
+        for entry, (_, deltas, delays) in zip(table, axes):
+            for arr, off in ((deltas, entry["delta_offset"]), (delays, entry["delay_offset"])):
+                f.write(b"\0" * (int(off) - f.tell()))
+                f.write(arr.tobytes())
+
+
+# === BINARY READER ===
+def read_header(path):
+    """Returns (header record, axis table) of a .bdyp file."""
+    header = np.fromfile(path, HEADER_DTYPE, count=1)
+    if len(header) != 1 or header["magic"][0] != MAGIC:
+        raise ValueError(f"{path}: not a BUDDY binary profile")
+    if header["version"][0] > FORMAT_VERSION:
+        raise ValueError(f"{path}: format version {header['version'][0]} is newer than "
+                         f"this reader ({FORMAT_VERSION})")
+    table = np.fromfile(path, AXIS_DTYPE, count=int(header["n_axes"][0]),
+                        offset=HEADER_DTYPE.itemsize)
+    return header[0], table
+
+
+def read_profile_binary(path):
+    """
+    Memory-maps a .bdyp profile.
+
+    Returns:
+        dict[str, tuple[np.memmap, np.memmap]]: {dof_name: (delta_steps, delay_times_us)}
+    """
+    header, table = read_header(path)
+    n = int(header["data_length"])
+    results_by_dof = {}
+    for entry in table:
+        name = entry["name"].decode("ascii")
+        if n == 0:
+            results_by_dof[name] = (np.empty(0, DELTA_DTYPES[2]), np.empty(0, DELAY_DTYPES[2]))
+            continue
+        deltas = np.memmap(path, DELTA_DTYPES[int(entry["delta_type"])], "r",
+                           offset=int(entry["delta_offset"]), shape=(n,))
+        delays = np.memmap(path, DELAY_DTYPES[int(entry["delay_type"])], "r",
+                           offset=int(entry["delay_offset"]), shape=(n,))
+        results_by_dof[name] = (deltas, delays)
+    return results_by_dof
+
+
+# === TEXT (C HEADER) READER ===
+_ARRAY_RE = re.compile(r"(deltaSteps|delayTimes)(\w*)\s*\[[^\]]*\]\s*=\s*\{([^}]*)\}")
+
+
+def read_profile_text(path):
+    """
+    Parses a .txt profile written by export_dof_arrays (or the older
+    dataconverter_* scripts) back into arrays.
+
+    Returns:
+        dict[str, tuple[np.ndarray, np.ndarray]]: {dof_name: (int64 deltas, int64 delays)};
+        the old single-axis files use the name "".
+    """
+    with open(path, "r") as f:
+        text = f.read()
+    arrays = {}
+    for kind, name, body in _ARRAY_RE.findall(text):
+        values = np.array(body.replace(",", " ").split(), dtype=np.int64)
+        arrays.setdefault(name, {})[kind] = values
+    results_by_dof = {}
+    for name, pair in arrays.items():
+        if set(pair) != {"deltaSteps", "delayTimes"}:
+            raise ValueError(f"{path}: axis '{name}' is missing deltaSteps or delayTimes")
+        results_by_dof[name] = (pair["deltaSteps"], pair["delayTimes"])
+    return results_by_dof
+
+
+def read_profile(path):
+    """Loads a profile in any form (.txt, .bdyp or PROGMEM .h), chosen by file contents."""
+    with open(path, "rb") as f:
+        is_binary = f.read(4) == MAGIC
+    if is_binary:
+        return read_profile_binary(path)
+    from .progmemFormat import is_progmem_profile, read_profile_progmem
+    if is_progmem_profile(path):
+        return read_profile_progmem(path)
+    return read_profile_text(path)
+
+
+# === CONVERTER ===
+def convert(src, dst):
+    """Converts between the .txt, .bdyp and PROGMEM .h forms (target taken from `dst`)."""
+    results_by_dof = read_profile(src)
+    if dst.endswith(BINARY_EXTENSION):
+        write_profile_binary(dst, results_by_dof)
+    elif dst.endswith(".h"):
+        from .progmemFormat import write_profile_progmem
+        write_profile_progmem(dst, results_by_dof)
+    else:
+        from .blenderToArduino import write_profile
+        write_profile(dst, results_by_dof)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(f"usage: {sys.argv[0]} SRC DST   (.txt, {BINARY_EXTENSION} or .h)")
+    convert(sys.argv[1], sys.argv[2])
+    print(f"Converted {sys.argv[1]} → {sys.argv[2]}")
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:40:15 2026
+
+@author: benjaminokoronkwo
+
+Run-length encoded PROGMEM profiles (.h) for AVR boards.
+
+The plain .txt profiles are mostly repetition (long runs of 0 deltas, and of
+identical (delta, delay) pairs on constant-speed stretches), and their
+`int` / `unsigned int` arrays are copied into SRAM at boot, which caps a take
+at a few hundred segments. This form stores each axis as a table of
+
+    {count, delta, delay}     repeat the segment (delta, delay) `count` times
+
+records in flash (PROGMEM), each field as narrow as the axis allows. A
+segment with delta 0 is a dwell: the decoder waits `delay` μs. Runs of
+zero-motion segments are merged into dwell records that carry the time they
+actually span (when segment durations are given), so the sketch no longer
+skips through pauses in zero time.
+
+The generated header contains the tables and a small decoder, rleNext(),
+that walks a table one segment at a time:
+
+    RleCursor c = {0, 0};
+    int16_t delta; uint32_t delay;
+    while (rleNext(rlerotX, rleLengthrotX, c, delta, delay)) { ... }
+
+Usage:
+    python -m buddy.progmemFormat data/processed/tilt_x-axis_test7.txt /tmp/tilt7.h
+"""
+
+import os
+import re
+import sys
+
+import numpy as np
+
+PROGMEM_EXTENSION = ".h"
+MARKER = "// BUDDY RLE profile"
+
+DWELL_DELAY_MAX = 0xFFFF        # dwell records are split so their delays stay uint16
+CURSOR_SRAM_BYTES = 4           # RleCursor per axis
+PLAIN_SEGMENT_BYTES = 4         # int + unsigned int per segment on AVR
+
+# Field widths are picked per axis; AVR structs are unpadded, so a record is
+# exactly count + delta + delay bytes (3 .. 8 B).
+C_TYPES = {("u", 1): "uint8_t", ("i", 1): "int8_t", ("u", 2): "uint16_t",
+           ("i", 2): "int16_t", ("u", 4): "uint32_t"}
+
+DECODER = r"""#ifndef BUDDY_RLE_DECODER
+#define BUDDY_RLE_DECODER
+#include <avr/pgmspace.h>
+
+template <typename Count, typename Delta, typename Delay>
+struct RleRecord { Count count; Delta delta; Delay delay; };
+struct RleCursor { uint16_t record; uint16_t left; };
+
+inline uint16_t rleRead(const uint8_t *p)  { return pgm_read_byte(p); }
+inline int16_t  rleRead(const int8_t *p)   { return (int8_t)pgm_read_byte(p); }
+inline uint16_t rleRead(const uint16_t *p) { return pgm_read_word(p); }
+inline int16_t  rleRead(const int16_t *p)  { return (int16_t)pgm_read_word(p); }
+inline uint32_t rleRead(const uint32_t *p) { return pgm_read_dword(p); }
+
+// Next (delta, delay) segment of a PROGMEM table; false once it is exhausted.
+// delta == 0 means "wait delay microseconds".
+template <typename Record>
+bool rleNext(const Record *table, uint16_t length, RleCursor &c,
+             int16_t &delta, uint32_t &delay) {
+  while (c.left == 0) {
+    if (c.record >= length) return false;
+    c.left = rleRead(&table[c.record++].count);
+  }
+  c.left--;
+  delta = rleRead(&table[c.record - 1].delta);
+  delay = rleRead(&table[c.record - 1].delay);
+  return true;
+}
+#endif
+"""
+
+
+def record_dtype(count_bytes, delta_bytes, delay_bytes):
+    """Packed little-endian record layout for the given field widths."""
+    return np.dtype([("count", f"<u{count_bytes}"), ("delta", f"<i{delta_bytes}"),
+                     ("delay", f"<u{delay_bytes}")])
+
+
+def record_c_type(dtype):
+    fields = [dtype.fields[name][0] for name in ("count", "delta", "delay")]
+    return "RleRecord<" + ", ".join(C_TYPES[(f.kind, f.itemsize)] for f in fields) + ">"
+
+
+# === ENCODER ===
+def _split_counts(counts, limit):
+    """Splits run lengths above `limit`; returns (run index per piece, piece counts)."""
+    pieces = (counts + limit - 1) // limit
+    run = np.repeat(np.arange(len(counts)), pieces)
+    first_piece = np.repeat(np.cumsum(pieces) - pieces, pieces)
+    piece = np.arange(len(run)) - first_piece
+    return run, np.minimum(counts[run] - piece * limit, limit)
+
+
+def encode_rle(delta_steps, delay_times_us, segment_us=None):
+    """
+    Run-length encodes one axis.
+
+    Args:
+        delta_steps, delay_times_us (array-like): The axis' segments.
+        segment_us (array-like | None): Duration of every segment in μs
+            (e.g. np.diff(times) * 1e6). Zero-motion runs become dwell
+            records of that total length; without it they keep delay 0 and
+            decode back to the original arrays.
+
+    Returns:
+        np.ndarray: Records with fields count, delta, delay, each field as
+        narrow as this axis allows (see record_dtype).
+
+    Raises:
+        ValueError: if a delta does not fit in int16 or a delay in uint32.
+    """
+    deltas = np.asarray(delta_steps, dtype=np.int64)
+    delays = np.asarray(delay_times_us, dtype=np.int64)
+    n = len(deltas)
+    if n and (deltas.min() < -32768 or deltas.max() > 32767):
+        raise ValueError(f"delta steps out of int16 range ({deltas.min()} .. {deltas.max()})")
+    if n and (delays.min() < 0 or delays.max() > 0xFFFFFFFF):
+        raise ValueError("delays out of uint32 range")
+
+    dwell = deltas == 0
+    key_delay = np.where(dwell, 0, delays)   # every zero segment joins the same dwell run
+    change = np.ones(n, dtype=bool)
+    change[1:] = (deltas[1:] != deltas[:-1]) | (key_delay[1:] != key_delay[:-1])
+    starts = np.flatnonzero(change)
+    counts = np.diff(np.append(starts, n))
+    run_delta = deltas[starts]
+    run_delay = key_delay[starts]
+
+    if segment_us is not None and n:
+        # dwell run of D μs → k records of round(D / k) μs, each delay <= DWELL_DELAY_MAX
+        dwell_us = np.add.reduceat(np.where(dwell, np.asarray(segment_us, np.float64), 0.0),
+                                   starts)
+        dwell_runs = run_delta == 0
+        counts = np.where(dwell_runs, np.maximum(1, np.ceil(dwell_us / DWELL_DELAY_MAX)),
+                          counts).astype(np.int64)
+        run_delay = np.where(dwell_runs, np.rint(dwell_us / counts), run_delay).astype(np.int64)
+
+    delta_bytes = 1 if not n or (deltas.min() >= -128 and deltas.max() <= 127) else 2
+    delay_bytes = 2 if not len(run_delay) or run_delay.max() <= 0xFFFF else 4
+
+    def table_bytes(count_bytes):
+        pieces = -(-counts // (2 ** (8 * count_bytes) - 1))
+        return int(pieces.sum()) * (count_bytes + delta_bytes + delay_bytes)
+
+    # uint8 counts split long runs more often but save a byte on every record
+    count_bytes = 1 if table_bytes(1) <= table_bytes(2) else 2
+    run, piece_counts = _split_counts(counts, 2 ** (8 * count_bytes) - 1)
+    records = np.empty(len(run), record_dtype(count_bytes, delta_bytes, delay_bytes))
+    records["count"] = piece_counts
+    records["delta"] = run_delta[run]
+    records["delay"] = run_delay[run]
+    return records
+
+
+def decode_rle(records):
+    """Expands records back into (int64 deltas, int64 delays)."""
+    counts = records["count"].astype(np.int64)
+    return (np.repeat(records["delta"].astype(np.int64), counts),
+            np.repeat(records["delay"].astype(np.int64), counts))
+
+
+def memory_report(results_by_dof, records_by_dof):
+    """
+    AVR memory use of the plain arrays vs. the PROGMEM tables.
+
+    Returns:
+        dict: segments, records, plain_sram (bytes the .txt arrays take in
+        SRAM), flash (bytes of the tables), sram (decoder cursors) and ratio.
+    """
+    segments = sum(len(deltas) for deltas, _ in results_by_dof.values())
+    flash = sum(records.nbytes for records in records_by_dof.values())
+    plain = segments * PLAIN_SEGMENT_BYTES
+    return {
+        "segments": segments,
+        "records": sum(len(records) for records in records_by_dof.values()),
+        "plain_sram": plain,
+        "flash": flash,
+        "sram": CURSOR_SRAM_BYTES * len(records_by_dof),
+        "ratio": plain / flash if flash else 0.0,
+    }
+
+
+# === WRITER ===
+def write_profile_progmem(path, results_by_dof, segment_us=None):
+    """
+    Writes {dof_name: (delta_steps, delay_times_us)} as a PROGMEM header.
+
+    Args:
+        segment_us (array-like | None): Per-segment durations, shared by all
+            axes (see encode_rle).
+
+    Returns:
+        dict: The memory_report of the written profile.
+    """
+    records_by_dof = {name: encode_rle(deltas, delays, segment_us)
+                      for name, (deltas, delays) in results_by_dof.items()}
+    for name, records in records_by_dof.items():
+        if len(records) > 0xFFFF:
+            raise ValueError(f"axis '{name}': {len(records)} records exceed the uint16 table length")
+    report = memory_report(results_by_dof, records_by_dof)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        f.write(f"{MARKER}: segments={report['segments']} records={report['records']} "
+                f"plain_sram={report['plain_sram']} flash={report['flash']} "
+                f"sram={report['sram']}\n")
+        f.write(f"// {report['flash']} B of flash vs {report['plain_sram']} B of SRAM for the "
+                f"plain arrays ({report['ratio']:.1f}x)\n\n")
+        f.write(DECODER)
+        for name, records in records_by_dof.items():
+            body = ",\n  ".join(f"{{{c}, {d}, {t}}}" for c, d, t in records.tolist())
+            f.write(f"\n// --- {name} axis ---\n")
+            f.write(f"const uint16_t rleLength{name} = {len(records)};\n")
+            f.write(f"const {record_c_type(records.dtype)} rle{name}[] PROGMEM = {{\n  {body}\n}};\n")
+    return report
+
+
+# === READERS ===
+_STATS_RE = re.compile(r"(\w+)=(\d+)")
+_TABLE_RE = re.compile(r"RleRecord<[^>]*>\s+rle(\w*)\[\]\s*PROGMEM\s*=\s*\{(.*?)\};", re.S)
+
+
+def is_progmem_profile(path):
+    with open(path, "rb") as f:
+        return f.read(len(MARKER)) == MARKER.encode("ascii")
+
+
+def read_stats(path):
+    """Memory figures recorded on the first line of a PROGMEM profile."""
+    with open(path, "r") as f:
+        first = f.readline()
+    if not first.startswith(MARKER):
+        raise ValueError(f"{path}: not a BUDDY PROGMEM profile")
+    stats = {key: int(value) for key, value in _STATS_RE.findall(first)}
+    stats["ratio"] = stats["plain_sram"] / stats["flash"] if stats["flash"] else 0.0
+    return stats
+
+
+def read_profile_progmem(path):
+    """
+    Parses the tables of a PROGMEM profile and expands them.
+
+    Returns:
+        dict[str, tuple[np.ndarray, np.ndarray]]: {dof_name: (int64 deltas, int64 delays)}
+    """
+    with open(path, "r") as f:
+        text = f.read()
+    results_by_dof = {}
+    for name, body in _TABLE_RE.findall(text):
+        values = np.array(body.replace("{", " ").replace("}", " ").replace(",", " ").split(),
+                          dtype=np.int64).reshape(-1, 3)
+        records = np.empty(len(values), record_dtype(4, 4, 4))
+        records["count"], records["delta"], records["delay"] = values.T
+        results_by_dof[name] = decode_rle(records)
+    return results_by_dof
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(f"usage: {sys.argv[0]} PROFILE OUT{PROGMEM_EXTENSION}")
+    from .profileFormat import read_profile
+    report = write_profile_progmem(sys.argv[2], read_profile(sys.argv[1]))
+    print(f"{sys.argv[1]} → {sys.argv[2]}: {report['segments']} segments in "
+          f"{report['records']} records, {report['ratio']:.1f}x; "
+          f"SRAM {report['plain_sram']} → {report['sram']} B, flash {report['flash']} B")
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:02:18 2026
+
+@author: benjaminokoronkwo
+
+Inverse kinematics: Blender camera poses → slide / tilt / pan joint values.
+
+The rig is a slide carriage (Bone_XSlider) running along world X, a pan base
+(Bone_PanBase, about Z) on the carriage and a tilt arm (Bone_TiltArm) on the
+pan base, with the camera arm_radius_in from the tilt pivot. The camera rides
+the arm looking along it (ARM_LOCAL, in the camera's own axes), so for every
+frame of a take exported by blenderdataexport.py:
+
+    R      = R(RotX, RotY, RotZ)                   camera rotation (XYZ Euler)
+    M      = R · Rx(-90°) = Rz(pan) · Rx(tilt)     relative to a level camera looking
+                                                   along +Y, in the rig's joint order
+    pivot  = camera position - r · R · ARM_LOCAL
+    tilt   = atan2(M_21, M_22)                     elevation, 0 = level
+    pan    = atan2(M_10, M_00) - pan_zero          heading about Z
+    slide  = slide_direction · (pivot_x - slide_zero) / 0.0254
+
+tilt and pan are unwrapped along the take, so a tilt carried past vertical
+keeps counting up instead of folding into a small tilt plus a 180° pan.
+Unlike the X (m) / RotX (deg) mapping of blenderToArduino, the arm offset is
+taken out of the slide and the joints come from the rotation matrix, so they
+do not depend on how Blender happened to split it into Euler angles.
+
+A pose the rig cannot take is flagged (bit flags per frame): a joint outside
+its LIMITS (governorSim), a pivot off the slide rail (the camera moves in Y/Z
+in a way the arm does not explain), or camera roll (the rig has no roll axis).
+Everything is one NumPy pass over the take.
+
+Usage:
+    python -m buddy.rigIK data/motion/tilt_x-axis_test7.csv
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from . import blenderToArduino
+from .governorSim import ARM_TILT_RADIUS_IN, LIMITS
+
+POSITION_COLUMNS = ("X (m)", "Y (m)", "Z (m)")
+ROTATION_COLUMNS = ("RotX (deg)", "RotY (deg)", "RotZ (deg)")
+
+ARM_LOCAL = (0.0, 0.0, -1.0)   # pivot → camera in camera axes (-Z: along the view)
+RAIL_TOLERANCE_M = 0.002       # pivot distance from the slide rail still accepted
+ROLL_TOLERANCE_DEG = 0.5
+
+# reachability flags (bit per reason; 0 = reachable)
+SLIDE_RANGE = 1
+TILT_RANGE = 2
+PAN_RANGE = 4
+OFF_RAIL = 8
+ROLL = 16
+FLAG_NAMES = {SLIDE_RANGE: "slide out of range", TILT_RANGE: "tilt out of range",
+              PAN_RANGE: "pan out of range", OFF_RAIL: "pivot off the slide rail",
+              ROLL: "camera roll"}
+
+
+def _rotation_columns(rotation_deg):
+    """Columns (x, y, z axes) of the XYZ-Euler rotation matrices, each (3, n)."""
+    # (3, n) contiguous rows: the strided columns of (n, 3) are far slower.
+    # cos / sin come from one tan(x / 2) per angle (finite for any float angle),
+    # computed in place: on long takes the fresh temporaries cost more than the math.
+    sin = np.array(np.asarray(rotation_deg, dtype=np.float64).T, order="C")
+    sin *= np.pi / 360.0
+    np.tan(sin, out=sin)
+    cos = np.square(sin)
+    cos += 1.0
+    np.reciprocal(cos, out=cos)          # 1 / (1 + t^2)
+    sin *= cos
+    sin *= 2.0                           # 2t / (1 + t^2)
+    cos *= 2.0
+    cos -= 1.0                           # (1 - t^2) / (1 + t^2)
+    (cx, cy, cz), (sx, sy, sz) = cos, sin
+
+    # R = Rz · Ry · Rx (Blender's 'XYZ' order)
+    x_axis = np.stack((cy * cz, cy * sz, -sy))
+    cx_sy = cx * sy
+    z_axis = np.stack((cx_sy * cz + sx * sz, cx_sy * sz - sx * cz, cx * cy))
+    sx_sy = sx * sy
+    y_axis = np.stack((sx_sy * cz - cx * sz, sx_sy * sz + cx * cz, sx * cy))
+    return x_axis, y_axis, z_axis
+
+
+def camera_to_joints(position_m, rotation_deg, arm_radius_in=ARM_TILT_RADIUS_IN, limits=LIMITS,
+                     slide_zero_m=blenderToArduino.slide_zero_m,
+                     slide_direction=blenderToArduino.slide_direction, pan_zero_deg=None,
+                     rail_yz_m=None, rail_tolerance_m=RAIL_TOLERANCE_M,
+                     roll_tolerance_deg=ROLL_TOLERANCE_DEG):
+    """
+    Joint trajectories and reachability of a take of camera poses.
+
+    Args:
+        position_m (array-like): (n, 3) camera world X / Y / Z.
+        rotation_deg (array-like): (n, 3) camera world RotX / RotY / RotZ (XYZ Euler).
+        arm_radius_in (float): Tilt pivot → camera distance.
+        limits (dict): Travel limits, same keys as governorSim.LIMITS.
+        slide_zero_m, slide_direction: Pivot X with the slider at 0 in, and
+            the X direction of +1 in of slide (blenderToArduino's mapping).
+        pan_zero_deg (float | None): Camera heading with the pan base centred;
+            None takes the first frame's heading.
+        rail_yz_m (tuple | None): (Y, Z) of the tilt pivot's rail; None takes
+            the first frame's pivot.
+        rail_tolerance_m, roll_tolerance_deg (float): Accepted pivot offset
+            from the rail and camera roll.
+
+    Returns:
+        dict: slide_in, tilt_deg, pan_deg, flags (uint8 per frame, see
+        FLAG_NAMES), reachable (bool per frame), rail_error_m, roll_deg.
+    """
+    position_m = np.asarray(position_m, dtype=np.float64)
+    if position_m.ndim != 2 or position_m.shape[1] != 3:
+        raise ValueError(f"positions must be (n, 3), got {position_m.shape}")
+    if np.shape(rotation_deg) != position_m.shape:
+        raise ValueError(f"rotations must be {position_m.shape}, got {np.shape(rotation_deg)}")
+    if len(position_m) == 0:
+        empty = np.empty(0)
+        return {"slide_in": empty, "tilt_deg": empty, "pan_deg": empty,
+                "flags": np.empty(0, np.uint8), "reachable": np.empty(0, bool),
+                "rail_error_m": empty, "roll_deg": empty}
+
+    x_axis, y_axis, z_axis = _rotation_columns(rotation_deg)
+    # pivot = camera - r · R · ARM_LOCAL
+    arm = arm_radius_in * 0.0254
+    pivot = position_m.T.copy()
+    for axis, weight in zip((x_axis, y_axis, z_axis), ARM_LOCAL):
+        if weight:
+            pivot -= (arm * weight) * axis
+
+    # M = R · Rx(-90°) has the columns (x axis, -z axis, y axis) of R; with
+    # M = Rz(pan) · Rx(tilt), tilt is the angle of M's last row and pan that of
+    # its first column (the tilt axis, horizontal whatever the tilt)
+    tilt = np.arctan2(np.negative(z_axis[2]), y_axis[2])
+    if pan_zero_deg is None:
+        pan_zero_deg = np.degrees(np.arctan2(x_axis[1, 0], x_axis[0, 0]))
+    # heading measured from pan_zero: atan2 of the tilt axis turned by -pan_zero
+    cos_zero, sin_zero = np.cos(np.radians(pan_zero_deg)), np.sin(np.radians(pan_zero_deg))
+    pan = np.arctan2(cos_zero * x_axis[1] - sin_zero * x_axis[0],
+                     cos_zero * x_axis[0] + sin_zero * x_axis[1])
+    tilt = np.unwrap(tilt)
+    tilt *= 180.0 / np.pi
+    pan = np.unwrap(pan)
+    pan *= 180.0 / np.pi
+    slide = pivot[0] - slide_zero_m
+    slide *= slide_direction / 0.0254
+    roll = np.clip(x_axis[2], -1.0, 1.0)
+    np.arcsin(roll, out=roll)
+    roll *= 180.0 / np.pi
+    rail_y, rail_z = rail_yz_m if rail_yz_m is not None else (pivot[1, 0], pivot[2, 0])
+    rail_error = np.hypot(pivot[1] - rail_y, pivot[2] - rail_z)
+
+    flags = np.zeros(len(position_m), dtype=np.uint8)
+    for bit, outside in (
+            (SLIDE_RANGE, (slide < limits["slide_min_in"]) | (slide > limits["slide_max_in"])),
+            (TILT_RANGE, (tilt < limits["tilt_min_deg"]) | (tilt > limits["tilt_max_deg"])),
+            (PAN_RANGE, (pan < limits["pan_min_deg"]) | (pan > limits["pan_max_deg"])),
+            (OFF_RAIL, rail_error > rail_tolerance_m),
+            (ROLL, np.abs(roll) > roll_tolerance_deg)):
+        np.bitwise_or(flags, bit, out=flags, where=outside)
+    return {
+        "slide_in": slide,
+        "tilt_deg": tilt,
+        "pan_deg": pan,
+        "flags": flags,
+        "reachable": flags == 0,
+        "rail_error_m": rail_error,
+        "roll_deg": roll,
+    }
+
+
+def flag_counts(flags):
+    """{reason: frames} for every reason present in `flags`."""
+    flags = np.asarray(flags)
+    return {name: int(np.count_nonzero(flags & bit))
+            for bit, name in FLAG_NAMES.items() if np.any(flags & bit)}
+
+
+def load_camera_take(csv_path):
+    """(times_s, positions (n, 3), rotations (n, 3)) of a blenderdataexport.py CSV."""
+    from .csvIngest import read_columns
+
+    columns = read_columns(csv_path, [blenderToArduino.TIME_COLUMN, *POSITION_COLUMNS,
+                                      *ROTATION_COLUMNS])
+    positions = np.column_stack([columns[c] for c in POSITION_COLUMNS])
+    rotations = np.column_stack([columns[c] for c in ROTATION_COLUMNS])
+    return columns[blenderToArduino.TIME_COLUMN], positions, rotations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Map a camera take to slide / tilt / pan joints.")
+    parser.add_argument("csv", nargs="+", help="takes exported by blenderdataexport.py")
+    parser.add_argument("--arm-radius-in", type=float, default=ARM_TILT_RADIUS_IN)
+    parser.add_argument("--pan-zero-deg", type=float, default=None,
+                        help="camera heading with the pan base centred (default: first frame)")
+    args = parser.parse_args()
+
+    for path in args.csv:
+        times_s, positions, rotations = load_camera_take(path)
+        start = time.perf_counter()
+        joints = camera_to_joints(positions, rotations, args.arm_radius_in,
+                                  pan_zero_deg=args.pan_zero_deg)
+        elapsed = time.perf_counter() - start
+        bad = np.flatnonzero(~joints["reachable"])
+        print(f"{path}: {len(times_s)} frames in {elapsed * 1000:.2f} ms, "
+              f"slide {joints['slide_in'].min():.2f}..{joints['slide_in'].max():.2f} in, "
+              f"tilt {joints['tilt_deg'].min():.1f}..{joints['tilt_deg'].max():.1f} deg, "
+              f"pan {joints['pan_deg'].min():.1f}..{joints['pan_deg'].max():.1f} deg")
+        if len(bad):
+            reasons = ", ".join(f"{name} ({n})" for name, n in flag_counts(joints["flags"]).items())
+            print(f"  {len(bad)} unreachable frames, first at {times_s[bad[0]]:.3f} s: {reasons}")
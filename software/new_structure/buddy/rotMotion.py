@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Jul 17 10:51:42 2025
+
+@author: benjaminokoronkwo, ChatGPT
+"""
+
+from . import stageTrace
+from .motionEngine import ROT_EASE_THRESHOLD_DEG, rot_motion_arrays
+
+def rotMotion(rot_data, times, steps_per_rev = 1600):
+    
+    """
+   Generates Arduino-ready step and delay arrays for rotational motion based on 
+   Blender-exported data.
+   
+   Process:
+   Applies sine easing to input motion, converts to motor steps, and 
+   calculates per-step delays to achieve smooth motion. The work is done in
+   bulk by motionEngine.rot_motion_arrays; this wrapper keeps the list API.
+
+   Args:
+       rot_data (list[float]): Raw position data in meters.
+       times (list[float]): Corresponding timestamps in seconds.
+       steps_per_rev (int): Number of motor steps per full 360° rotation.
+                           Default is 1600 (1/8 microstepping).
+
+   Returns:
+       tuple:
+           delta_steps (list[int]): Step differences between consecutive rotation values.
+           delay_times_us (list[int]): Delay per step in microseconds, suitable for Arduino step control.
+   """
+    
+    if abs(rot_data[-1] - rot_data[0]) < ROT_EASE_THRESHOLD_DEG:
+        # no significant rotation: easing is skipped (counted, not printed)
+        stageTrace.count("rot_easing_skipped")
+    
+    delta_steps, delay_times_us = rot_motion_arrays(rot_data, times, steps_per_rev)
+        
+    return delta_steps.tolist(), delay_times_us.tolist()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:03:22 2026
+
+@author: benjaminokoronkwo
+
+Jerk-limited S-curve planner through the Blender waypoints.
+
+sine_ease keeps only the first and last sample of a take and lays one
+half-cosine between them, so a multi-keyframe move collapses into a single
+S-curve. This planner keeps every sample as a waypoint instead:
+
+  1. velocities at the waypoints come from monotone (PCHIP) tangents and
+     accelerations from their central differences; the take starts and ends
+     at rest (v = a = 0);
+  2. each segment is a quintic Hermite polynomial matching position,
+     velocity and acceleration at both ends, so acceleration is continuous
+     and jerk is bounded;
+  3. every segment whose peak velocity, acceleration or jerk exceeds the
+     per-axis limits is stretched in time (peaks scale as 1/s, 1/s^2, 1/s^3).
+     The stretch is spread over a few neighbouring segments so the new
+     timeline stays smooth (an abrupt change in segment length would itself
+     add jerk), and 1-3 are repeated. If a few passes do not settle it, the
+     whole take is slowed down uniformly by the remaining factor, which
+     scales every peak exactly.
+
+All axes share one timeline (a segment is stretched for the worst axis), and
+every step is vectorized over segments and axes.
+"""
+
+import time
+
+import numpy as np
+
+from .resample import _hermite_tangents
+
+PEAK_SAMPLES = 9          # samples per segment used to find velocity / acceleration peaks
+MAX_ITERATIONS = 6
+STRETCH_SPREAD = 2        # neighbouring segments on each side that share a stretch
+TOLERANCE = 1e-3          # relative overshoot accepted on the limits
+
+_U = np.linspace(0.0, 1.0, PEAK_SAMPLES)
+_POW = _U[:, None] ** np.arange(6)                          # (K, 6) u^0 .. u^5
+_D1 = np.zeros((PEAK_SAMPLES, 6))                           # d/du   of each power
+_D1[:, 1:] = np.arange(1, 6) * _POW[:, :5]
+_D2 = np.zeros((PEAK_SAMPLES, 6))                           # d2/du2 of each power
+_D2[:, 2:] = np.arange(2, 6) * np.arange(1, 5) * _POW[:, :4]
+
+
+def waypoint_derivatives(times, positions):
+    """(velocity, acceleration) per waypoint, (n, k) each; zero at both ends."""
+    v = _hermite_tangents(times, positions, "monotone")
+    a = np.zeros_like(v)
+    a[1:-1] = (v[2:] - v[:-2]) / (times[2:] - times[:-2])[:, None]
+    v[0] = v[-1] = 0.0
+    a[0] = a[-1] = 0.0
+    return v, a
+
+
+def _spread(stretch, width=STRETCH_SPREAD):
+    """Running max, then running mean, over 2 * width + 1 segments."""
+    if width <= 0 or len(stretch) < 2:
+        return stretch
+    window = 2 * width + 1
+    padded = np.pad(stretch, width, mode="edge")
+    widest = np.lib.stride_tricks.sliding_window_view(padded, window).max(axis=1)
+    padded = np.pad(widest, width, mode="edge")
+    return np.lib.stride_tricks.sliding_window_view(padded, window).mean(axis=1)
+
+
+def quintic_coefficients(h, p0, p1, v0, v1, a0, a1):
+    """
+    Coefficients c0..c5 (in u = (t - t0) / h) of the quintic Hermite segment.
+
+    Args:
+        h (np.ndarray): Segment durations, (n, 1).
+        p*, v*, a* (np.ndarray): Boundary position / velocity / acceleration, (n, k).
+
+    Returns:
+        np.ndarray: (n, k, 6).
+    """
+    dp = p1 - p0
+    hv0, hv1 = h * v0, h * v1
+    h2a0, h2a1 = h * h * a0, h * h * a1
+    return np.stack((
+        p0,
+        hv0,
+        0.5 * h2a0,
+        10 * dp - 6 * hv0 - 4 * hv1 - 1.5 * h2a0 + 0.5 * h2a1,
+        -15 * dp + 8 * hv0 + 7 * hv1 + 1.5 * h2a0 - h2a1,
+        6 * dp - 3 * hv0 - 3 * hv1 - 0.5 * h2a0 + 0.5 * h2a1,
+    ), axis=-1)
+
+
+def segment_peaks(coef, h):
+    """
+    Peak |velocity|, |acceleration| and |jerk| of every segment and axis.
+
+    Velocity and acceleration are sampled at PEAK_SAMPLES points; jerk is a
+    quadratic in u, so its peak is taken exactly (ends or vertex).
+    """
+    flat = np.ascontiguousarray(coef.reshape(-1, 6).T)   # (6, n * k): one product per derivative
+
+    def peak(derivative):
+        samples = derivative @ flat
+        np.abs(samples, out=samples)        # in place: a second (K, n * k) temporary costs more than the product
+        return samples.max(axis=0).reshape(coef.shape[:2])
+
+    v = peak(_D1) / h
+    a = peak(_D2) / h ** 2
+    c3, c4, c5 = flat[3], flat[4], flat[5]
+    j_ends = np.maximum(np.abs(c3), np.abs(c3 + 4 * c4 + 10 * c5))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u_vertex = np.clip(-c4 / (5 * c5), 0.0, 1.0)
+    u_vertex = np.nan_to_num(u_vertex)
+    j_vertex = np.abs(c3 + 4 * c4 * u_vertex + 10 * c5 * u_vertex ** 2)
+    j = 6 * np.maximum(j_ends, j_vertex).reshape(coef.shape[:2]) / h ** 3
+    return v, a, j
+
+
+def plan_scurve(times, positions, v_max, a_max, j_max, substeps=4, max_iterations=MAX_ITERATIONS):
+    """
+    Plans a jerk-limited trajectory through every sample of a take.
+
+    Args:
+        times (array-like): Sample times in seconds, strictly increasing.
+        positions (array-like): (n,) or (n, k) waypoints (any units per axis).
+        v_max, a_max, j_max (float | array-like): Per-axis limits in those
+            units per s, s^2 and s^3.
+        substeps (int): Output samples per waypoint segment.
+        max_iterations (int): Local time-scaling passes before falling back
+            to a uniform slow-down.
+
+    Returns:
+        tuple:
+            - t_out (np.ndarray): Planned timeline ((n - 1) * substeps + 1 samples).
+            - planned (np.ndarray): Positions on it, same number of columns as
+              `positions` (1-D in, 1-D out).
+            - info (dict): stretch (planned / original duration), local
+              passes used, and the peak limit ratio (<= 1) of the result.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    p = np.asarray(positions, dtype=np.float64)
+    one_d = p.ndim == 1
+    if one_d:
+        p = p[:, None]
+    if len(times) < 2:
+        raise ValueError("need at least two samples to plan")
+    h = np.diff(times)
+    if np.any(h <= 0):
+        raise ValueError("sample times must be strictly increasing")
+    limits = [np.broadcast_to(np.asarray(x, np.float64), (p.shape[1],)) for x in (v_max, a_max, j_max)]
+    if any(np.any(lim <= 0) for lim in limits):
+        raise ValueError("velocity, acceleration and jerk limits must be positive")
+
+    h = h[:, None]
+    for iteration in range(1, max_iterations + 1):
+        t = np.concatenate(([times[0]], times[0] + np.cumsum(h[:, 0])))
+        v, a = waypoint_derivatives(t, p)
+        coef = quintic_coefficients(h, p[:-1], p[1:], v[:-1], v[1:], a[:-1], a[1:])
+        vp, ap, jp = segment_peaks(coef, h)
+        ratio = np.maximum(np.maximum(vp / limits[0], np.sqrt(ap / limits[1])),
+                           np.cbrt(jp / limits[2])).max(axis=1)
+        worst = float(ratio.max())
+        if worst <= 1 + TOLERANCE or iteration == max_iterations:
+            break
+        h = h * _spread(np.maximum(ratio, 1.0))[:, None]
+
+    if worst > 1 + TOLERANCE:
+        # uniform slow-down: coefficients in u are unchanged, every peak drops by `worst`
+        h = h * worst
+        t = times[0] + (t - times[0]) * worst
+        worst = 1.0
+
+    u = np.arange(substeps) / substeps
+    powers = u[:, None] ** np.arange(6)                                  # (S, 6)
+    planned = np.einsum("nkc,sc->nsk", coef, powers).reshape(-1, p.shape[1])
+    planned = np.vstack((planned, p[-1]))
+    t_out = np.concatenate(((t[:-1, None] + u * h).ravel(), [t[-1]]))
+
+    info = {
+        "stretch": (t[-1] - t[0]) / (times[-1] - times[0]),
+        "iterations": iteration,
+        "limit_ratio": worst,
+    }
+    return t_out, (planned[:, 0] if one_d else planned), info
+
+
+def _benchmark(n=5000, repeats=5):
+    """Prints planning time for an n-frame, two-axis take."""
+    times = np.arange(n) / 24
+    positions = np.column_stack((0.2 * np.sin(times / 3) + 0.05 * np.sin(times * 1.7),
+                                 30 * np.sin(times / 2) + 10 * np.sin(times * 2.3)))
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _, _, info = plan_scurve(times, positions, (0.15, 180), (1.0, 1500), (20.0, 20000))
+        best = min(best, time.perf_counter() - start)
+    print(f"{n} frames x 2 axes: {best * 1000:.1f} ms, {info['iterations']} passes, "
+          f"stretch {info['stretch']:.2f}, limit ratio {info['limit_ratio']:.3f}")
+
+
+if __name__ == "__main__":
+    _benchmark()
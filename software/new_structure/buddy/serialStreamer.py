@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:14:37 2026
+
+@author: benjaminokoronkwo
+
+Host-side profile streamer (asyncio) with credit-based flow control.
+
+Instead of compiling a take into the sketch, the host sends it over the
+serial link in chunks of `chunk_segments` segments. The controller owns a
+ring buffer of `capacity` chunks and hands out one credit per chunk it has
+finished playing; the host only sends while it holds credits, so the buffer
+never overflows, and it tries to keep the controller at least `min_lead`
+chunks ahead. Every time the controller runs dry it reports an underrun.
+
+Frames (both directions):
+
+    0xB5 | type u8 | seq u16 | length u16 | payload | checksum u8
+
+checksum = sum of every byte after the sync byte, mod 256; integers are
+little-endian.
+
+    host → controller   'P' start:  n_axes u8, segments u32, chunk_segments u16
+                        'D' data:   per segment, per axis: delta i16, delay u32
+                        'E' end of profile
+    controller → host   'H' hello:  capacity u8 (chunks)
+                        'C' credit: chunks u8, segments played u32
+                        'U' underrun: segment index u32
+                        'F' finished: segments played u32, underruns u16
+
+LoopbackController plays the controller's part on the master side of a
+pseudo-terminal, so the whole link can be exercised without hardware:
+
+    python -m buddy.serialStreamer --loopback data/processed/tilt_x-axis_test6.txt
+    python -m buddy.serialStreamer /dev/ttyACM0 data/processed/tilt_x-axis_test6.txt --baud 115200
+
+POSIX only (termios / pty).
+"""
+
+import argparse
+import asyncio
+import os
+import struct
+import sys
+import termios
+import time
+import tty
+
+import numpy as np
+
+SYNC = 0xB5
+HEADER = struct.Struct("<BBHH")          # sync, type, seq, length
+SEGMENT_AXIS_BYTES = 6                   # delta i16 + delay u32
+DEFAULT_CHUNK_SEGMENTS = 16
+DEFAULT_CAPACITY = 4                     # chunks; 4 x 16 x 2 axes x 6 B = 768 B of SRAM
+DEFAULT_MIN_LEAD = 2
+BAUD_RATES = {9600: termios.B9600, 19200: termios.B19200, 38400: termios.B38400,
+              57600: termios.B57600, 115200: termios.B115200, 230400: termios.B230400}
+
+
+# === FRAMING ===
+def encode_frame(kind, seq, payload=b""):
+    body = HEADER.pack(SYNC, ord(kind), seq & 0xFFFF, len(payload))[1:] + payload
+    return bytes((SYNC,)) + body + bytes((sum(body) & 0xFF,))
+
+
+async def read_frame(reader):
+    """Next valid frame as (kind, seq, payload); skips garbage and bad checksums."""
+    while True:
+        if (await reader.readexactly(1))[0] != SYNC:
+            continue
+        head = await reader.readexactly(HEADER.size - 1)
+        _, kind, seq, length = HEADER.unpack(bytes((SYNC,)) + head)
+        payload = await reader.readexactly(length)
+        checksum = (await reader.readexactly(1))[0]
+        if (sum(head) + sum(payload)) & 0xFF == checksum:
+            return chr(kind), seq, payload
+
+
+def pack_segments(results_by_dof):
+    """
+    All segments as one byte string, axis-interleaved per segment
+    (the layout of a 'D' payload), plus the segment count.
+    """
+    axes = list(results_by_dof.values())
+    n = len(axes[0][0])
+    record = np.dtype([("delta", "<i2"), ("delay", "<u4")])
+    packed = np.empty((n, len(axes)), record)
+    for i, (deltas, delays) in enumerate(axes):
+        if len(deltas) != n:
+            raise ValueError("all axes must have the same number of segments")
+        packed["delta"][:, i] = deltas
+        packed["delay"][:, i] = delays
+    return packed.tobytes(), n
+
+
+def max_chunk_segments(n_axes):
+    """Largest chunk whose 'D' payload still fits the u16 frame length."""
+    return 0xFFFF // (n_axes * SEGMENT_AXIS_BYTES)
+
+
+def segment_durations_us(results_by_dof):
+    """Playback time of every segment: the slowest axis (|delta| x delay)."""
+    return np.max([np.abs(np.asarray(d, np.int64)) * np.asarray(t, np.int64)
+                   for d, t in results_by_dof.values()], axis=0)
+
+
+# === TRANSPORT ===
+async def open_serial(path, baud=115200):
+    """Opens a tty (real port or pty) in raw mode as asyncio (reader, writer)."""
+    fd = os.open(path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+    tty.setraw(fd)
+    if baud in BAUD_RATES:
+        attrs = termios.tcgetattr(fd)
+        attrs[4] = attrs[5] = BAUD_RATES[baud]
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    return await _fd_streams(fd)
+
+
+async def _fd_streams(fd):
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader),
+                                 os.fdopen(fd, "rb", buffering=0))
+    transport, protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, os.fdopen(os.dup(fd), "wb", buffering=0))
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    return reader, writer
+
+
+# === HOST ===
+async def stream_profile(reader, writer, results_by_dof, chunk_segments=DEFAULT_CHUNK_SEGMENTS,
+                         min_lead=DEFAULT_MIN_LEAD, log=None):
+    """
+    Streams a profile to a controller speaking the protocol above.
+
+    Returns:
+        dict: segments, chunks, bytes sent, wall time, underruns reported by
+        the controller, lowest lead (chunks buffered ahead) seen while data
+        remained, and how often the lead fell below `min_lead`.
+    """
+    if not 1 <= chunk_segments <= max_chunk_segments(len(results_by_dof)):
+        raise ValueError(f"chunk_segments must be 1..{max_chunk_segments(len(results_by_dof))} "
+                         f"for {len(results_by_dof)} axes, got {chunk_segments}")
+    data, n = pack_segments(results_by_dof)
+    stride = len(results_by_dof) * SEGMENT_AXIS_BYTES * chunk_segments
+    chunks = [data[i:i + stride] for i in range(0, len(data), stride)]
+    start = time.perf_counter()
+    sent_bytes = 0
+
+    def send(kind, seq, payload=b""):
+        nonlocal sent_bytes
+        frame = encode_frame(kind, seq, payload)
+        writer.write(frame)
+        sent_bytes += len(frame)
+
+    send("P", 0, struct.pack("<BIH", len(results_by_dof), n, chunk_segments))
+    await writer.drain()
+    kind, _, payload = await read_frame(reader)
+    if kind != "H":
+        raise ConnectionError(f"expected hello from controller, got '{kind}'")
+    credits = payload[0]
+
+    next_chunk = 0
+    in_flight = 0
+    underruns = 0
+    min_seen = None
+    low_water = 0
+    while True:
+        while credits and next_chunk < len(chunks):
+            send("D", next_chunk, chunks[next_chunk])
+            next_chunk += 1
+            credits -= 1
+            in_flight += 1
+        if next_chunk == len(chunks):
+            send("E", next_chunk)
+            next_chunk += 1
+        await writer.drain()
+
+        kind, _, payload = await read_frame(reader)
+        if kind == "C":
+            played, _ = struct.unpack("<BI", payload)
+            credits += played
+            in_flight -= played
+            if next_chunk < len(chunks):
+                min_seen = in_flight if min_seen is None else min(min_seen, in_flight)
+                if in_flight < min_lead:
+                    low_water += 1
+        elif kind == "U":
+            underruns += 1
+            if log:
+                log(f"underrun at segment {struct.unpack('<I', payload)[0]}")
+        elif kind == "F":
+            played, reported = struct.unpack("<IH", payload)
+            return {
+                "segments": played,
+                "chunks": len(chunks),
+                "bytes": sent_bytes,
+                "wall_s": time.perf_counter() - start,
+                "underruns": max(underruns, reported),
+                "min_lead": min_seen if min_seen is not None else in_flight,
+                "low_water": low_water,
+            }
+
+
+# === CONTROLLER STAND-IN ===
+class LoopbackController:
+    """
+    Emulates the controller on the other end of the link: a `capacity`-chunk
+    ring buffer drained at the profile's own timing (scaled by `speed`;
+    speed=None plays instantly to measure raw link throughput).
+    """
+
+    def __init__(self, reader, writer, capacity=DEFAULT_CAPACITY, speed=1.0, prefill=DEFAULT_MIN_LEAD):
+        self.reader = reader
+        self.writer = writer
+        self.capacity = capacity
+        self.speed = speed
+        self.prefill = prefill
+        self.buffer = asyncio.Queue(maxsize=capacity)
+        self.received = []          # (seq, payload) of every 'D' frame, in arrival order
+
+    async def _receive(self, n_axes):
+        record = np.dtype([("delta", "<i2"), ("delay", "<u4")])
+        while True:
+            kind, seq, payload = await read_frame(self.reader)
+            if kind == "D":
+                self.received.append((seq, payload))
+                segments = np.frombuffer(payload, record).reshape(-1, n_axes)
+                durations = np.max(np.abs(segments["delta"].astype(np.int64))
+                                   * segments["delay"], axis=1)
+                self.buffer.put_nowait(durations)   # host credits guarantee room
+            elif kind == "E":
+                return
+
+    async def run(self):
+        kind, _, payload = await read_frame(self.reader)
+        if kind != "P":
+            raise ConnectionError(f"expected profile start, got '{kind}'")
+        n_axes, total, chunk_segments = struct.unpack("<BIH", payload)
+        self.writer.write(encode_frame("H", 0, bytes((self.capacity,))))
+        receiver = asyncio.ensure_future(self._receive(n_axes))
+
+        total_chunks = -(-total // chunk_segments)
+        while self.buffer.qsize() < min(self.prefill, total_chunks):
+            await asyncio.sleep(0.001)
+
+        loop = asyncio.get_running_loop()
+        played = 0
+        underruns = 0
+        deadline = loop.time()
+        while played < total:
+            if self.buffer.empty():
+                underruns += 1
+                self.writer.write(encode_frame("U", underruns, struct.pack("<I", played)))
+                durations = await self.buffer.get()
+                deadline = loop.time()              # the motion stalled; restart the clock
+            else:
+                durations = self.buffer.get_nowait()
+            if self.speed:
+                deadline += durations.sum() / 1e6 / self.speed
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+            else:
+                await asyncio.sleep(0)
+            played += len(durations)
+            self.writer.write(encode_frame("C", played, struct.pack("<BI", 1, played)))
+        await receiver
+        self.writer.write(encode_frame("F", 0, struct.pack("<IH", played, underruns)))
+        await self.writer.drain()
+
+
+async def loopback(results_by_dof, chunk_segments=DEFAULT_CHUNK_SEGMENTS,
+                   capacity=DEFAULT_CAPACITY, speed=1.0, min_lead=DEFAULT_MIN_LEAD, log=None):
+    """
+    Streams a profile to a LoopbackController over a fresh pty pair. The
+    report also carries the controller's received 'D' frames.
+    """
+    master, slave = os.openpty()
+    tty.setraw(master)
+    path = os.ttyname(slave)
+    try:
+        ctrl_reader, ctrl_writer = await _fd_streams(master)
+        host_reader, host_writer = await open_serial(path)
+        controller = LoopbackController(ctrl_reader, ctrl_writer, capacity, speed, min_lead)
+        ctrl_task = asyncio.ensure_future(controller.run())
+        report = await stream_profile(host_reader, host_writer, results_by_dof,
+                                      chunk_segments, min_lead, log)
+        await ctrl_task
+        report["received"] = controller.received
+        host_writer.close()
+        ctrl_writer.close()
+    finally:
+        os.close(slave)
+    return report
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m buddy.serialStreamer",
+        description="Stream a motion profile to the controller with credit-based flow control.")
+    parser.add_argument("port", nargs="?", help="serial device (omit with --loopback)")
+    parser.add_argument("profile", help="profile in any form read by profileFormat")
+    parser.add_argument("--loopback", action="store_true",
+                        help="stream to an emulated controller over a pty instead of a port")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--chunk-segments", type=int, default=DEFAULT_CHUNK_SEGMENTS)
+    parser.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY,
+                        help="controller ring buffer size in chunks (--loopback)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="playback speed-up of the emulated controller; 0 = instant, "
+                             "where underruns are expected (--loopback)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.loopback and not args.port:
+        parser.error("a serial port is required unless --loopback is given")
+    from .profileFormat import read_profile
+    results_by_dof = read_profile(args.profile)
+    limit = max_chunk_segments(len(results_by_dof))
+    if not 1 <= args.chunk_segments <= limit:
+        parser.error(f"--chunk-segments must be 1..{limit} for {len(results_by_dof)} axes "
+                     "(a 'D' frame holds at most 65535 bytes)")
+
+    def log(msg):
+        print(msg, file=sys.stderr)
+
+    async def run():
+        if args.loopback:
+            report = await loopback(results_by_dof, args.chunk_segments, args.capacity,
+                                    args.speed or None, log=log)
+            # second pass with an instantly-draining controller: raw link throughput
+            burst = await loopback(results_by_dof, args.chunk_segments, args.capacity, None)
+            return report, burst
+        reader, writer = await open_serial(args.port, args.baud)
+        return await stream_profile(reader, writer, results_by_dof, args.chunk_segments, log=log), None
+
+    report, burst = asyncio.run(run())
+    take_s = segment_durations_us(results_by_dof).sum() / 1e6
+    need = report["segments"] / take_s if take_s else float("inf")
+    wire = args.baud / 10 / (len(results_by_dof) * SEGMENT_AXIS_BYTES)   # 8N1
+    print(f"{report['segments']} segments in {report['chunks']} chunks, "
+          f"{report['bytes']} B, {report['wall_s']:.3f} s (take {take_s:.3f} s)")
+    print(f"underruns {report['underruns']}, lowest lead {report['min_lead']} chunks "
+          f"({report['low_water']} times below {DEFAULT_MIN_LEAD})")
+    print(f"profile needs {need:.1f} seg/s; {args.baud} baud carries {wire:.0f} seg/s "
+          f"(headroom {wire / need:.1f}x)")
+    if burst:
+        rate = burst["segments"] / burst["wall_s"]
+        print(f"pty loopback streams {rate:.0f} seg/s (headroom {rate / need:.1f}x)")
+    return 1 if report["underruns"] and args.speed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:58:44 2026
+
+@author: benjaminokoronkwo
+
+Speed envelopes as precomputed lookup tables.
+
+An envelope is a piecewise-linear max-speed profile v(x) loaded from config
+(envelopes.json by default) instead of hardcoded if-chains. Building one
+samples it into a dense table over its domain; evaluation is a table lookup
+with linear interpolation — pure Python for a single value (what the
+on_frame handlers need) and np.interp for whole arrays (offline governing).
+
+TiltEnvelope bakes the linear (in/s) tilt profile and the arm radius into a
+deg/s table, so a frame only costs one lookup instead of the piecewise
+evaluation, a division and a radians → degrees conversion.
+"""
+
+import json
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "envelopes.json")
+DEFAULT_RESOLUTION = 0.01   # table spacing, in the envelope's position unit
+
+
+def _points_from_config(spec):
+    """(x, v) breakpoints from either {"points": [[x, v], ...]} or
+    {"segments": [[x_lo, x_hi, slope, intercept], ...]}."""
+    if "points" in spec:
+        pts = [(float(x), float(v)) for x, v in spec["points"]]
+    elif "segments" in spec:
+        pts = []
+        for lo, hi, slope, intercept in spec["segments"]:
+            for x in (lo, hi):
+                p = (float(x), float(slope * x + intercept))
+                if not pts or pts[-1] != p:
+                    pts.append(p)
+    else:
+        raise ValueError("envelope needs 'points' or 'segments'")
+    xs = [p[0] for p in pts]
+    if any(b < a for a, b in zip(xs, xs[1:])):
+        raise ValueError("envelope breakpoints must be sorted by position")
+    return np.array(xs), np.array([p[1] for p in pts])
+
+
+class SpeedEnvelope:
+    """
+    Max speed as a function of position, evaluated from a dense table.
+
+    Positions outside the domain use the nearest edge value.
+
+    Args:
+        xs, speeds (array-like): Piecewise-linear breakpoints.
+        domain (tuple[float, float] | None): Table range (default: breakpoint span).
+        resolution (float): Table spacing.
+        scale (float): Factor applied to every speed (e.g. unit conversion).
+        unit (str): Unit of the resulting speeds, for display.
+    """
+
+    def __init__(self, xs, speeds, domain=None, resolution=DEFAULT_RESOLUTION, scale=1.0, unit=""):
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.speeds = np.asarray(speeds, dtype=np.float64)
+        lo, hi = domain if domain is not None else (self.xs[0], self.xs[-1])
+        n = max(2, int(math.ceil((hi - lo) / resolution)) + 1)
+        self.grid = np.linspace(lo, hi, n)
+        self.table = np.interp(self.grid, self.xs, self.speeds) * scale
+        self.unit = unit
+        # plain-Python copies for the scalar path
+        self._lo = float(lo)
+        self._inv_step = (n - 1) / (hi - lo) if hi > lo else 0.0
+        self._last = n - 1
+        self._values = self.table.tolist()
+
+    @classmethod
+    def from_config(cls, spec, **kwargs):
+        xs, speeds = _points_from_config(spec)
+        kwargs.setdefault("domain", spec.get("domain"))
+        kwargs.setdefault("unit", spec.get("unit", ""))
+        return cls(xs, speeds, **kwargs)
+
+    def scalar(self, x):
+        """Speed at one position (pure Python, no NumPy overhead)."""
+        f = (x - self._lo) * self._inv_step
+        if f <= 0.0:
+            return self._values[0]
+        if f >= self._last:
+            return self._values[self._last]
+        i = int(f)
+        v0 = self._values[i]
+        return v0 + (self._values[i + 1] - v0) * (f - i)
+
+    def array(self, x):
+        """Speeds for an array of positions."""
+        return np.interp(x, self.grid, self.table)
+
+    def __call__(self, x):
+        if isinstance(x, (int, float)):
+            return self.scalar(x)
+        return self.array(x)
+
+
+class TiltEnvelope(SpeedEnvelope):
+    """
+    Tilt envelope in deg/s for a given arm radius, tabulated over
+    [tilt_min_deg, tilt_max_deg] from a linear (in/s) profile:
+
+        omega[deg/s] = ( v[in/s] / R[in] ) * (180/pi)
+    """
+
+    def __init__(self, linear_spec, arm_radius_in, tilt_min_deg=-25.0, tilt_max_deg=25.0,
+                 resolution=DEFAULT_RESOLUTION):
+        xs, speeds = _points_from_config(linear_spec)
+        r = max(1e-6, abs(arm_radius_in))  # avoid divide-by-zero
+        super().__init__(xs, speeds, (tilt_min_deg, tilt_max_deg), resolution,
+                         scale=(180.0 / math.pi) / r, unit="deg/s")
+        self.arm_radius_in = arm_radius_in
+
+
+@lru_cache(maxsize=None)
+def load_config(path=DEFAULT_CONFIG):
+    """Envelope specs by axis name ("tilt", "slide", "pan")."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_envelopes(path=DEFAULT_CONFIG):
+    """SpeedEnvelope per axis in its own unit (tilt stays linear in/s)."""
+    return {name: SpeedEnvelope.from_config(spec) for name, spec in load_config(path).items()}
+
+
+@lru_cache(maxsize=64)
+def tilt_envelope(arm_radius_in, tilt_min_deg=-25.0, tilt_max_deg=25.0, path=DEFAULT_CONFIG):
+    """Cached TiltEnvelope, so handlers can ask for one every frame."""
+    return TiltEnvelope(load_config(path)["tilt"], arm_radius_in, tilt_min_deg, tilt_max_deg)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:12:05 2026
+
+@author: benjaminokoronkwo
+
+Stage timers and counters for the conversion pipeline, written as a Chrome
+trace (open it in chrome://tracing or https://ui.perfetto.dev).
+
+Off unless switched on, and then close to free: stage() hands back one
+shared no-op context and count() returns on a flag check.
+
+    BUDDY_TRACE=/tmp/run.json python -m buddy.buddyConvert data/motion
+    python -m buddy.buddyConvert data/motion --trace /tmp/run.json --trace-memory
+
+    with stageTrace.stage("export", path=out_path):
+        ...
+    stageTrace.count("segments", len(deltas))
+
+Stages become complete ("X") events, counters running-total ("C") events
+with their totals repeated in the file's metadata; with memory snapshots on
+(BUDDY_TRACE_MEMORY=1) every stage also records the tracemalloc current /
+peak size. Worker processes hand their events to the parent with drain();
+only the process that switched tracing on writes the file, at exit.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+
+ENV_VAR = "BUDDY_TRACE"
+MEMORY_ENV_VAR = "BUDDY_TRACE_MEMORY"
+OWNER_ENV_VAR = "BUDDY_TRACE_PID"
+DEFAULT_TRACE_PATH = "buddy_trace.json"
+
+enabled = False
+_path = None
+_memory = False
+_events = []
+_counters = {}
+_written = None           # event count at the last write()
+_lock = threading.Lock()
+# wall-clock origin, so events from several processes share one timeline
+_epoch_us = time.time_ns() / 1000 - time.perf_counter_ns() / 1000
+_NULL = contextlib.nullcontext()
+
+
+def _now_us():
+    return _epoch_us + time.perf_counter_ns() / 1000
+
+
+def enable(path=DEFAULT_TRACE_PATH, memory=False):
+    """Switches tracing on for this process and the workers it starts."""
+    global enabled, _path, _memory
+    enabled, _path, _memory = True, path, memory
+    os.environ[ENV_VAR] = path
+    os.environ.setdefault(OWNER_ENV_VAR, str(os.getpid()))
+    if memory:
+        import tracemalloc
+        os.environ[MEMORY_ENV_VAR] = "1"
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+@contextlib.contextmanager
+def _stage(name, args):
+    start = _now_us()
+    try:
+        yield
+    finally:
+        end = _now_us()
+        event = {"name": name, "ph": "X", "ts": start, "dur": end - start,
+                 "pid": os.getpid(), "tid": threading.get_ident(), "args": args}
+        if _memory:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            event["args"] = dict(args, memory_mb=current / 2 ** 20, peak_mb=peak / 2 ** 20)
+        with _lock:
+            _events.append(event)
+
+
+def stage(name, **args):
+    """Context manager timing one named stage (a shared no-op when tracing is off)."""
+    if not enabled:
+        return _NULL
+    return _stage(name, args)
+
+
+def count(name, value=1):
+    """Adds `value` to a named counter."""
+    if not enabled:
+        return
+    with _lock:
+        total = _counters.get(name, 0) + value
+        _counters[name] = total
+        _events.append({"name": name, "ph": "C", "ts": _now_us(), "pid": os.getpid(),
+                        "args": {"value": total}})
+
+
+def drain():
+    """Returns and clears this process' events and counter totals (for worker → parent)."""
+    with _lock:
+        events, counters = list(_events), dict(_counters)
+        _events.clear()
+        _counters.clear()
+    return events, counters
+
+
+def merge(events, counters):
+    """Adds events and counter totals drained from another process."""
+    with _lock:
+        _events.extend(events)
+        for name, value in counters.items():
+            _counters[name] = _counters.get(name, 0) + value
+
+
+def write(path=None):
+    """Writes the collected events as Chrome trace JSON; returns the path."""
+    global _written
+    path = path or _path or DEFAULT_TRACE_PATH
+    with _lock:
+        _written = len(_events)
+        trace = {"traceEvents": sorted(_events, key=lambda e: e["ts"]),
+                 "displayTimeUnit": "ms",
+                 "otherData": {"counters": dict(_counters)}}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(trace, f)
+    return path
+
+
+def _write_at_exit():
+    if (enabled and os.environ.get(OWNER_ENV_VAR) == str(os.getpid())
+            and _written != len(_events)):
+        write()
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR] if os.environ[ENV_VAR] != "1" else DEFAULT_TRACE_PATH,
+           memory=os.environ.get(MEMORY_ENV_VAR) == "1")
+atexit.register(_write_at_exit)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:14:09 2026
+
+@author: benjaminokoronkwo
+
+Step-rate / acceleration feasibility guard.
+
+A segment of d steps over dt seconds asks the motor for |d| / dt steps/s; a
+stepper asked for more than it can follow stalls and silently loses steps
+(the unwrapped ±180° Euler spikes asked for ~37k steps/s). check_profile()
+measures every segment of every axis against per-axis limits:
+
+    rate    |d_i| / dt_i                                        steps/s
+    accel   |rate_i+1 - rate_i| / ((dt_i + dt_i+1) / 2)         steps/s^2
+
+and guard_results() either fails with the offending frame indices or
+retimes the take: offending segments are lengthened (rates scale as 1/s,
+accelerations as 1/s^2), the stretch is smoothed over a few neighbours, and
+if a few passes do not settle it the whole take is slowed down uniformly by
+the remaining factor. Step counts never change, only the timeline.
+"""
+
+import numpy as np
+
+from .motionEngine import steps_to_segments
+
+MAX_PASSES = 8
+STRETCH_SPREAD = 1        # neighbouring segments on each side that share a stretch
+TOLERANCE = 1e-6
+REPORT_FRAMES = 10        # offending frames listed per axis in an error message
+MODES = ("retime", "fail")
+
+
+def segment_rates(delta_steps, dt_s):
+    """Step rate (steps/s) of every segment; inf for steps in zero time."""
+    counts = np.abs(np.asarray(delta_steps, dtype=np.float64))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = counts / dt_s
+    return np.where(counts == 0, 0.0, rates)
+
+
+def segment_accels(rates, dt_s):
+    """Rate change (steps/s^2) across every frame between two segments."""
+    return np.abs(np.diff(rates)) / (0.5 * (dt_s[:-1] + dt_s[1:]))
+
+
+def _overshoot(results_by_dof, dt_s, limits):
+    """Per-segment time-stretch factor each axis needs (1 = within limits), (n_segments,)."""
+    need = np.ones(len(dt_s))
+    for name, (deltas, _) in results_by_dof.items():
+        max_rate, max_accel = limits[name]
+        rates = segment_rates(deltas, dt_s)
+        need = np.maximum(need, rates / max_rate)
+        if len(rates) > 1:
+            accel = np.sqrt(segment_accels(rates, dt_s) / max_accel)
+            need[:-1] = np.maximum(need[:-1], accel)    # both segments around the frame
+            need[1:] = np.maximum(need[1:], accel)
+    return need
+
+
+def check_profile(results_by_dof, times_s, limits):
+    """
+    Finds the segments of a profile that exceed the axis limits.
+
+    Args:
+        results_by_dof (dict): {dof_name: (delta_steps, delay_times_us)}.
+        times_s (array-like): Sample times of the profile (one more than segments).
+        limits (dict): {dof_name: (max_rate_sps, max_accel_sps2)}.
+
+    Returns:
+        dict: {dof_name: {"rate_frames", "accel_frames" (np.ndarray of frame
+        indices: frame i starts segment i; accel frames are the frames
+        between two segments), "peak_rate", "peak_accel"}}, with only the
+        axes that violate a limit.
+    """
+    dt_s = np.diff(np.asarray(times_s, dtype=np.float64))
+    violations = {}
+    for name, (deltas, _) in results_by_dof.items():
+        max_rate, max_accel = limits[name]
+        rates = segment_rates(deltas, dt_s)
+        accels = segment_accels(rates, dt_s) if len(rates) > 1 else np.empty(0)
+        rate_frames = np.flatnonzero(rates > max_rate * (1 + TOLERANCE))
+        accel_frames = np.flatnonzero(accels > max_accel * (1 + TOLERANCE)) + 1
+        if len(rate_frames) or len(accel_frames):
+            violations[name] = {
+                "rate_frames": rate_frames,
+                "accel_frames": accel_frames,
+                "peak_rate": float(rates.max()) if len(rates) else 0.0,
+                "peak_accel": float(accels.max()) if len(accels) else 0.0,
+            }
+    return violations
+
+
+def format_violations(violations, limits):
+    """One line per axis: limits, peaks and the first offending frames."""
+    lines = []
+    for name, v in violations.items():
+        max_rate, max_accel = limits[name]
+        frames = np.union1d(v["rate_frames"], v["accel_frames"])
+        shown = ", ".join(map(str, frames[:REPORT_FRAMES].tolist()))
+        more = f" (+{len(frames) - REPORT_FRAMES} more)" if len(frames) > REPORT_FRAMES else ""
+        lines.append(f"{name}: peak {v['peak_rate']:.0f} steps/s (limit {max_rate:g}), "
+                     f"peak {v['peak_accel']:.0f} steps/s^2 (limit {max_accel:g}) "
+                     f"at frames {shown}{more}")
+    return "\n".join(lines)
+
+
+def _spread(stretch, width=STRETCH_SPREAD):
+    """Running max over 2 * width + 1 segments, so neighbours ease into a stretch."""
+    if width <= 0 or len(stretch) < 2:
+        return stretch
+    padded = np.pad(stretch, width, mode="edge")
+    return np.lib.stride_tricks.sliding_window_view(padded, 2 * width + 1).max(axis=1)
+
+
+def retime(results_by_dof, times_s, limits, max_passes=MAX_PASSES):
+    """
+    Stretches the timeline until every axis is within its limits.
+
+    Returns:
+        tuple:
+            - times_s (np.ndarray): New sample times (same first sample).
+            - info (dict): stretch (new / old duration), local passes used,
+              segments retimed.
+    """
+    times_s = np.asarray(times_s, dtype=np.float64)
+    dt_s = np.diff(times_s)
+    original = dt_s.copy()
+    for name, (deltas, _) in results_by_dof.items():
+        # rate limit first, directly: also covers steps asked for in zero time
+        dt_s = np.maximum(dt_s, np.abs(np.asarray(deltas, np.float64)) / limits[name][0])
+    passes = 0
+    for passes in range(1, max_passes + 1):
+        need = _overshoot(results_by_dof, dt_s, limits)
+        if need.max() <= 1 + TOLERANCE:
+            break
+        dt_s = dt_s * _spread(np.maximum(need, 1.0))
+    need = _overshoot(results_by_dof, dt_s, limits)
+    if need.max() > 1 + TOLERANCE:
+        dt_s = dt_s * need.max() * (1 + TOLERANCE)    # uniform: every rate / accel scales exactly
+
+    new_times = times_s[0] + np.concatenate(([0.0], np.cumsum(dt_s)))
+    info = {
+        "stretch": (new_times[-1] - new_times[0]) / (times_s[-1] - times_s[0])
+                   if times_s[-1] > times_s[0] else 1.0,
+        "passes": passes,
+        "segments_retimed": int(np.count_nonzero(~np.isclose(dt_s, original))),
+    }
+    return new_times, info
+
+
+def guard_results(results_by_dof, times_s, limits, mode="retime"):
+    """
+    Checks a converted take and retimes it, or fails, if it is infeasible.
+
+    Args:
+        results_by_dof (dict): {dof_name: (delta_steps, delay_times_us)}.
+        times_s (array-like): Sample times the segments were computed on.
+        limits (dict): {dof_name: (max_rate_sps, max_accel_sps2)}.
+        mode (str): "retime" to stretch the offending segments, "fail" to
+            raise instead.
+
+    Returns:
+        tuple: (results_by_dof, times_s, violations); the first two are the
+        inputs when nothing was violated, otherwise the retimed profile
+        (same deltas, recomputed delays) and its timeline.
+
+    Raises:
+        ValueError: in "fail" mode, listing the offending frames per axis.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown guard mode '{mode}' (expected one of {', '.join(MODES)})")
+    violations = check_profile(results_by_dof, times_s, limits)
+    if not violations:
+        return results_by_dof, times_s, violations
+    if mode == "fail":
+        raise ValueError("profile exceeds the step limits:\n" + format_violations(violations, limits))
+
+    times_s, _ = retime(results_by_dof, times_s, limits)
+    retimed = {}
+    for name, (deltas, _) in results_by_dof.items():
+        deltas = np.asarray(deltas, dtype=np.int64)
+        steps = np.concatenate(([0], np.cumsum(deltas)))
+        retimed[name] = steps_to_segments(steps, times_s)
+    return retimed, times_s, violations
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:26:51 2026
+
+@author: benjaminokoronkwo
+
+Merged multi-axis step-event schedule.
+
+dual_motor.ino polls micros() for every axis against its own segment delays,
+so the axes drift apart and the combined step rate is bounded by the loop.
+Here the whole take is precomputed instead: every step of every axis gets an
+absolute timestamp (segment start on the Blender timeline + (k + 1) * delay),
+the per-axis streams are merged and quantized to a timer tick, and steps that
+land on the same tick become one event. The firmware only replays
+
+    {wait, step, dir}    wait `wait` ticks, set the DIR pins to `dir`,
+                         pulse the STEP pins in `step`
+
+records (bit i = i-th axis of results_by_dof). Timestamps are quantized
+absolutely, not per event, so rounding never accumulates; waits longer than
+uint16 are split with empty (step = 0) events.
+
+Usage:
+    python -m buddy.stepSchedule data/processed/tilt_x-axis_test7.txt /tmp/tilt7_events.h --tick-us 4
+"""
+
+import argparse
+import os
+import re
+
+import numpy as np
+
+SCHEDULE_EXTENSION = "_events.h"
+MARKER = "// BUDDY step schedule"
+DEFAULT_TICK_US = 4.0     # Timer1 with /64 prescaler on a 16 MHz AVR
+WAIT_MAX = 0xFFFF
+MAX_AXES = 8
+EVENT_DTYPE = np.dtype([("wait", "<u2"), ("step", "u1"), ("dir", "u1")])
+
+
+# === PER-AXIS STEP TIMES ===
+def axis_step_times(delta_steps, delay_times_us, segment_start_us=None):
+    """
+    Absolute time of every individual step of one axis.
+
+    Args:
+        delta_steps, delay_times_us (array-like): The axis' segments.
+        segment_start_us (array-like | None): Start of every segment on the
+            take timeline (μs). None chains the segments back to back, the
+            way the polling sketches play them.
+
+    Returns:
+        tuple:
+            - step_us (np.ndarray[float64]): Time of each step, ascending.
+            - forward (np.ndarray[bool]): Direction of each step (delta >= 0).
+    """
+    deltas = np.asarray(delta_steps, dtype=np.int64)
+    delays = np.asarray(delay_times_us, dtype=np.float64)
+    counts = np.abs(deltas)
+    if segment_start_us is None:
+        segment_start_us = np.concatenate(([0.0], np.cumsum(counts * delays)[:-1]))
+    start = np.asarray(segment_start_us, dtype=np.float64)
+
+    segment = np.repeat(np.arange(len(deltas)), counts)
+    k = np.arange(len(segment)) - np.repeat(np.cumsum(counts) - counts, counts)
+    step_us = start[segment] + (k + 1) * delays[segment]
+    return step_us, deltas[segment] >= 0
+
+
+# === MERGE ===
+def build_schedule(results_by_dof, segment_start_us=None, tick_us=DEFAULT_TICK_US):
+    """
+    Merges all axes into one time-ordered event list.
+
+    Args:
+        results_by_dof (dict): {dof_name: (delta_steps, delay_times_us)}.
+        segment_start_us (array-like | None): Shared segment start times (μs),
+            e.g. (times[:-1] - times[0]) * 1e6; see axis_step_times.
+        tick_us (float): Timer tick the waits are expressed in.
+
+    Returns:
+        tuple:
+            - events (np.ndarray[EVENT_DTYPE]): wait (ticks), step mask, dir state.
+            - stats (dict): events, steps per axis, peak combined step rate,
+              worst quantization error, duration.
+    """
+    if len(results_by_dof) > MAX_AXES:
+        raise ValueError(f"at most {MAX_AXES} axes fit in a uint8 pin mask")
+    times, ticks, bits, forward = [], [], [], []
+    steps_per_axis = {}
+    for axis, (name, (deltas, delays)) in enumerate(results_by_dof.items()):
+        step_us, fwd = axis_step_times(deltas, delays, segment_start_us)
+        # an axis can pulse at most once per tick: push colliding steps to later ticks
+        idx = np.arange(len(step_us))
+        axis_ticks = np.rint(step_us / tick_us).astype(np.int64)
+        axis_ticks = np.maximum.accumulate(axis_ticks - idx) + idx if len(idx) else axis_ticks
+        times.append(step_us)
+        ticks.append(axis_ticks)
+        bits.append(np.full(len(step_us), 1 << axis, dtype=np.uint8))
+        forward.append(fwd)
+        steps_per_axis[name] = len(step_us)
+    times = np.concatenate(times) if times else np.empty(0)
+    ticks = np.concatenate(ticks) if ticks else np.empty(0, np.int64)
+    bits = np.concatenate(bits) if bits else np.empty(0, np.uint8)
+    forward = np.concatenate(forward) if forward else np.empty(0, bool)
+
+    order = np.argsort(ticks, kind="stable")
+    times, ticks, bits, forward = times[order], ticks[order], bits[order], forward[order]
+
+    # one event per distinct tick; OR together the axes stepping on it
+    first = np.flatnonzero(np.diff(ticks, prepend=-1) != 0)
+    event_ticks = ticks[first]
+    step_mask = np.bitwise_or.reduceat(bits, first) if len(first) else np.empty(0, np.uint8)
+
+    # DIR state after each event: every axis keeps the direction of its latest step
+    event_of_step = np.cumsum(np.diff(ticks, prepend=-1) != 0) - 1
+    dir_state = np.zeros(len(first), dtype=np.uint8)
+    for axis in range(len(results_by_dof)):
+        mine = bits == (1 << axis)
+        last = np.full(len(first), -1)
+        last[event_of_step[mine]] = np.flatnonzero(mine)
+        last = np.maximum.accumulate(last)
+        fwd = np.where(last >= 0, forward[np.maximum(last, 0)], True)
+        dir_state |= (fwd.astype(np.uint8) << axis)
+
+    # waits between events, with filler events where a wait overflows uint16
+    waits = np.diff(event_ticks, prepend=0)
+    pieces = np.maximum(1, -(-waits // WAIT_MAX))
+    event = np.repeat(np.arange(len(waits)), pieces)
+    piece = np.arange(len(event)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    is_last = piece == pieces[event] - 1
+    events = np.empty(len(event), EVENT_DTYPE)
+    events["wait"] = np.where(is_last, waits[event] - (pieces[event] - 1) * WAIT_MAX, WAIT_MAX)
+    events["step"] = np.where(is_last, step_mask[event], 0)
+    events["dir"] = dir_state[event]
+
+    gaps = np.diff(event_ticks) * tick_us
+    stats = {
+        "events": len(events),
+        "steps": steps_per_axis,
+        "tick_us": tick_us,
+        "min_gap_us": float(gaps.min()) if len(gaps) else 0.0,
+        "peak_rate_hz": float(1e6 / gaps.min()) if len(gaps) and gaps.min() > 0 else 0.0,
+        "max_error_us": float(np.abs(ticks * tick_us - times).max()) if len(times) else 0.0,
+        "duration_s": float(event_ticks[-1] * tick_us / 1e6) if len(event_ticks) else 0.0,
+    }
+    return events, stats
+
+
+# === EXPORT ===
+def write_schedule(path, results_by_dof, segment_start_us=None, tick_us=DEFAULT_TICK_US):
+    """
+    Writes the merged schedule as a PROGMEM header for the replay sketch.
+
+    The sketch polls micros(), so the tick must be a whole number of
+    microseconds; every axis gets a SCHEDULE_BIT_<name> define so the sketch
+    picks its pins by name, not by position.
+
+    Returns:
+        dict: The stats of build_schedule.
+
+    Raises:
+        ValueError: if `tick_us` is not a whole number of microseconds.
+    """
+    if tick_us < 1 or not float(tick_us).is_integer():
+        raise ValueError(f"the schedule sketch polls micros(): the tick must be a whole number "
+                         f"of microseconds, got {tick_us:g}")
+    events, stats = build_schedule(results_by_dof, segment_start_us, tick_us)
+    names = list(results_by_dof)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        f.write(f"{MARKER}: events={stats['events']} steps={sum(stats['steps'].values())} "
+                f"min_gap_us={stats['min_gap_us']:g} duration_s={stats['duration_s']:.3f}\n")
+        f.write("// axes (bit order): " + ", ".join(names) + "\n")
+        f.write(f"// peak combined step rate {stats['peak_rate_hz']:.0f} Hz, "
+                f"max timing error {stats['max_error_us']:.2f} us\n")
+        f.write("#include <avr/pgmspace.h>\n\n")
+        f.write(f"#define SCHEDULE_AXES {len(names)}\n")
+        for bit, name in enumerate(names):
+            f.write(f"#define SCHEDULE_BIT_{name} {bit}\n")
+        # unsigned long so wait * tick never becomes a 16-bit int multiply
+        f.write(f"#define SCHEDULE_TICK_US {int(tick_us)}UL\n")
+        f.write(f"const uint32_t scheduleLength = {len(events)}UL;\n\n")
+        f.write("struct StepEvent { uint16_t wait; uint8_t step; uint8_t dir; };\n")
+        body = ",\n  ".join(f"{{{w}, {s}, {d}}}" for w, s, d in events.tolist())
+        f.write(f"const StepEvent stepEvents[] PROGMEM = {{\n  {body}\n}};\n")
+    return stats
+
+
+_STATS_RE = re.compile(r"(\w+)=([\d.]+)")
+
+
+def read_stats(path):
+    """Figures recorded on the first line of a schedule header."""
+    with open(path, "r") as f:
+        first = f.readline()
+    if not first.startswith(MARKER):
+        raise ValueError(f"{path}: not a BUDDY step schedule")
+    return {key: float(value) for key, value in _STATS_RE.findall(first)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a merged step-event schedule from a profile.")
+    parser.add_argument("profile", help="profile in any form read by profileFormat")
+    parser.add_argument("output", help=f"schedule header (*{SCHEDULE_EXTENSION})")
+    parser.add_argument("--tick-us", type=float, default=DEFAULT_TICK_US,
+                        help="timer tick in microseconds (default: %(default)s)")
+    args = parser.parse_args()
+
+    from .profileFormat import read_profile
+    stats = write_schedule(args.output, read_profile(args.profile), tick_us=args.tick_us)
+    print(f"{args.profile} → {args.output}: {stats['events']} events, "
+          f"peak {stats['peak_rate_hz']:.0f} Hz, {stats['duration_s']:.2f} s")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:48:03 2026
+
+@author: benjaminokoronkwo
+
+Timer-tick profiles (_ticks.h) for step generation from a timer interrupt.
+
+The .txt profiles give every segment `int(1e6 / velocity)` μs per step in an
+`unsigned int`: the truncation loses up to a step's worth of time per
+segment (so a long take drifts off the Blender timeline), and anything above
+65535 μs wraps on AVR. Here every axis is re-derived from the segment
+durations instead and written as
+
+    {steps, delay}     `steps` steps (sign = direction), each `delay` timer
+                       ticks after the previous one; steps == 0 waits `delay`
+
+records, with delays in whole ticks of a hardware timer (e.g. 0.5 μs or 4 μs,
+Timer1 with a /8 or /64 prescaler at 16 MHz):
+
+  - segment boundaries are quantized on the absolute timeline, so each
+    segment's rounding remainder is carried into the next one and the end
+    of every segment is within half a tick of Blender's;
+  - a segment of n steps over T ticks becomes n - T % n steps of T // n
+    ticks and T % n steps of T // n + 1, so its steps fill it exactly;
+  - a delay over the delay width is split into waits (plus a step of the
+    remainder), a run of more steps than the step width allows into several
+    records, and consecutive records that can share one (dwells, or equal
+    delays in the same direction) are merged.
+
+The axes are independent (no shared dataLength); firmware/timer_ticks plays
+them from the two Timer1 compare channels.
+
+Usage:
+    python -m buddy.tickProfile data/processed/tilt_x-axis_test7.txt /tmp/tilt7_ticks.h --tick-us 0.5
+"""
+
+import argparse
+import os
+import re
+
+import numpy as np
+
+TICKS_EXTENSION = "_ticks.h"
+MARKER = "// BUDDY tick profile"
+DEFAULT_TICK_US = 4.0
+STEPS_MAX = 0x7FFF            # int16 steps per record
+DELAY_TYPES = {16: "uint16_t", 32: "uint32_t"}
+AVR_PRESCALERS = (1, 8, 64, 256, 1024)
+AVR_CLOCK_MHZ = 16
+
+
+# === QUANTIZATION ===
+def _records(signs, steps, delays):
+    """Merges neighbouring records that one record can express."""
+    dwell = steps == 0
+    if not len(steps):
+        return signs, steps, delays
+    change = np.ones(len(steps), dtype=bool)
+    change[1:] = (dwell[1:] != dwell[:-1]) | (~dwell[1:] & ((signs[1:] != signs[:-1])
+                                                            | (delays[1:] != delays[:-1])))
+    starts = np.flatnonzero(change)
+    return (signs[starts], np.add.reduceat(steps, starts),
+            np.where(dwell[starts], np.add.reduceat(delays, starts), delays[starts]))
+
+
+def _split(signs, steps, delays, delay_max, steps_max):
+    """Splits records whose delay or step count does not fit the widths."""
+    # a step further than delay_max from the previous one: one record per step
+    long_steps = (steps > 1) & (delays > delay_max)
+    repeat = np.where(long_steps, steps, 1)
+    signs, steps, delays = (np.repeat(signs, repeat), np.repeat(np.where(long_steps, 1, steps), repeat),
+                            np.repeat(delays, repeat))
+    # waits of delay_max, then the record's steps after the rest
+    # (or pieces of steps_max steps; the two never both apply)
+    by_delay = delays > delay_max
+    pieces = np.where(by_delay, -(-delays // delay_max), np.maximum(1, -(-steps // steps_max)))
+    record = np.repeat(np.arange(len(steps)), pieces)
+    piece = np.arange(len(record)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    last = piece == pieces[record] - 1
+    by_delay = by_delay[record]
+    out_steps = np.where(by_delay, np.where(last, steps[record], 0),
+                         np.where(last, steps[record] - (pieces[record] - 1) * steps_max, steps_max))
+    out_delays = np.where(by_delay, np.where(last, delays[record] - (pieces[record] - 1) * delay_max,
+                                             delay_max), delays[record])
+    return signs[record], out_steps, out_delays
+
+
+def quantize_axis(delta_steps, segment_us, tick_us=DEFAULT_TICK_US, delay_max=0xFFFF,
+                  steps_max=STEPS_MAX):
+    """
+    Tick records of one axis.
+
+    Args:
+        delta_steps (array-like): The axis' segments.
+        segment_us (array-like): Duration of every segment (μs), e.g.
+            np.diff(times) * 1e6.
+        tick_us (float): Timer tick.
+        delay_max, steps_max (int): Largest delay (ticks) and step count of a record.
+
+    Returns:
+        tuple:
+            - steps (np.ndarray[int64]): Signed steps per record (0 = wait).
+            - delays (np.ndarray[int64]): Ticks per step (per wait), >= 1.
+            - stats (dict): records, steps, ticks, max_error_us (segment
+              ends vs. the Blender timeline), stretched (segments with more
+              steps than ticks, pushed later).
+    """
+    deltas = np.asarray(delta_steps, dtype=np.int64)
+    segment_us = np.asarray(segment_us, dtype=np.float64)
+    if segment_us.shape != deltas.shape:
+        raise ValueError(f"{len(deltas)} segments but {len(segment_us)} durations")
+    if tick_us <= 0:
+        raise ValueError(f"tick must be positive, got {tick_us}")
+    counts = np.abs(deltas)
+
+    # absolute segment ends, rounded; a segment needs at least a tick per step
+    # (counted from tick 0, so the slack is floored there), and the ends after
+    # one that had to be stretched catch up again
+    end_us = np.cumsum(segment_us)
+    ends = np.rint(end_us / tick_us).astype(np.int64)
+    steps_so_far = np.cumsum(counts)
+    if len(ends):
+        ends = np.maximum.accumulate(np.maximum(ends - steps_so_far, 0)) + steps_so_far
+    ticks = np.diff(ends, prepend=0)
+
+    q, r = np.divmod(ticks, np.maximum(counts, 1))
+    moving = counts > 0
+    run_steps = np.stack((np.where(moving, counts - r, 0), np.where(moving, r, 0)), axis=1)
+    run_delays = np.stack((np.where(moving, q, ticks), q + 1), axis=1)
+    keep = np.stack((np.where(moving, counts - r > 0, ticks > 0), moving & (r > 0)), axis=1)
+    signs = np.repeat(np.where(deltas < 0, -1, 1), 2).reshape(-1, 2)
+    signs, steps, delays = _records(signs[keep], run_steps[keep], run_delays[keep])
+    signs, steps, delays = _split(signs, steps, delays, delay_max, steps_max)
+
+    stats = {
+        "records": len(steps),
+        "steps": int(counts.sum()),
+        "ticks": int(ends[-1]) if len(ends) else 0,
+        "max_error_us": float(np.abs(ends * tick_us - end_us).max()) if len(ends) else 0.0,
+        "stretched": int(np.count_nonzero(counts > np.rint(segment_us / tick_us))),
+    }
+    return signs * steps, delays, stats
+
+
+def chained_segment_us(delta_steps, delay_times_us):
+    """Segment durations of a plain profile played back to back (no dwell times)."""
+    return np.abs(np.asarray(delta_steps, np.float64)) * np.asarray(delay_times_us, np.float64)
+
+
+def avr_prescaler(tick_us, clock_mhz=AVR_CLOCK_MHZ):
+    """Timer1 prescaler giving `tick_us`, or None."""
+    for prescaler in AVR_PRESCALERS:
+        if abs(prescaler / clock_mhz - tick_us) < 1e-9:
+            return prescaler
+    return None
+
+
+# === EXPORT ===
+def write_tick_profile(path, results_by_dof, segment_us=None, tick_us=DEFAULT_TICK_US,
+                       delay_bits=16):
+    """
+    Writes {dof_name: (delta_steps, delay_times_us)} as tick records.
+
+    Args:
+        segment_us (array-like | None): Per-segment durations shared by all
+            axes; None plays each axis' segments back to back.
+        delay_bits (int): Width of the delays, 16 (AVR timers) or 32.
+
+    Returns:
+        dict: {dof_name: quantize_axis stats}.
+    """
+    if delay_bits not in DELAY_TYPES:
+        raise ValueError(f"delay width must be one of {sorted(DELAY_TYPES)}, got {delay_bits}")
+    delay_max = 2 ** delay_bits - 1
+    tables, stats = {}, {}
+    for name, (deltas, delays) in results_by_dof.items():
+        durations = chained_segment_us(deltas, delays) if segment_us is None else segment_us
+        steps, ticks, stats[name] = quantize_axis(deltas, durations, tick_us, delay_max)
+        if len(steps) > 0xFFFF:
+            raise ValueError(f"axis '{name}': {len(steps)} records exceed the uint16 table length")
+        tables[name] = (steps, ticks)
+
+    names = list(tables)
+    records = sum(s["records"] for s in stats.values())
+    max_error = max((s["max_error_us"] for s in stats.values()), default=0.0)
+    duration = max((s["ticks"] for s in stats.values()), default=0) * tick_us / 1e6
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        f.write(f"{MARKER}: records={records} tick_us={tick_us:g} delay_bits={delay_bits} "
+                f"max_error_us={max_error:.3f} duration_s={duration:.3f}\n")
+        f.write("// axes: " + ", ".join(f"{n} ({stats[n]['records']} records, "
+                                         f"{stats[n]['steps']} steps)" for n in names) + "\n")
+        f.write("#include <avr/pgmspace.h>\n\n")
+        f.write(f"#define TICK_AXES {len(names)}\n")
+        for index, name in enumerate(names):
+            f.write(f"#define TICK_AXIS_{name} {index}\n")
+        f.write(f"#define TICK_US {tick_us:g}\n")
+        f.write(f"#define TICK_DELAY_BITS {delay_bits}\n")
+        prescaler = avr_prescaler(tick_us)
+        if prescaler:
+            f.write(f"#define TICK_PRESCALER {prescaler}   // Timer1 at {AVR_CLOCK_MHZ} MHz\n")
+        delay_type = DELAY_TYPES[delay_bits]
+        for name, (steps, ticks) in tables.items():
+            f.write(f"\n// --- {name} axis ---\n")
+            f.write(f"const uint16_t tickLength{name} = {len(steps)};\n")
+            f.write(f"const int16_t tickSteps{name}[] PROGMEM = {{\n  "
+                    + ", ".join(map(str, steps.tolist())) + "\n};\n")
+            f.write(f"const {delay_type} tickDelays{name}[] PROGMEM = {{\n  "
+                    + ", ".join(map(str, ticks.tolist())) + "\n};\n")
+        f.write("\nconst uint16_t tickLengths[TICK_AXES] = {"
+                + ", ".join(f"tickLength{n}" for n in names) + "};\n")
+        f.write("const int16_t *const tickSteps[TICK_AXES] = {"
+                + ", ".join(f"tickSteps{n}" for n in names) + "};\n")
+        f.write(f"const {delay_type} *const tickDelays[TICK_AXES] = {{"
+                + ", ".join(f"tickDelays{n}" for n in names) + "};\n")
+    return stats
+
+
+# === READERS ===
+_STATS_RE = re.compile(r"(\w+)=([\d.]+)")
+_TABLE_RE = re.compile(r"tick(Steps|Delays)(\w+)\[\]\s*PROGMEM\s*=\s*\{([^}]*)\}")
+
+
+def is_tick_profile(path):
+    with open(path, "rb") as f:
+        return f.read(len(MARKER)) == MARKER.encode("ascii")
+
+
+def read_stats(path):
+    """Figures recorded on the first line of a tick profile."""
+    with open(path, "r") as f:
+        first = f.readline()
+    if not first.startswith(MARKER):
+        raise ValueError(f"{path}: not a BUDDY tick profile")
+    return {key: float(value) for key, value in _STATS_RE.findall(first)}
+
+
+def read_tick_profile(path):
+    """
+    Parses the tables of a tick profile.
+
+    Returns:
+        dict[str, tuple[np.ndarray, np.ndarray]]: {dof_name: (int64 steps, int64 ticks)}
+    """
+    with open(path, "r") as f:
+        text = f.read()
+    tables = {}
+    for kind, name, body in _TABLE_RE.findall(text):
+        tables.setdefault(name, {})[kind] = np.array(body.replace(",", " ").split(), dtype=np.int64)
+    for name, pair in tables.items():
+        if set(pair) != {"Steps", "Delays"}:
+            raise ValueError(f"{path}: axis '{name}' is missing tickSteps or tickDelays")
+    return {name: (pair["Steps"], pair["Delays"]) for name, pair in tables.items()}
+
+
+def step_ticks(steps, delays):
+    """Absolute tick of every step (for checking a table against its take)."""
+    steps = np.asarray(steps, dtype=np.int64)
+    delays = np.asarray(delays, dtype=np.int64)
+    counts = np.maximum(np.abs(steps), 1)      # a wait advances time like one step
+    ends = np.cumsum(np.repeat(delays, counts))
+    return ends[np.repeat(steps != 0, counts)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Quantize a profile to timer-tick records.")
+    parser.add_argument("profile", help="profile in any form read by profileFormat")
+    parser.add_argument("output", help=f"tick profile header (*{TICKS_EXTENSION})")
+    parser.add_argument("--tick-us", type=float, default=DEFAULT_TICK_US,
+                        help="timer tick in microseconds (default: %(default)s)")
+    parser.add_argument("--delay-bits", type=int, default=16, choices=sorted(DELAY_TYPES))
+    args = parser.parse_args()
+
+    from .profileFormat import read_profile
+    stats = write_tick_profile(args.output, read_profile(args.profile), tick_us=args.tick_us,
+                               delay_bits=args.delay_bits)
+    for name, s in stats.items():
+        print(f"{name}: {s['records']} records, {s['steps']} steps, "
+              f"{s['ticks'] * args.tick_us / 1e6:.3f} s, max error {s['max_error_us']:.2f} us")
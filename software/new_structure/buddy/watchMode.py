@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:35:52 2026
+
+@author: benjaminokoronkwo
+
+Watch mode: reconvert takes as Blender exports them.
+
+Watches folders of take CSVs (inotify / FSEvents through `watchdog` when it
+is installed, a stat() poll of the folders otherwise) and reconverts a take
+once its CSV has settled: same size and mtime for `settle_s`, and ending on
+a complete line, so a half-written export is never converted. Only takes
+whose CSV changed since their last conversion are redone, in this process,
+so the imports, the parameter setup and the conversion cache stay warm.
+
+    python -m buddy.buddyConvert data/motion --watch
+"""
+
+import fnmatch
+import glob
+import os
+import threading
+import time
+
+POLL_S = 0.02             # folder scan / pending check interval
+SETTLE_S = 0.03           # a CSV must stay unchanged this long before it is converted
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _complete(path):
+    """True if the CSV ends on a newline (Blender writes whole rows)."""
+    try:
+        with open(path, "rb") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except OSError:
+        return False
+
+
+def watch_targets(patterns):
+    """(folder, filename glob) pairs: a directory means every *.csv in it."""
+    targets = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            targets.append((os.path.abspath(pattern), "*.csv"))
+        else:
+            targets.append((os.path.abspath(os.path.dirname(pattern) or "."),
+                            os.path.basename(pattern)))
+    return targets
+
+
+class TakeWatcher:
+    """
+    Tracks the take CSVs under `targets` and calls `convert(path)` for every
+    take that changed and settled.
+
+    Args:
+        targets (list[tuple[str, str]]): (folder, filename glob), see watch_targets.
+        convert (callable): Converts one CSV; its return value is passed to `log`.
+        settle_s (float): Quiet time before a changed CSV counts as written.
+        poll_s (float): Loop interval.
+        use_watchdog (bool | None): Force (True) or refuse (False) the
+            watchdog backend; None uses it when importable.
+    """
+
+    def __init__(self, targets, convert, settle_s=SETTLE_S, poll_s=POLL_S, use_watchdog=None,
+                 log=print):
+        self.targets = targets
+        self.convert = convert
+        self.settle_s = settle_s
+        self.poll_s = poll_s
+        self.log = log
+        self.converted = {}       # path → signature of the CSV last converted
+        self._pending = {}        # path → (signature, time it was first seen that way)
+        self._lock = threading.Lock()
+        self._observer = None
+        self.backend = "poll"
+        if use_watchdog is not False:
+            try:
+                self._observer = self._start_watchdog()
+                self.backend = "watchdog"
+            except ImportError:
+                if use_watchdog:
+                    raise
+
+    # --- change detection ---
+    def _matches(self, path):
+        folder, name = os.path.split(os.path.abspath(path))
+        return any(folder == f and fnmatch.fnmatch(name, pattern) for f, pattern in self.targets)
+
+    def _start_watchdog(self):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for path in (event.src_path, getattr(event, "dest_path", None)):
+                    if path and watcher._matches(path):
+                        watcher._mark(path)
+
+        observer = Observer()
+        for folder in {folder for folder, _ in self.targets}:
+            observer.schedule(Handler(), folder, recursive=False)
+        observer.start()
+        return observer
+
+    def _mark(self, path):
+        with self._lock:
+            self._pending.setdefault(os.path.abspath(path), (None, time.monotonic()))
+
+    def scan(self):
+        """Marks every matching CSV whose signature differs from its last conversion."""
+        for folder, pattern in self.targets:
+            for path in glob.glob(os.path.join(folder, pattern)):
+                if os.path.isfile(path) and self.converted.get(path) != _signature(path):
+                    self._mark(path)
+
+    # --- conversion ---
+    def poll(self):
+        """Converts the pending takes that have settled; returns how many were converted."""
+        if self._observer is None:
+            self.scan()
+        now = time.monotonic()
+        with self._lock:
+            pending = list(self._pending.items())
+        done = 0
+        for path, (seen_sig, since) in pending:
+            sig = _signature(path)
+            if sig is None:                                  # deleted or renamed away
+                with self._lock:
+                    self._pending.pop(path, None)
+                continue
+            if sig != seen_sig:                              # still being written
+                with self._lock:
+                    self._pending[path] = (sig, now)
+                continue
+            if now - since < self.settle_s or not _complete(path):
+                continue
+            with self._lock:
+                self._pending.pop(path, None)
+            if self.converted.get(path) == sig:
+                continue
+            start = time.perf_counter()
+            result = self.convert(path)
+            self.converted[path] = sig
+            done += 1
+            # turnaround: from the export's last write to the profile being on disk
+            turnaround = time.time() - sig[0] / 1e9
+            self.log(path, result, time.perf_counter() - start, turnaround)
+        return done
+
+    def run(self, stop=None):
+        """Loops until `stop` (a threading.Event) is set or Ctrl-C."""
+        self.scan()
+        try:
+            while stop is None or not stop.is_set():
+                self.poll()
+                time.sleep(self.poll_s)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
@@ -8,6 +8,15 @@ Created on Wed Aug 13 12:25:54 2025
 
 import bpy
 import math
+import time
+
+# Shared, config-driven envelope (buddy/speedEnvelope.py / envelopes.json). Blender
+# only finds it when new_structure is on sys.path (or buddy is pip-installed into
+# Blender's Python); otherwise the inline profile below is used.
+try:
+    from buddy.speedEnvelope import tilt_envelope
+except ImportError:
+    tilt_envelope = None
 
 # === USER CONFIGURATION ===
 ARM_NAME   = "Armature"      # Your armature object name
@@ -46,6 +55,9 @@ def tilt_linear_speed_in_per_s(x_deg: float) -> float:
 
 # Convert in/s -> deg/s
 def tilt_speed_deg_per_s(x_deg: float, radius_in: float) -> float:
+    if tilt_envelope is not None:
+        env = tilt_envelope(radius_in, LIMITS["tilt_min_deg"], LIMITS["tilt_max_deg"])
+        return env.scalar(x_deg)
     v_in_s = tilt_linear_speed_in_per_s(x_deg)
     omega_rad_s = v_in_s / radius_in
     return math.degrees(omega_rad_s)
@@ -56,75 +68,201 @@ def slide_speed_in_per_s(x_in: float) -> float:
 def clamp(val, lo, hi):
     return lo if val < lo else hi if val > hi else val
 
-def on_frame(scene):
+def step_toward(current, target, max_step, lo, hi):
+    delta = target - current
+    if   delta >  max_step: new = current + max_step
+    elif delta < -max_step: new = current - max_step
+    else:                   new = target
+    return clamp(new, lo, hi)
+
+# === BAKED GOVERNOR ===
+# The governed pose of a frame depends on every frame before it, so stepping
+# the bones in frame_change_post gave different poses when scrubbing, jumping
+# or rendering out of order. Instead the whole scene range is governed once,
+# from the CTRL_Rig target fcurves, and the frame handler only looks the
+# frame up. depsgraph_update_post re-bakes when the targets (keyframes,
+# extrapolation and modifiers, unkeyed property values, arm length), the frame
+# range or the fps change.
+_cache = {
+    "key": None,          # bake_key() the table was baked from
+    "start": 0,           # first baked frame
+    "tilt": [], "slide": [], "pan": [],   # governed value per frame, None = bone absent
+    "bones": None,        # (tilt, slide, pan) pose bones, dropped on undo / file load
+    "bake_ms": 0.0,
+    "handler_us": 0.0,    # last frame handler call
+    "handler_avg_us": 0.0,
+}
+
+TARGET_PROPS = (PROP_TILT_TARGET_DEG, PROP_SLIDE_TARGET_IN, PROP_PAN_TARGET_DEG)
+
+def _target_fcurve(arm_obj, prop):
+    """The CTRL_Rig fcurve driving prop, slotted (layered) actions included."""
+    anim_data = arm_obj.animation_data
+    action = anim_data.action if anim_data else None
+    if action is None:
+        return None
+    data_path = f'pose.bones["{CTRL_BONE}"]["{prop}"]'
+    slot = getattr(anim_data, "action_slot", None)
+    if slot is not None and getattr(action, "layers", None):
+        for layer in action.layers:
+            for strip in layer.strips:
+                bag = strip.channelbag(slot)
+                fc = bag.fcurves.find(data_path) if bag else None
+                if fc is not None:
+                    return fc
+        return None
+    return action.fcurves.find(data_path)
+
+def _rna_key(struct):
+    """Editable settings of an fcurve modifier (and its control points), as a tuple."""
+    out = []
+    for p in struct.bl_rna.properties:
+        if p.identifier == "rna_type" or p.type == 'POINTER':
+            continue
+        value = getattr(struct, p.identifier)
+        if p.type == 'COLLECTION':
+            value = tuple(_rna_key(item) for item in value)
+        elif p.is_readonly:
+            continue
+        elif p.type == 'ENUM' and p.is_enum_flag:
+            value = tuple(sorted(value))
+        elif hasattr(value, "__len__") and not isinstance(value, str):
+            value = tuple(value)
+        out.append((p.identifier, value))
+    return tuple(out)
+
+def _curve_key(fc):
+    return (tuple((tuple(k.co), tuple(k.handle_left), tuple(k.handle_right),
+                   k.interpolation, k.easing) for k in fc.keyframe_points),
+            fc.extrapolation,
+            tuple(_rna_key(m) for m in fc.modifiers))
+
+def _scene_key(scene):
+    return (scene.frame_start, scene.frame_end, scene.render.fps, scene.render.fps_base)
+
+def bake_key(scene, arm_obj, ctrl, curves=None):
+    """
+    Everything the baked table depends on, as a hashable tuple. curves is a
+    previous key whose fcurve entries are reused when the action is unchanged.
+    """
+    key = list(_scene_key(scene)) + [float(ctrl.get(PROP_ARM_RADIUS_IN, 2.0))]
+    for i, prop in enumerate(TARGET_PROPS, start=len(key)):
+        fc = _target_fcurve(arm_obj, prop)
+        if fc is None or fc.mute:
+            key.append(float(ctrl.get(prop, 0.0)))
+        elif curves is not None and isinstance(curves[i], tuple):
+            key.append(curves[i])
+        else:
+            key.append(_curve_key(fc))
+    return tuple(key)
+
+def _targets(arm_obj, ctrl, prop, frames):
+    fc = _target_fcurve(arm_obj, prop)
+    if fc is None or fc.mute:
+        value = float(ctrl.get(prop, 0.0))
+        return [value] * len(frames)
+    return [fc.evaluate(f) for f in frames]
+
+def bake(scene, arm_obj, ctrl, key=None):
+    """Governs the whole scene range; each bone starts on its first target."""
+    t0 = time.perf_counter()
+    fps = scene.render.fps / scene.render.fps_base
+    dt = 1.0 / fps if fps > 0 else 0.0
+    pb = arm_obj.pose.bones
+    arm_radius_in = float(ctrl.get(PROP_ARM_RADIUS_IN, 2.0))
+    frames = range(scene.frame_start, scene.frame_end + 1)
+
+    def govern(bone, prop, speed, lo, hi):
+        if not bone or bone not in pb:
+            return [None] * len(frames)
+        targets = _targets(arm_obj, ctrl, prop, frames)
+        out = []
+        cur = clamp(targets[0], lo, hi) if targets else 0.0
+        for target in targets:
+            cur = step_toward(cur, target, speed(cur) * dt, lo, hi)
+            out.append(cur)
+        return out
+
+    _cache["tilt"] = govern(TILT_BONE, PROP_TILT_TARGET_DEG,
+                            lambda x: tilt_speed_deg_per_s(x, arm_radius_in),
+                            LIMITS["tilt_min_deg"], LIMITS["tilt_max_deg"])
+    _cache["slide"] = govern(SLIDE_BONE, PROP_SLIDE_TARGET_IN, slide_speed_in_per_s,
+                             LIMITS["slide_min_in"], LIMITS["slide_max_in"])
+    _cache["pan"] = govern(PAN_BONE, PROP_PAN_TARGET_DEG, lambda x: PAN_CONST_DEG_PER_S,
+                           LIMITS["pan_min_deg"], LIMITS["pan_max_deg"])
+    _cache["start"] = scene.frame_start
+    _cache["bones"] = (pb.get(TILT_BONE), pb.get(SLIDE_BONE), pb.get(PAN_BONE) if PAN_BONE else None)
+    _cache["key"] = key if key is not None else bake_key(scene, arm_obj, ctrl)
+    _cache["bake_ms"] = (time.perf_counter() - t0) * 1000.0
+    if ctrl.get(PROP_DEBUG, False):
+        print(f"GOVERNOR | baked {len(frames)} frames in {_cache['bake_ms']:.1f} ms")
+
+def _rig(scene):
     arm_obj = bpy.data.objects.get(ARM_NAME)
     if not arm_obj or arm_obj.type != 'ARMATURE':
+        return None, None
+    return arm_obj, arm_obj.pose.bones.get(CTRL_BONE)
+
+def invalidate(*_args):
+    _cache["key"] = None
+    _cache["bones"] = None
+
+def on_depsgraph(scene, depsgraph):
+    # on_frame's own bone writes land here as armature updates every frame, so the
+    # fcurves are only walked again when the CTRL_Rig action itself was updated
+    arm_obj, ctrl = _rig(scene)
+    if not ctrl:
         return
-    fps = scene.render.fps / scene.render.fps_base
-    if fps <= 0:
+    cached = _cache["key"]
+    action = arm_obj.animation_data.action if arm_obj.animation_data else None
+    updated = {u.id.original for u in depsgraph.updates}
+    action_updated = cached is None or (action is not None and action in updated)
+    if not action_updated and arm_obj not in updated and cached[:4] == _scene_key(scene):
         return
-    dt = 1.0 / fps
-    pb = arm_obj.pose.bones
-    ctrl = pb.get(CTRL_BONE)
-    if not ctrl:
+    key = bake_key(scene, arm_obj, ctrl, curves=None if action_updated else cached)
+    if key != _cache["key"]:
+        bake(scene, arm_obj, ctrl, key)
+        on_frame(scene)
+
+def on_frame(scene):
+    t0 = time.perf_counter()
+    if _cache["bones"] is None:
+        arm_obj, ctrl = _rig(scene)
+        if not ctrl:
+            return
+        bake(scene, arm_obj, ctrl)
+    n = len(_cache["tilt"])
+    if n == 0:
         return
-    arm_radius_in = float(ctrl.get(PROP_ARM_RADIUS_IN, 2.0))
-    debug_on = bool(ctrl.get(PROP_DEBUG, False))
-
-    # --- Tilt ---
-    if TILT_BONE in pb:
-        tilt = pb[TILT_BONE]
-        target_deg  = float(ctrl.get(PROP_TILT_TARGET_DEG, 0.0))
-        current_deg = math.degrees(tilt.rotation_euler.x)
-        max_deg_s = tilt_speed_deg_per_s(current_deg, arm_radius_in)
-        max_step  = max_deg_s * dt
-        delta = target_deg - current_deg
-        if   delta >  max_step: new_deg = current_deg + max_step
-        elif delta < -max_step: new_deg = current_deg - max_step
-        else:                   new_deg = target_deg
-        new_deg = clamp(new_deg, LIMITS["tilt_min_deg"], LIMITS["tilt_max_deg"])
-        tilt.rotation_euler.x = math.radians(new_deg)
-        if debug_on:
-            print(f"TILT | {current_deg:.2f}° -> {new_deg:.2f}° @ {max_deg_s:.2f}°/s")
-
-    # --- Slide ---
-    if SLIDE_BONE in pb:
-        slide = pb[SLIDE_BONE]
-        target_in  = float(ctrl.get(PROP_SLIDE_TARGET_IN, 0.0))
-        current_in = slide.location.x / 0.0254
-        max_in_s = slide_speed_in_per_s(current_in)
-        max_step = max_in_s * dt
-        delta = target_in - current_in
-        if   delta >  max_step: new_in = current_in + max_step
-        elif delta < -max_step: new_in = current_in - max_step
-        else:                   new_in = target_in
-        new_in = clamp(new_in, LIMITS["slide_min_in"], LIMITS["slide_max_in"])
-        slide.location.x = new_in * 0.0254
-        if debug_on:
-            print(f"SLIDE | {current_in:.2f}in -> {new_in:.2f}in @ {max_in_s:.2f} in/s")
-
-    # --- Pan ---
-    if PAN_BONE and PAN_BONE in pb:
-        pan = pb[PAN_BONE]
-        target_deg = float(ctrl.get(PROP_PAN_TARGET_DEG, 0.0))
-        current_deg = math.degrees(pan.rotation_euler.z)
-        max_step = PAN_CONST_DEG_PER_S * dt
-        delta = target_deg - current_deg
-        if   delta >  max_step: new_deg = current_deg + max_step
-        elif delta < -max_step: new_deg = current_deg - max_step
-        else:                   new_deg = target_deg
-        new_deg = clamp(new_deg, LIMITS["pan_min_deg"], LIMITS["pan_max_deg"])
-        pan.rotation_euler.z = math.radians(new_deg)
-        if debug_on:
-            print(f"PAN | {current_deg:.2f}° -> {new_deg:.2f}° @ {PAN_CONST_DEG_PER_S:.2f}°/s")
-
-# Register handler
+    i = min(max(scene.frame_current - _cache["start"], 0), n - 1)
+    tilt, slide, pan = _cache["bones"]
+    try:
+        if tilt is not None:
+            tilt.rotation_euler.x = math.radians(_cache["tilt"][i])
+        if slide is not None:
+            slide.location.x = _cache["slide"][i] * 0.0254
+        if pan is not None:
+            pan.rotation_euler.z = math.radians(_cache["pan"][i])
+    except ReferenceError:    # bones freed (armature deleted / rebuilt): re-bake next frame
+        invalidate()
+        return
+    us = (time.perf_counter() - t0) * 1e6
+    _cache["handler_us"] = us
+    _cache["handler_avg_us"] = 0.9 * _cache["handler_avg_us"] + 0.1 * us if _cache["handler_avg_us"] else us
+
+# Register handlers
 def _install_handler():
-    h = bpy.app.handlers.frame_change_post
-    for fn in list(h):
-        if getattr(fn, "__name__", "") == "on_frame":
-            h.remove(fn)
-    h.append(on_frame)
+    installs = ((bpy.app.handlers.frame_change_post, on_frame),
+                (bpy.app.handlers.depsgraph_update_post, on_depsgraph),
+                (bpy.app.handlers.load_post, invalidate),
+                (bpy.app.handlers.undo_post, invalidate),
+                (bpy.app.handlers.redo_post, invalidate))
+    for h, handler in installs:
+        for fn in list(h):
+            if getattr(fn, "__name__", "") == handler.__name__:
+                h.remove(fn)
+        h.append(handler)
+    invalidate()
 
 _install_handler()
 
@@ -152,6 +290,11 @@ class RIG_PT_CustomPanel(bpy.types.Panel):
         layout.prop(ctrl, f'["{PROP_PAN_TARGET_DEG}"]', text="Pan (deg)")
         layout.prop(ctrl, f'["{PROP_ARM_RADIUS_IN}"]', text="Arm length (in)")
         layout.prop(ctrl, f'["{PROP_DEBUG}"]', text="Debug On")
+        if ctrl.get(PROP_DEBUG, False):
+            box = layout.box()
+            box.label(text=f"Handler: {_cache['handler_us']:.1f} µs/frame "
+                           f"(avg {_cache['handler_avg_us']:.1f} µs)")
+            box.label(text=f"Bake: {len(_cache['tilt'])} frames in {_cache['bake_ms']:.1f} ms")
 
 classes = [RIG_PT_CustomPanel]
 
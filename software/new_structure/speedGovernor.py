@@ -25,6 +25,14 @@ Created on Wed Aug 13 01:40:08 2025
 import bpy
 import math
 
+# Shared, config-driven envelope (buddy/speedEnvelope.py / envelopes.json). Blender
+# only finds it when new_structure is on sys.path (or buddy is pip-installed into
+# Blender's Python); otherwise the inline profile below is used.
+try:
+    from buddy.speedEnvelope import tilt_envelope
+except ImportError:
+    tilt_envelope = None
+
 # === USER CONFIGURATION ===
 ARM_NAME   = "Armature"      # Your armature object name
 CTRL_BONE  = "CTRL_Rig"      # Bone with the target properties
@@ -81,6 +89,9 @@ def tilt_linear_speed_in_per_s(x_deg: float) -> float:
 
 def tilt_speed_deg_per_s(x_deg: float, radius_in: float) -> float:
     """Convert linear (in/s) to angular (deg/s) using arm length R (in)."""
+    if tilt_envelope is not None:
+        env = tilt_envelope(radius_in, LIMITS["tilt_min_deg"], LIMITS["tilt_max_deg"])
+        return env.scalar(x_deg)
     r = max(1e-6, abs(radius_in))  # avoid divide-by-zero
     v_in_s = tilt_linear_speed_in_per_s(x_deg)
     omega_deg_s = (v_in_s / r) * (180.0 / math.pi)
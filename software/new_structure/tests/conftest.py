@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures: the recorded takes of data/motion and their profiles."""
+
+import glob
+import os
+
+import pytest
+
+from buddy import blenderToArduino
+
+MOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "motion")
+TAKES = sorted(glob.glob(os.path.join(MOTION_DIR, "*.csv")))
+
+
+@pytest.fixture(scope="module", params=TAKES, ids=os.path.basename)
+def take(request):
+    """(times_s, {dof: (deltas, delays)}) of one recorded take, both axes."""
+    times_s, lin_x, rot_x = blenderToArduino.load_take(request.param)
+    return times_s, blenderToArduino.build_results(times_s, lin_x, rot_x,
+                                                   dofs=blenderToArduino.ALL_DOFS)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+govern_axis against a straight port of the on_frame handler's step_toward
+loop (speedGovernor.py / speedGovernerUI.py), frame by frame.
+"""
+
+import numpy as np
+import pytest
+
+from buddy import governorSim
+from buddy.speedEnvelope import load_envelopes, tilt_envelope
+
+
+# === BASELINE (the Blender handler, one frame per call) ===
+def clamp(val, lo, hi):
+    return lo if val < lo else hi if val > hi else val
+
+
+def step_toward(current, target, max_step, lo, hi):
+    delta = target - current
+    if   delta >  max_step: new = current + max_step
+    elif delta < -max_step: new = current - max_step
+    else:                   new = target
+    return clamp(new, lo, hi)
+
+
+def on_frame_loop(targets, dt, speed, lo, hi, initial=None):
+    dt = np.broadcast_to(dt, len(targets))
+    cur = clamp(targets[0], lo, hi) if initial is None else initial
+    out = []
+    for target, frame_dt in zip(targets, dt):
+        cur = step_toward(cur, target, speed(cur) * frame_dt, lo, hi)
+        out.append(cur)
+    return out
+
+
+def random_targets(rng, n, lo, hi):
+    """Slow drifts (tracked) broken by jumps and excursions past the limits."""
+    span = hi - lo
+    steps = rng.normal(0.0, span * 0.002, n)
+    jumps = rng.random(n) < 0.03
+    steps[jumps] = rng.uniform(-span, span, jumps.sum())
+    return np.clip(lo + span / 2 + np.cumsum(steps), lo - span / 4, hi + span / 4)
+
+
+# === TESTS ===
+@pytest.fixture(scope="module")
+def axes():
+    limits = governorSim.LIMITS
+    envelopes = load_envelopes()
+    return {
+        "tilt": (tilt_envelope(governorSim.ARM_TILT_RADIUS_IN, limits["tilt_min_deg"],
+                               limits["tilt_max_deg"]),
+                 limits["tilt_min_deg"], limits["tilt_max_deg"]),
+        "slide": (envelopes["slide"], limits["slide_min_in"], limits["slide_max_in"]),
+        "pan": (envelopes["pan"], limits["pan_min_deg"], limits["pan_max_deg"]),
+    }
+
+
+@pytest.mark.parametrize("axis", ["tilt", "slide", "pan"])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_on_frame_loop(axes, axis, seed):
+    env, lo, hi = axes[axis]
+    rng = np.random.default_rng(seed)
+    targets = random_targets(rng, 400, lo, hi)
+    for dt in (1 / 24, rng.uniform(0.01, 0.08, len(targets))):
+        for initial in (None, lo, hi, (lo + hi) / 2, hi + (hi - lo)):   # last: outside the limits
+            expected = on_frame_loop(targets, dt, env.scalar, lo, hi, initial)
+            governed = governorSim.govern_axis(targets, dt, env.scalar, env.array, lo, hi, initial)
+            np.testing.assert_array_equal(governed, expected)
+
+
+def test_clamped_targets_hold_at_the_limit(axes):
+    env, lo, hi = axes["tilt"]
+    targets = np.concatenate([np.linspace(0.0, 60.0, 50), np.full(50, 60.0),
+                              np.linspace(60.0, -60.0, 100)])
+    governed = governorSim.govern_axis(targets, 1 / 24, env.scalar, env.array, lo, hi)
+    np.testing.assert_array_equal(governed, on_frame_loop(targets, 1 / 24, env.scalar, lo, hi))
+    assert governed.max() == hi and governed.min() == lo
+
+
+def test_initial_pose_is_walked_to_the_first_target(axes):
+    env, lo, hi = axes["pan"]
+    targets = np.full(200, 45.0)
+    governed = governorSim.govern_axis(targets, 1 / 24, env.scalar, env.array, lo, hi,
+                                       initial=-80.0)
+    np.testing.assert_array_equal(governed, on_frame_loop(targets, 1 / 24, env.scalar, lo, hi,
+                                                          initial=-80.0))
+    assert governed[0] > -80.0 and governed[0] < 45.0 and governed[-1] == 45.0
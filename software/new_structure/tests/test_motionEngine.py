@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+motionEngine (and the linMotion / rotMotion wrappers on top of it) against
+the original list implementations, on every recorded take in data/motion.
+"""
+
+import csv
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from buddy import blenderToArduino, buddyConvert, motionEngine
+from buddy.linMotion import linMotion
+from buddy.rotMotion import rotMotion
+
+MOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "motion")
+TAKES = sorted(glob.glob(os.path.join(MOTION_DIR, "*.csv")))
+
+
+# === BASELINE (the per-sample loops the NumPy core replaced) ===
+def baseline_lin_motion(lin_data, times, pulley_teeth=36, belt_pitch_mm=2, steps_per_rev=1600):
+    circumference = pulley_teeth * belt_pitch_mm / 1000
+    start_x, end_x = lin_data[0], lin_data[-1]
+    displacement = end_x - start_x
+    if abs(displacement) < 1e-4:
+        eased_m = lin_data
+    else:
+        ease = 0.5 - 0.5 * np.cos(np.linspace(0, np.pi, len(lin_data)))
+        eased_m = [start_x + displacement * e for e in ease]
+    steps = [int(round((x / circumference) * steps_per_rev)) for x in eased_m]
+    delta_steps, delay_times_us = [], []
+    for i in range(1, len(steps)):
+        d_steps = steps[i] - steps[i - 1]
+        delta_steps.append(d_steps)
+        dt_s = times[i] - times[i - 1]
+        if d_steps != 0 and dt_s > 0:
+            delay_us = int(1_000_000 / (abs(d_steps) / dt_s))
+        else:
+            delay_us = 0
+        delay_times_us.append(delay_us)
+    return delta_steps, delay_times_us
+
+
+def baseline_rot_motion(rot_data, times, steps_per_rev=1600):
+    n = len(rot_data)
+    rot_start, rot_end = rot_data[0], rot_data[-1]
+    if abs(rot_end - rot_start) < 0.01:
+        eased_rot_x = rot_data
+    else:
+        ease = 0.5 - 0.5 * np.cos(np.linspace(0, np.pi, n))
+        eased_rot_x = [rot_start + (rot_end - rot_start) * e for e in ease]
+    steps = [int((rx / 360.0) * steps_per_rev) for rx in eased_rot_x]
+    delta_steps, delay_times_us = [], []
+    for i in range(1, len(steps)):
+        delta = steps[i] - steps[i - 1]
+        time_diff_s = times[i] - times[i - 1]
+        delay_per_step = 1_000_000 / (abs(delta) / time_diff_s) if delta != 0 else 0
+        delta_steps.append(delta)
+        delay_times_us.append(int(delay_per_step))
+    return delta_steps, delay_times_us
+
+
+def read_take_lists(path):
+    """Time / X / RotX columns as float lists, read the way the old scripts did."""
+    times_s, lin_x, rot_x = [], [], []
+    with open(path, "r") as f:
+        for row in csv.DictReader(f):
+            times_s.append(float(row["Time (s)"]))
+            lin_x.append(float(row["X (m)"]))
+            rot_x.append(float(row["RotX (deg)"]))
+    return times_s, lin_x, rot_x
+
+
+# === TESTS ===
+def test_corpus_present():
+    assert len(TAKES) >= 20
+
+
+@pytest.mark.parametrize("path", TAKES, ids=os.path.basename)
+def test_wrappers_match_baseline(path):
+    times_s, lin_x, rot_x = read_take_lists(path)
+    assert linMotion(lin_x, times_s) == baseline_lin_motion(lin_x, times_s)
+    assert rotMotion(rot_x, times_s) == baseline_rot_motion(rot_x, times_s)
+
+
+@pytest.mark.parametrize("path", TAKES, ids=os.path.basename)
+@pytest.mark.parametrize("drive", [(36, 2, 1600), (20, 2, 3200), (40, 3, 400)])
+def test_arrays_match_baseline(path, drive):
+    times_s, lin_x, rot_x = blenderToArduino.load_take(path)
+    teeth, pitch, steps_per_rev = drive
+    deltas, delays = motionEngine.lin_motion_arrays(lin_x, times_s, teeth, pitch, steps_per_rev)
+    ref_deltas, ref_delays = baseline_lin_motion(lin_x.tolist(), times_s.tolist(), teeth, pitch,
+                                                 steps_per_rev)
+    np.testing.assert_array_equal(deltas, ref_deltas)
+    np.testing.assert_array_equal(delays, ref_delays)
+
+    deltas, delays = motionEngine.rot_motion_arrays(rot_x, times_s, steps_per_rev)
+    ref_deltas, ref_delays = baseline_rot_motion(rot_x.tolist(), times_s.tolist(), steps_per_rev)
+    np.testing.assert_array_equal(deltas, ref_deltas)
+    np.testing.assert_array_equal(delays, ref_delays)
+
+
+@pytest.mark.parametrize("path", TAKES, ids=os.path.basename)
+@pytest.mark.parametrize("unwrap", [False, True])
+def test_streaming_matches_whole_take(path, unwrap):
+    times_s, lin_x, rot_x = blenderToArduino.load_take(path)
+    if unwrap:
+        rot_x = motionEngine.unwrap_degrees(rot_x)
+    whole = blenderToArduino.build_results(times_s, lin_x, rot_x, dofs=blenderToArduino.ALL_DOFS)
+    for chunk_rows in (2, 7, 64):
+        streamed = {dof: tuple(np.concatenate(parts) for parts in zip(
+                        *blenderToArduino.iter_axis_segments(path, dof, chunk_rows,
+                                                             unwrap_angles=unwrap)))
+                    for dof in whole}
+        for dof, (deltas, delays) in whole.items():
+            np.testing.assert_array_equal(streamed[dof][0], deltas)
+            np.testing.assert_array_equal(streamed[dof][1], delays)
+
+
+def test_unwrap_removes_seam_jumps():
+    deg = np.array([170.0, 179.0, -179.0, -170.0, 179.5, -179.5])
+    unwrapped = motionEngine.unwrap_degrees(deg)
+    assert np.abs(np.diff(unwrapped)).max() < 180
+    np.testing.assert_allclose(np.mod(unwrapped, 360), np.mod(deg, 360))
+
+
+def test_streaming_rejects_the_step_guard(tmp_path):
+    with pytest.raises(ValueError, match="step guard"):
+        blenderToArduino.convert_take(TAKES[0], str(tmp_path), chunk_rows=64, step_guard="fail")
+    with pytest.raises(SystemExit):
+        buddyConvert.main([TAKES[0], "-o", str(tmp_path), "--no-cache", "--chunk-rows", "64",
+                           "--guard", "fail"])
+    streamed = blenderToArduino.convert_take(TAKES[0], str(tmp_path / "streamed"), chunk_rows=64,
+                                             step_guard=None)
+    whole = blenderToArduino.convert_take(TAKES[0], str(tmp_path / "whole"), step_guard=None)
+    with open(streamed) as a, open(whole) as b:
+        assert a.read() == b.read()
+
+
+def test_rot_motion_is_quiet(capsys):
+    rotMotion([10.0, 10.0, 10.0], [0.0, 0.1, 0.2])
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+run_sweep's worker pool against evaluate run serially on the same takes,
+and the command line's parameter checks.
+"""
+
+import os
+
+import pytest
+
+from buddy import parameterSweep
+
+MOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "motion")
+SMALL_TAKES = [os.path.join(MOTION_DIR, name)
+               for name in ("motion_data_speed3.csv", "tilt_x-axis_test6.csv")]
+
+
+def serial_rows(combos, govern, monkeypatch):
+    shm, layout = parameterSweep.pack_takes(SMALL_TAKES)
+    monkeypatch.setattr(parameterSweep, "_shm", None)
+    monkeypatch.setattr(parameterSweep, "_takes", None)
+    try:
+        parameterSweep._attach(shm.name, layout)
+        return [parameterSweep.evaluate(combo, govern) for combo in combos]
+    finally:
+        parameterSweep._takes = None        # drop the views before unmapping
+        parameterSweep._shm.close()
+        shm.close()
+        shm.unlink()
+
+
+@pytest.mark.parametrize("govern", [False, True])
+def test_workers_match_serial_evaluate(monkeypatch, govern):
+    ranges = dict(pulley_teeth=[20, 36], belt_pitch_mm=[2.0], motor_steps=[200],
+                  microsteps=[4, 16])
+    if govern:
+        ranges["arm_radius_in"] = [1.5, 3.0]
+    combos = parameterSweep.combinations(**ranges)
+    rows = parameterSweep.run_sweep(SMALL_TAKES, combos, govern, workers=2)
+    assert rows == serial_rows(combos, govern, monkeypatch)
+    assert [{name: row[name] for name in combo} for row, combo in zip(rows, combos)] == combos
+
+
+def test_arm_radius_needs_govern(capsys):
+    with pytest.raises(SystemExit):
+        parameterSweep.main([*SMALL_TAKES, "--arm-radius-in", "1.5,3"])
+    assert "--govern" in capsys.readouterr().err
+
+
+def test_combinations_order():
+    combos = parameterSweep.combinations(microsteps=[4, 8], pulley_teeth=[20, 36])
+    assert combos == [{"pulley_teeth": 20, "microsteps": 4}, {"pulley_teeth": 20, "microsteps": 8},
+                      {"pulley_teeth": 36, "microsteps": 4}, {"pulley_teeth": 36, "microsteps": 8}]
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+The vectorized playback models against a pass-by-pass simulation of the
+sketches' loops, on small random profiles.
+"""
+
+import numpy as np
+import pytest
+
+from buddy import playbackEmulator
+from buddy.playbackEmulator import CPU_HZ, DELAY_MASK
+
+# (loop_us, step_us, resolution_us): the defaults, free pulses, fractional
+# costs (phases off the micros() grid) and a coarse micros()
+POLLING_SETTINGS = [
+    (playbackEmulator.LOOP_US, playbackEmulator.STEP_US, playbackEmulator.RESOLUTION_US),
+    (10.0, 0.0, 4.0),
+    (3.0625, 1.5, 4.0),
+    (7.0, 9.0, 8.0),
+    (1.0, 0.25, 1.0),
+]
+# (step_overhead_us, segment_us)
+BLOCKING_SETTINGS = [
+    (playbackEmulator.STEP_OVERHEAD_US, playbackEmulator.SEGMENT_US),
+    (0.0, 0.0),
+    (3.5, 12.0),
+]
+
+
+# === BASELINE (the sketches' loops, one pass / one step at a time) ===
+def polling_loop(deltas, delays, loop_us, step_us, resolution_us, cpu_hz=CPU_HZ):
+    """dual_motor.ino's loop() for one axis, timed in CPU cycles."""
+    cycles = lambda us: int(round(us * cpu_hz / 1e6))
+    L, s, r = cycles(loop_us), cycles(step_us), cycles(resolution_us)
+    delays = [cycles(d & DELAY_MASK) for d in delays]
+    pulses, ends = [], []
+    t = 0
+    last_reading = 0
+    seg, left = 0, abs(deltas[0])          # setup() primes segment 0
+    while True:
+        if left == 0:                       # this pass loads the next segment
+            ends.append(pulses[-1] if pulses else 0)
+            seg += 1
+            if seg == len(deltas):
+                break
+            left = abs(deltas[seg])
+            t += L
+            continue
+        reading = t // r * r                # micros() at the start of the pass
+        if reading - last_reading >= delays[seg]:
+            pulses.append(t)
+            last_reading = reading
+            left -= 1
+            t += L + s
+        else:
+            t += L
+    scale = 1e6 / cpu_hz
+    return np.array(pulses) * scale, np.array(ends) * scale
+
+
+def blocking_loop(deltas, delays, step_overhead_us, segment_us):
+    """motion_smoothing.ino / tilt1.ino: delayMicroseconds(delay / 2) twice per step."""
+    pulses, ends = [], []
+    t = 0.0
+    for delta, delay in zip(deltas, delays):
+        t += segment_us
+        for _ in range(abs(delta)):
+            pulses.append(t)
+            t += 2 * ((delay & DELAY_MASK) // 2) + step_overhead_us
+        ends.append(t)
+    return np.array(pulses), np.array(ends)
+
+
+def random_profile(rng):
+    """A few segments with zero, tiny, ordinary and wrapping (> 65535 μs) delays."""
+    n = int(rng.integers(1, 12))
+    deltas = rng.integers(-3, 4, n)
+    delays = rng.choice([0, 1, 3, 4, 5, 17, 250, 1003, 65536 + 40], n)
+    delays[deltas == 0] = 0
+    return deltas.tolist(), delays.tolist()
+
+
+# === TESTS ===
+@pytest.mark.parametrize("settings", POLLING_SETTINGS, ids=str)
+def test_polling_matches_loop(settings):
+    rng = np.random.default_rng(16)
+    for _ in range(300):
+        deltas, delays = random_profile(rng)
+        steps, ends = playbackEmulator.polling_step_times(deltas, delays, *settings)
+        ref_steps, ref_ends = polling_loop(deltas, delays, *settings)
+        np.testing.assert_allclose(steps, ref_steps, rtol=0, atol=1e-6,
+                                   err_msg=f"{deltas} {delays}")
+        np.testing.assert_allclose(ends, ref_ends, rtol=0, atol=1e-6,
+                                   err_msg=f"{deltas} {delays}")
+
+
+@pytest.mark.parametrize("settings", BLOCKING_SETTINGS, ids=str)
+def test_blocking_matches_loop(settings):
+    rng = np.random.default_rng(16)
+    for _ in range(300):
+        deltas, delays = random_profile(rng)
+        steps, ends = playbackEmulator.blocking_step_times(deltas, delays, *settings)
+        ref_steps, ref_ends = blocking_loop(deltas, delays, *settings)
+        np.testing.assert_allclose(steps, ref_steps, rtol=0, atol=1e-6,
+                                   err_msg=f"{deltas} {delays}")
+        np.testing.assert_allclose(ends, ref_ends, rtol=0, atol=1e-6,
+                                   err_msg=f"{deltas} {delays}")
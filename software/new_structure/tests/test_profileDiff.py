@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+The golden-set gate on the committed data/golden, and diff_axis on small
+profiles with known answers.
+"""
+
+import os
+
+import numpy as np
+
+from buddy import buddyConvert, profileDiff
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data")
+
+
+def test_default_conversion_matches_golden_set(tmp_path, capsys):
+    assert buddyConvert.main([os.path.join(DATA_DIR, "motion"), "-o", str(tmp_path),
+                              "--no-cache", "-j", "1"]) == 0
+    result = profileDiff.gate(os.path.join(DATA_DIR, "golden"), str(tmp_path), budget_s=10)
+    assert result["checked"] == 20
+    assert result["failed"] == {} and result["missing"] == [] and result["extra"] == []
+    assert not result["over_budget"]
+
+
+def test_legacy_axis_names(tmp_path):
+    path = tmp_path / "legacy.txt"
+    path.write_text("const int dataLength = 2;\n"
+                    "int deltaStepsLin[dataLength] = {\n  1, -2\n};\n"
+                    "unsigned int delayTimesLin[dataLength] = {\n  10, 5\n};\n"
+                    "int deltaStepsRot[dataLength] = {\n  0, 3\n};\n"
+                    "unsigned int delayTimesRot[dataLength] = {\n  0, 7\n};\n")
+    assert list(profileDiff.load_profile(str(path))) == ["linX", "rotX"]
+
+
+def test_identical_axes():
+    report = profileDiff.diff_axis(([1, 0, -2], [10, 5, 3]), ([1, 0, -2], [10, 5, 3]))
+    assert report["first_segment"] is None and report["position_steps"] == 0
+
+
+def test_shifted_step():
+    # the second profile takes its first step 5 us later, then catches up
+    report = profileDiff.diff_axis(([2, 0], [10, 20]), ([1, 1, 0], [15, 5, 20]))
+    assert report["first_segment"] == 0
+    assert report["step_count_diff"] == 0 and report["final_steps"] == 0
+    assert report["position_steps"] == 1
+    assert report["timing_us"] == 5.0
+    assert np.isclose(report["rate_sps"], 1e6 / 5 - 1e6 / 10)     # its second step at 5 us
+
+
+def test_missing_steps_fail_the_tolerances():
+    reports = {"linX": profileDiff.diff_axis(([3], [10]), ([2], [10])), "rotX": None}
+    reasons = profileDiff.failures(reports)
+    assert any("+1 steps" in r for r in reasons)
+    assert any("rotX: axis missing" in r for r in reasons)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Round trips of the .txt and .bdyp profile forms on every take in data/motion.
+"""
+
+import numpy as np
+import pytest
+
+from buddy import blenderToArduino
+from buddy.profileFormat import (convert, read_profile, read_profile_binary, read_profile_text,
+                                 write_profile_binary)
+
+
+def assert_same_profile(actual, expected):
+    assert list(actual) == list(expected)
+    for name, (deltas, delays) in expected.items():
+        np.testing.assert_array_equal(actual[name][0], deltas)
+        np.testing.assert_array_equal(actual[name][1], delays)
+
+
+def test_text_round_trip(take, tmp_path):
+    _, results = take
+    path = str(tmp_path / "take.txt")
+    blenderToArduino.write_profile(path, results)
+    assert_same_profile(read_profile_text(path), results)
+
+
+def test_binary_round_trip(take, tmp_path):
+    _, results = take
+    path = str(tmp_path / "take.bdyp")
+    write_profile_binary(path, results)
+    assert_same_profile(read_profile_binary(path), results)
+    assert_same_profile(read_profile(path), results)
+
+
+def test_binary_wide_delays(tmp_path):
+    results = {"linX": ([3, 0, -2], [70000, 0, 12]), "rotX": ([0, 1, 1], [0, 0xFFFFFFFF, 5])}
+    path = str(tmp_path / "wide.bdyp")
+    write_profile_binary(path, results)
+    assert_same_profile(read_profile_binary(path), results)
+
+
+def test_binary_rejects_out_of_range(tmp_path):
+    with pytest.raises(ValueError):
+        write_profile_binary(str(tmp_path / "bad.bdyp"), {"linX": ([40000], [1])})
+    with pytest.raises(ValueError):
+        write_profile_binary(str(tmp_path / "bad.bdyp"), {"linX": ([1, 2], [1]), "rotX": ([1], [1])})
+
+
+def test_convert_txt_bdyp_txt_is_byte_identical(take, tmp_path):
+    _, results = take
+    txt, bdyp, back = (str(tmp_path / name) for name in ("a.txt", "a.bdyp", "b.txt"))
+    blenderToArduino.write_profile(txt, results)
+    convert(txt, bdyp)
+    convert(bdyp, back)
+    with open(txt, "rb") as a, open(back, "rb") as b:
+        assert a.read() == b.read()
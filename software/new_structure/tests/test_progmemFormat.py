@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Run-length encoded PROGMEM profiles: decode round trips and dwell timing.
+"""
+
+import numpy as np
+import pytest
+
+from buddy import progmemFormat
+from buddy.profileFormat import read_profile
+
+
+def assert_same_profile(actual, expected):
+    assert list(actual) == list(expected)
+    for name, (deltas, delays) in expected.items():
+        np.testing.assert_array_equal(actual[name][0], deltas)
+        np.testing.assert_array_equal(actual[name][1], delays)
+
+
+def test_rle_round_trip(take):
+    _, results = take
+    for deltas, delays in results.values():
+        records = progmemFormat.encode_rle(deltas, delays)
+        assert len(records) <= len(deltas)
+        decoded = progmemFormat.decode_rle(records)
+        np.testing.assert_array_equal(decoded[0], deltas)
+        np.testing.assert_array_equal(decoded[1], delays)
+
+
+def test_rle_dwell_records_keep_the_timeline(take):
+    times_s, results = take
+    segment_us = np.diff(times_s) * 1e6
+    for deltas, delays in results.values():
+        records = progmemFormat.encode_rle(deltas, delays, segment_us)
+        dwell = records["delta"] == 0
+        assert (records["delay"][dwell] <= progmemFormat.DWELL_DELAY_MAX).all()
+        # moving segments come back unchanged, in order
+        decoded_deltas, decoded_delays = progmemFormat.decode_rle(records[~dwell])
+        moving = np.asarray(deltas) != 0
+        np.testing.assert_array_equal(decoded_deltas, np.asarray(deltas)[moving])
+        np.testing.assert_array_equal(decoded_delays, np.asarray(delays)[moving])
+        # dwell records add up to the dwell time, up to rounding per record
+        dwell_us = (records["count"][dwell].astype(np.int64) * records["delay"][dwell]).sum()
+        expected = segment_us[~moving].sum()
+        assert abs(dwell_us - expected) <= 0.5 * records["count"][dwell].sum() + 1e-6
+
+
+def test_progmem_round_trip(take, tmp_path):
+    _, results = take
+    path = str(tmp_path / "take.h")
+    report = progmemFormat.write_profile_progmem(path, results)
+    assert progmemFormat.is_progmem_profile(path)
+    assert_same_profile(progmemFormat.read_profile_progmem(path), results)
+    assert_same_profile(read_profile(path), results)
+    stats = progmemFormat.read_stats(path)
+    assert stats["flash"] == report["flash"] and stats["records"] == report["records"]
+
+
+def test_rle_rejects_wide_deltas():
+    with pytest.raises(ValueError):
+        progmemFormat.encode_rle([1, -40000], [10, 10])
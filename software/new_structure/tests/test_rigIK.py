@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+camera_to_joints on synthetic pan / tilt poses (the rig's joint order) and
+on the RotX sweeps of data/motion.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from buddy import rigIK
+
+MOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "motion")
+
+
+def poses(rot_x, rot_z=0.0):
+    """Camera poses on the rail origin with the given RotX / RotZ (RotY = 0)."""
+    rot_x = np.atleast_1d(np.asarray(rot_x, dtype=np.float64))
+    rotation = np.column_stack((rot_x, np.zeros_like(rot_x), np.broadcast_to(rot_z, rot_x.shape)))
+    return np.zeros_like(rotation), rotation
+
+
+def test_level_camera():
+    position, rotation = poses([90.0, 90.0], rot_z=30.0)
+    joints = rigIK.camera_to_joints(position, rotation, arm_radius_in=0.0, slide_zero_m=0.0)
+    np.testing.assert_allclose(joints["tilt_deg"], 0.0, atol=1e-9)
+    np.testing.assert_allclose(joints["pan_deg"], 0.0, atol=1e-9)   # first frame is centred
+    assert joints["reachable"].all()
+    joints = rigIK.camera_to_joints(position, rotation, arm_radius_in=0.0, slide_zero_m=0.0,
+                                    pan_zero_deg=0.0)
+    np.testing.assert_allclose(joints["pan_deg"], 30.0)
+
+
+def test_pan_then_tilt_round_trip():
+    # a smooth take, as unwrapping assumes
+    pan = np.linspace(-170.0, 170.0, 200)
+    tilt = 85.0 * np.sin(np.linspace(0.0, 6.0 * np.pi, 200))
+    # Rz(pan) · Rx(tilt) · Rx(90°) is the XYZ Euler (90 + tilt, 0, pan)
+    position, rotation = poses(90.0 + tilt, rot_z=pan)
+    joints = rigIK.camera_to_joints(position, rotation, pan_zero_deg=0.0)
+    np.testing.assert_allclose(joints["tilt_deg"], tilt, atol=1e-9)
+    np.testing.assert_allclose(joints["pan_deg"], pan, atol=1e-9)
+    np.testing.assert_allclose(joints["roll_deg"], 0.0, atol=1e-9)
+
+
+def test_rot_x_sweep_past_vertical():
+    # RotX 60..250 as Blender exports it (wrapped at ±180): tilt -30..160, no pan
+    rot_x = np.linspace(60.0, 250.0, 96)
+    position, rotation = poses((rot_x + 180.0) % 360.0 - 180.0)
+    joints = rigIK.camera_to_joints(position, rotation, arm_radius_in=0.0, slide_zero_m=0.0)
+    np.testing.assert_allclose(joints["tilt_deg"], rot_x - 90.0, atol=1e-9)
+    np.testing.assert_allclose(joints["pan_deg"], 0.0, atol=1e-9)
+    assert not (joints["flags"] & rigIK.PAN_RANGE).any()
+    tilt = rot_x - 90.0
+    np.testing.assert_array_equal(joints["flags"] & rigIK.TILT_RANGE != 0,
+                                  (tilt < rigIK.LIMITS["tilt_min_deg"])
+                                  | (tilt > rigIK.LIMITS["tilt_max_deg"]))
+
+
+def test_tilt_take_past_vertical():
+    _, position, rotation = rigIK.load_camera_take(os.path.join(MOTION_DIR,
+                                                                "tilt_x-axis_test1.csv"))
+    joints = rigIK.camera_to_joints(position, rotation)
+    # a pure RotX take: the tilt is RotX - 90°, followed past ±180° (frames at
+    # RotX ≈ -94.5° are 175.5° of tilt, not 4.5° of tilt with the pan at 180°)
+    rot_x = np.degrees(np.unwrap(np.radians(rotation[:, 0])))
+    assert rot_x.max() > 180.0
+    np.testing.assert_allclose(joints["tilt_deg"], rot_x - 90.0, atol=1e-9)
+    np.testing.assert_allclose(joints["pan_deg"], 0.0, atol=1e-9)
+    assert (joints["flags"] & rigIK.TILT_RANGE).any()
+    assert not (joints["flags"] & rigIK.PAN_RANGE).any()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+plan_scurve: waypoints kept, limits met after retiming (checked on a dense
+resampling of the result), the uniform slow-down fallback, and the
+(delta_steps, delay_times_us) profiles built from a planned take.
+"""
+
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from buddy import blenderToArduino, scurvePlanner
+from buddy.profileFormat import read_profile
+
+LIMITS = (np.array([0.15, 180.0]), np.array([1.0, 1500.0]), np.array([20.0, 20000.0]))
+SLACK = 1.05      # finite differences and the sampled peaks of segment_peaks
+
+MOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "motion")
+TAKES = sorted(glob.glob(os.path.join(MOTION_DIR, "*.csv")))
+
+
+def waypoint_take(n=120, fps=24):
+    times = np.arange(n) / fps
+    positions = np.column_stack((0.2 * np.sin(times / 3) + 0.05 * np.sin(times * 1.7),
+                                 30 * np.sin(times / 2) + 10 * np.sin(times * 2.3)))
+    return times, positions
+
+
+def dense_peaks(t, x):
+    """Peak |velocity|, |acceleration|, |jerk| per axis by finite differences."""
+    v = np.diff(x, axis=0) / np.diff(t)[:, None]
+    tv = (t[1:] + t[:-1]) / 2
+    a = np.diff(v, axis=0) / np.diff(tv)[:, None]
+    ta = (tv[1:] + tv[:-1]) / 2
+    j = np.diff(a, axis=0) / np.diff(ta)[:, None]
+    return [np.abs(d).max(axis=0) for d in (v, a, j)]
+
+
+def assert_within_limits(t, x, limits=LIMITS):
+    for peak, limit in zip(dense_peaks(t, x), limits):
+        assert (peak <= limit * SLACK).all(), (peak, limit)
+
+
+def test_passes_through_the_waypoints():
+    times, positions = waypoint_take()
+    for substeps in (1, 4, 7):
+        t_out, planned, _ = scurvePlanner.plan_scurve(times, positions, *LIMITS, substeps)
+        assert len(t_out) == len(planned) == (len(times) - 1) * substeps + 1
+        np.testing.assert_allclose(planned[::substeps], positions, atol=1e-12)
+        assert (np.diff(t_out) > 0).all()
+
+
+def test_one_d_positions():
+    times, positions = waypoint_take()
+    t_out, planned, _ = scurvePlanner.plan_scurve(times, positions[:, 1], 180.0, 1500.0, 2e4)
+    assert planned.ndim == 1
+    np.testing.assert_allclose(planned[::4], positions[:, 1], atol=1e-12)
+
+
+def test_limits_hold_after_retiming():
+    times, positions = waypoint_take()
+    # the raw take breaks the limits; the planner has to stretch it
+    t_out, planned, info = scurvePlanner.plan_scurve(times, positions, *LIMITS, substeps=64)
+    assert info["stretch"] > 1.0 and info["limit_ratio"] <= 1 + scurvePlanner.TOLERANCE
+    assert_within_limits(t_out, planned)
+
+
+def test_uniform_stretch_fallback():
+    times, positions = waypoint_take()
+    _, _, raw = scurvePlanner.plan_scurve(times, positions, *(lim * 1e6 for lim in LIMITS))
+    assert raw["stretch"] == 1.0
+    # one pass leaves no room for local stretching: the whole take slows down uniformly
+    t_out, planned, info = scurvePlanner.plan_scurve(times, positions, *LIMITS, substeps=64,
+                                                     max_iterations=1)
+    assert info["iterations"] == 1 and info["limit_ratio"] == 1.0 and info["stretch"] > 1.0
+    np.testing.assert_allclose(np.diff(t_out[::64]), np.diff(times) * info["stretch"])
+    np.testing.assert_allclose(planned[::64], positions, atol=1e-12)
+    assert_within_limits(t_out, planned)
+
+
+@pytest.mark.parametrize("path", TAKES, ids=os.path.basename)
+def test_planned_take_keeps_the_profile_shape(tmp_path, path):
+    times_s, lin_x, rot_x = blenderToArduino.load_take(path)
+    (t_out, lin_out, rot_out), _ = blenderToArduino.plan_take(times_s, lin_x, rot_x)
+    results = blenderToArduino.build_results(t_out, lin_out, rot_out,
+                                             dofs=blenderToArduino.ALL_DOFS)
+    for deltas, delays in results.values():
+        assert len(deltas) == len(delays) == (len(times_s) - 1) * blenderToArduino.scurve_substeps
+        assert np.issubdtype(np.asarray(deltas).dtype, np.integer)
+        assert (np.asarray(delays) >= 0).all()
+        assert (np.asarray(delays)[np.asarray(deltas) == 0] == 0).all()
+    out = tmp_path / "planned.txt"
+    blenderToArduino.write_profile(str(out), results)
+    for dof, (deltas, delays) in read_profile(str(out)).items():
+        np.testing.assert_array_equal(deltas, results[dof][0])
+        np.testing.assert_array_equal(delays, results[dof][1])
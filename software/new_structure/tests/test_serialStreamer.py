@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+The credit-based streamer against LoopbackController over a pty, and the
+chunk size limits of the 'D' frame.
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from buddy import blenderToArduino, serialStreamer
+
+MOTION_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "motion")
+
+
+@pytest.fixture(scope="module")
+def results():
+    times_s, lin_x, rot_x = blenderToArduino.load_take(os.path.join(MOTION_DIR, "tilt_test7.csv"))
+    return blenderToArduino.build_results(times_s, lin_x, rot_x, dofs=blenderToArduino.ALL_DOFS)
+
+
+def test_loopback_delivers_every_segment_in_order(results):
+    # 13 s take at 13x: the controller drains ~1 s of real time
+    report = asyncio.run(serialStreamer.loopback(results, chunk_segments=8, speed=13.0))
+    data, n = serialStreamer.pack_segments(results)
+    assert report["segments"] == n
+    assert report["underruns"] == 0
+    assert report["min_lead"] >= serialStreamer.DEFAULT_MIN_LEAD
+    seqs = [seq for seq, _ in report["received"]]
+    assert seqs == list(range(report["chunks"]))
+    assert b"".join(payload for _, payload in report["received"]) == data
+
+
+@pytest.mark.parametrize("n_axes, limit", [(1, 10922), (2, 5461)])
+def test_chunk_segments_limit(n_axes, limit):
+    assert serialStreamer.max_chunk_segments(n_axes) == limit
+    payload = limit * n_axes * serialStreamer.SEGMENT_AXIS_BYTES
+    assert payload <= 0xFFFF < payload + n_axes * serialStreamer.SEGMENT_AXIS_BYTES
+
+
+@pytest.mark.parametrize("chunk_segments", [0, 5462, 70000])
+def test_oversized_chunks_are_rejected(results, chunk_segments):
+    with pytest.raises(ValueError, match="chunk_segments"):
+        asyncio.run(serialStreamer.loopback(results, chunk_segments=chunk_segments, speed=None))
+
+
+def test_cli_rejects_oversized_chunks(tmp_path, results):
+    profile = tmp_path / "take.txt"
+    blenderToArduino.write_profile(str(profile), results)
+    with pytest.raises(SystemExit):
+        serialStreamer.main([str(profile), "--loopback", "--chunk-segments", "6000"])
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+The merged step schedule replays every step of every axis, on its tick and with its DIR.
+"""
+
+import numpy as np
+import pytest
+
+from buddy import stepSchedule
+
+
+@pytest.mark.parametrize("timeline", [False, True], ids=["chained", "timeline"])
+@pytest.mark.parametrize("tick_us", [0.5, 4.0])
+def test_schedule_replays_every_step(take, timeline, tick_us):
+    times_s, results = take
+    start_us = (times_s[:-1] - times_s[0]) * 1e6 if timeline else None
+    events, stats = stepSchedule.build_schedule(results, start_us, tick_us)
+    waits = events["wait"].astype(np.int64)
+    event_tick = np.cumsum(waits)
+    assert (waits[1:] >= 1).all()
+    assert (waits[events["step"] == 0][1:] == stepSchedule.WAIT_MAX).all()
+    assert stats["events"] == len(events)
+
+    for axis, (name, (deltas, delays)) in enumerate(results.items()):
+        step_us, forward = stepSchedule.axis_step_times(deltas, delays, start_us)
+        mine = ((events["step"] >> axis) & 1) == 1
+        assert mine.sum() == np.abs(deltas).sum() == stats["steps"][name]
+        # one pulse per tick at most, each within the reported error of its time
+        ticks = event_tick[mine]
+        assert (np.diff(ticks) >= 1).all()
+        assert np.abs(ticks * tick_us - step_us).max(initial=0) <= stats["max_error_us"] + 1e-9
+        # DIR is set for every step before it is pulsed
+        np.testing.assert_array_equal((events["dir"][mine] >> axis) & 1, forward)
+
+
+def test_schedule_header(take, tmp_path):
+    _, results = take
+    path = str(tmp_path / "take_events.h")
+    stats = stepSchedule.write_schedule(path, results, tick_us=4.0)
+    assert stepSchedule.read_stats(path)["events"] == stats["events"]
+    with open(path) as f:
+        text = f.read()
+    assert "#define SCHEDULE_TICK_US 4UL\n" in text
+    assert "#define SCHEDULE_BIT_linX 0\n" in text and "#define SCHEDULE_BIT_rotX 1\n" in text
+
+
+def test_schedule_one_axis_header(take, tmp_path):
+    _, results = take
+    path = str(tmp_path / "take_events.h")
+    stepSchedule.write_schedule(path, {"rotX": results["rotX"]})
+    with open(path) as f:
+        text = f.read()
+    assert "#define SCHEDULE_AXES 1\n" in text and "#define SCHEDULE_BIT_rotX 0\n" in text
+    assert "SCHEDULE_BIT_linX" not in text
+
+
+@pytest.mark.parametrize("tick_us", [0.5, 2.5, 0.0])
+def test_schedule_rejects_fractional_ticks(tmp_path, tick_us):
+    with pytest.raises(ValueError, match="whole number"):
+        stepSchedule.write_schedule(str(tmp_path / "x_events.h"), {"linX": ([1], [10])},
+                                    tick_us=tick_us)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Timer-tick records: invariants on the recorded takes and on stretched / split segments.
+"""
+
+import numpy as np
+import pytest
+
+from buddy import tickProfile
+
+
+def assert_tick_invariants(deltas, steps, delays, stats, delay_max=0xFFFF):
+    deltas = np.asarray(deltas, np.int64)
+    assert (delays >= 1).all() and (delays <= delay_max).all()
+    assert (np.abs(steps) <= tickProfile.STEPS_MAX).all()
+    assert np.abs(steps).sum() == np.abs(deltas).sum() == stats["steps"]
+    assert steps.sum() == deltas.sum()
+    # records play the steps in the same directions, one step per tick at most
+    directions = np.repeat(np.sign(steps[steps != 0]), np.abs(steps[steps != 0]))
+    np.testing.assert_array_equal(directions, np.repeat(np.sign(deltas), np.abs(deltas)))
+    assert (np.diff(tickProfile.step_ticks(steps, delays)) >= 1).all()
+    assert (np.maximum(np.abs(steps), 1) * delays).sum() == stats["ticks"]
+
+
+@pytest.mark.parametrize("tick_us", [0.5, 4.0, 64.0])
+def test_tick_quantization_invariants(take, tick_us):
+    times_s, results = take
+    segment_us = np.diff(times_s) * 1e6
+    for deltas, _ in results.values():
+        steps, delays, stats = tickProfile.quantize_axis(deltas, segment_us, tick_us)
+        assert_tick_invariants(deltas, steps, delays, stats)
+        if stats["stretched"] == 0:
+            assert stats["max_error_us"] <= tick_us / 2 + 1e-6
+
+
+def test_tick_split_of_long_records():
+    deltas = np.array([0, 40000, 3, -2, 0])
+    segment_us = np.array([1e6, 4e5, 2e6, 8.0, 5e5])
+    steps, delays, stats = tickProfile.quantize_axis(deltas, segment_us, 4.0)
+    assert_tick_invariants(deltas, steps, delays, stats)
+    steps, delays, stats = tickProfile.quantize_axis(deltas, segment_us, 4.0, delay_max=0xFFFFFFFF)
+    assert_tick_invariants(deltas, steps, delays, stats, 0xFFFFFFFF)
+
+
+@pytest.mark.parametrize("deltas, segment_us", [
+    ([10], [20.0]),                        # more steps than ticks from the first segment on
+    ([-10, 4], [20.0, 400.0]),
+    ([0, 25, 0, 3], [4.0, 20.0, 8.0, 8.0]),
+])
+def test_tick_stretched_leading_segments(deltas, segment_us):
+    steps, delays, stats = tickProfile.quantize_axis(deltas, segment_us, 4.0)
+    assert_tick_invariants(deltas, steps, delays, stats)
+    assert stats["stretched"] >= 1
+    assert (np.maximum(np.abs(steps), 1) * delays).sum() >= np.abs(deltas).sum()
+
+
+def test_tick_profile_round_trip(take, tmp_path):
+    times_s, results = take
+    segment_us = np.diff(times_s) * 1e6
+    path = str(tmp_path / "take_ticks.h")
+    stats = tickProfile.write_tick_profile(path, results, segment_us, 4.0)
+    assert tickProfile.is_tick_profile(path)
+    assert tickProfile.read_stats(path)["tick_us"] == 4.0
+    tables = tickProfile.read_tick_profile(path)
+    assert list(tables) == list(results)
+    for name, (deltas, _) in results.items():
+        steps, delays, _ = tickProfile.quantize_axis(deltas, segment_us, 4.0)
+        np.testing.assert_array_equal(tables[name][0], steps)
+        np.testing.assert_array_equal(tables[name][1], delays)
+        assert_tick_invariants(deltas, *tables[name], stats[name])
+
+
+def test_tick_profile_names_its_tables(take, tmp_path):
+    times_s, results = take
+    path = str(tmp_path / "take_ticks.h")
+    tickProfile.write_tick_profile(path, {"rotX": results["rotX"]}, np.diff(times_s) * 1e6)
+    with open(path) as f:
+        text = f.read()
+    assert "#define TICK_AXES 1\n" in text and "#define TICK_AXIS_rotX 0\n" in text
+    assert "TICK_AXIS_linX" not in text
@@ -36,30 +36,7 @@ filepath = "/Users/benjaminokoronkwo/BUDDY/data/motion/tilt_x-axis_test7.csv"
 
 # === OUTPUT FILE: Auto-generated .txt in /processed ===
 output_folder = "/Users/benjaminokoronkwo/BUDDY/data/processed"
-os.makedirs(output_folder, exist_ok=True)
-
-# Strip .csv extension and optional '_data' suffix
-base_filename = os.path.splitext(os.path.basename(filepath))[0]
-if base_filename.endswith('_data'):
-    base_filename = base_filename[:-5]
-
-output_path = os.path.join(output_folder, f"{base_filename}.txt")
-
-# === 1. LOAD CSV (TIME + X (trans and rot)) ===
-times_s: list[float] = []
-lin_x: list[float] = []
-rot_x: list[float] = []
-
-with open(filepath, "r") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        times_s.append(float(row["Time (s)"]))
-        lin_x.append(float(row["X (m)"]))
-        rot_x.append(float(row["RotX (deg)"]))
-        
-#error check
-if len(times_s) < 2:
-    raise ValueError("CSV does not contain enough rows of data.")
+
 
 # === 2. SINE EASING IN METRES ===
 def sine_ease(data,threshold):
@@ -72,16 +49,6 @@ def sine_ease(data,threshold):
         eased = [data_start +(data_end - data_start) * e for e in ease]
     return eased
 
-eased_lin_x = sine_ease(lin_x,1e-4)      #linear
-eased_rot_x = sine_ease(rot_x, 0.01) #rotational
-        
-# Build uniform timeline
-t_uniform = np.arange(times_s[0], times_s[-1] + dt, dt)   # +dt to hit the final time exactly
-
-# Interpolate eased positions onto that grid
-eased_lin_uniform = np.interp(t_uniform, times_s, eased_lin_x)
-eased_rot_uniform = np.interp(t_uniform, times_s, eased_rot_x)
-
 
 # === 3. CONVERT METRES → STEPS ===
 def m_to_steps(x_m: float, steps_rev: int = steps_per_rev, circ: float = circumference) -> int:
@@ -91,8 +58,6 @@ def m_to_steps(x_m: float, steps_rev: int = steps_per_rev, circ: float = circumf
 def deg_to_steps(deg, steps_per_rev=1600):
     return int((deg / 360.0) * steps_per_rev)
 
-lin_steps = [m_to_steps(x) for x in eased_lin_uniform]
-rot_steps = [deg_to_steps(rx, steps_per_rev) for rx in eased_rot_uniform]
 
 # === 4. DELTA STEPS + PER‑STEP DELAYS (μs) ===
 def deltaSteps(steps, time_array):
@@ -109,21 +74,6 @@ def deltaSteps(steps, time_array):
         delay_times_us.append(delay_us)
     return delta_steps, delay_times_us
 
-# call it with the uniform timeline
-lin_delta_steps, lin_delay_times_us = deltaSteps(lin_steps, t_uniform)
-rot_delta_steps, rot_delay_times_us = deltaSteps(rot_steps, t_uniform)
-
-# === 5. EXPORT ARDUINO ARRAYS ===
-with open(output_path, "w") as f:
-    f.write(f"const int dataLength = {len(lin_delta_steps)};\n")
-    f.write("int deltaStepsLin[dataLength] = {\n  " + ", ".join(map(str, lin_delta_steps)) + "\n};\n")
-    f.write("unsigned int delayTimesLin[dataLength] = {\n  " + ", ".join(map(str, lin_delay_times_us)) + "\n};\n")
-    f.write("int deltaStepsRot[dataLength] = {\n  " + ", ".join(map(str, rot_delta_steps)) + "\n};\n")
-    f.write("unsigned int delayTimesRot[dataLength] = {\n  " + ", ".join(map(str, rot_delay_times_us)) + "\n};\n")
-
-print(f"Export complete → {output_path}")
-print(f"Linear Δsteps range: {min(lin_delta_steps)} … {max(lin_delta_steps)}")
-print(f"Rotational Δsteps range: {min(rot_delta_steps)} … {max(rot_delta_steps)}")
 
 #visualizer (for testing)
 """
@@ -136,51 +86,116 @@ print(f"Rotational Δsteps range: {min(rot_delta_steps)} … {max(rot_delta_step
 """
 
 # --- diagnostics.py ---------------------------------------------------------
-import numpy as np
-import matplotlib.pyplot as plt
-
-# ---- 1.  PREP: choose the timeline you actually used -----------------------
-# (A) If your CSV times are uniform after resampling:
-t = t_uniform
-dt = np.diff(t).mean()
-
-# (B) If you still have uneven frame spacing, velocity/accel won’t be perfect,
-#     but the plots still reveal large step jumps.
-
-# ---- 2.  Convert motor steps back to physical units (optional) -------------
-mm_per_step = circumference * 1000 / steps_per_rev   # ≈ 0.045 mm
-lin_pos_mm  = np.array(lin_steps) * mm_per_step
-rot_pos_deg = np.array(rot_steps) * 360 / steps_per_rev
-
-# ---- 3.  Derive velocity & acceleration ------------------------------------
-# central‑difference keeps vector lengths aligned with t[1:-1]
-lin_vel = np.gradient(lin_pos_mm,  dt)          # mm / s
-lin_acc = np.gradient(lin_vel,     dt)          # mm / s²
-rot_vel = np.gradient(rot_pos_deg, dt)          # deg / s
-rot_acc = np.gradient(rot_vel,     dt)          # deg / s²
-
-# ---- 4.  Plotting ----------------------------------------------------------
-fig, ax = plt.subplots(3, 1, figsize=(8, 9), sharex=True)
-
-# Position
-ax[0].plot(t, lin_pos_mm,  label="Linear (mm)")
-ax[0].plot(t, rot_pos_deg, label="Rotational (°)", ls="--")
-ax[0].set_ylabel("Position")
-ax[0].legend();  ax[0].grid(True)
-
-# Velocity
-ax[1].plot(t, lin_vel,     label="Linear velocity")
-ax[1].plot(t, rot_vel,     label="Rot velocity", ls="--")
-ax[1].set_ylabel("Velocity")
-ax[1].legend();  ax[1].grid(True)
-
-# Acceleration
-ax[2].plot(t, lin_acc,     label="Linear accel")
-ax[2].plot(t, rot_acc,     label="Rot accel", ls="--")
-ax[2].set_ylabel("Acceleration")
-ax[2].set_xlabel("Time (s)")
-ax[2].legend(); ax[2].grid(True)
-
-plt.tight_layout()
-plt.show()
-# ---------------------------------------------------------------------------
+def plot_diagnostics(t, lin_steps, rot_steps):
+    import matplotlib.pyplot as plt
+
+    # ---- 1.  PREP: choose the timeline you actually used -----------------------
+    # (A) If your CSV times are uniform after resampling:
+    dt = np.diff(t).mean()
+
+    # (B) If you still have uneven frame spacing, velocity/accel won’t be perfect,
+    #     but the plots still reveal large step jumps.
+
+    # ---- 2.  Convert motor steps back to physical units (optional) -------------
+    mm_per_step = circumference * 1000 / steps_per_rev   # ≈ 0.045 mm
+    lin_pos_mm  = np.array(lin_steps) * mm_per_step
+    rot_pos_deg = np.array(rot_steps) * 360 / steps_per_rev
+
+    # ---- 3.  Derive velocity & acceleration ------------------------------------
+    # central‑difference keeps vector lengths aligned with t[1:-1]
+    lin_vel = np.gradient(lin_pos_mm,  dt)          # mm / s
+    lin_acc = np.gradient(lin_vel,     dt)          # mm / s²
+    rot_vel = np.gradient(rot_pos_deg, dt)          # deg / s
+    rot_acc = np.gradient(rot_vel,     dt)          # deg / s²
+
+    # ---- 4.  Plotting ----------------------------------------------------------
+    fig, ax = plt.subplots(3, 1, figsize=(8, 9), sharex=True)
+
+    # Position
+    ax[0].plot(t, lin_pos_mm,  label="Linear (mm)")
+    ax[0].plot(t, rot_pos_deg, label="Rotational (°)", ls="--")
+    ax[0].set_ylabel("Position")
+    ax[0].legend();  ax[0].grid(True)
+
+    # Velocity
+    ax[1].plot(t, lin_vel,     label="Linear velocity")
+    ax[1].plot(t, rot_vel,     label="Rot velocity", ls="--")
+    ax[1].set_ylabel("Velocity")
+    ax[1].legend();  ax[1].grid(True)
+
+    # Acceleration
+    ax[2].plot(t, lin_acc,     label="Linear accel")
+    ax[2].plot(t, rot_acc,     label="Rot accel", ls="--")
+    ax[2].set_ylabel("Acceleration")
+    ax[2].set_xlabel("Time (s)")
+    ax[2].legend(); ax[2].grid(True)
+
+    plt.tight_layout()
+    plt.show()
+    # ---------------------------------------------------------------------------
+
+
+def main():
+    os.makedirs(output_folder, exist_ok=True)
+
+    # Strip .csv extension and optional '_data' suffix
+    base_filename = os.path.splitext(os.path.basename(filepath))[0]
+    if base_filename.endswith('_data'):
+        base_filename = base_filename[:-5]
+
+    output_path = os.path.join(output_folder, f"{base_filename}.txt")
+
+    # === 1. LOAD CSV (TIME + X (trans and rot)) ===
+    times_s: list[float] = []
+    lin_x: list[float] = []
+    rot_x: list[float] = []
+
+    with open(filepath, "r") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            times_s.append(float(row["Time (s)"]))
+            lin_x.append(float(row["X (m)"]))
+            rot_x.append(float(row["RotX (deg)"]))
+        
+    #error check
+    if len(times_s) < 2:
+        raise ValueError("CSV does not contain enough rows of data.")
+
+    # === 2. SINE EASING IN METRES ===
+    eased_lin_x = sine_ease(lin_x,1e-4)      #linear
+    eased_rot_x = sine_ease(rot_x, 0.01) #rotational
+        
+    # Build uniform timeline
+    t_uniform = np.arange(times_s[0], times_s[-1] + dt, dt)   # +dt to hit the final time exactly
+
+    # Interpolate eased positions onto that grid
+    eased_lin_uniform = np.interp(t_uniform, times_s, eased_lin_x)
+    eased_rot_uniform = np.interp(t_uniform, times_s, eased_rot_x)
+
+
+    # === 3. CONVERT METRES → STEPS ===
+    lin_steps = [m_to_steps(x) for x in eased_lin_uniform]
+    rot_steps = [deg_to_steps(rx, steps_per_rev) for rx in eased_rot_uniform]
+
+    # === 4. DELTA STEPS + PER‑STEP DELAYS (μs) ===
+    # call it with the uniform timeline
+    lin_delta_steps, lin_delay_times_us = deltaSteps(lin_steps, t_uniform)
+    rot_delta_steps, rot_delay_times_us = deltaSteps(rot_steps, t_uniform)
+
+    # === 5. EXPORT ARDUINO ARRAYS ===
+    with open(output_path, "w") as f:
+        f.write(f"const int dataLength = {len(lin_delta_steps)};\n")
+        f.write("int deltaStepsLin[dataLength] = {\n  " + ", ".join(map(str, lin_delta_steps)) + "\n};\n")
+        f.write("unsigned int delayTimesLin[dataLength] = {\n  " + ", ".join(map(str, lin_delay_times_us)) + "\n};\n")
+        f.write("int deltaStepsRot[dataLength] = {\n  " + ", ".join(map(str, rot_delta_steps)) + "\n};\n")
+        f.write("unsigned int delayTimesRot[dataLength] = {\n  " + ", ".join(map(str, rot_delay_times_us)) + "\n};\n")
+
+    print(f"Export complete → {output_path}")
+    print(f"Linear Δsteps range: {min(lin_delta_steps)} … {max(lin_delta_steps)}")
+    print(f"Rotational Δsteps range: {min(rot_delta_steps)} … {max(rot_delta_steps)}")
+
+    plot_diagnostics(t_uniform, lin_steps, rot_steps)
+
+
+if __name__ == "__main__":
+    main()